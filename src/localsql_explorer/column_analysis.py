@@ -11,7 +11,7 @@ This module provides detailed column information including:
 
 import logging
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
 import pandas as pd
 from pydantic import BaseModel, Field
@@ -137,13 +137,17 @@ class ColumnAnalyzer:
         """Initialize column analyzer."""
         pass
     
-    def analyze_table(self, df: pd.DataFrame, table_name: str) -> TableColumnAnalysis:
+    def analyze_table(self, df: pd.DataFrame, table_name: str,
+                      progress_callback: Optional[Callable[[ColumnMetadata, int, int], None]] = None
+                      ) -> TableColumnAnalysis:
         """
         Perform comprehensive analysis of a table's columns.
         
         Args:
             df: DataFrame to analyze
             table_name: Name of the table
+            progress_callback: Optional callback receiving each column's metadata
+                as it completes, with the number of columns done and in total
             
         Returns:
             TableColumnAnalysis: Complete analysis results
@@ -157,6 +161,9 @@ class ColumnAnalyzer:
             column_meta = self.analyze_column(df, column_name)
             columns.append(column_meta)
             total_quality_score += column_meta.quality_score
+            
+            if progress_callback:
+                progress_callback(column_meta, len(columns), len(df.columns))
         
         # Calculate overall quality score
         overall_quality = total_quality_score / len(columns) if columns else 0.0
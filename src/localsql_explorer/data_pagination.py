@@ -10,7 +10,9 @@ This module provides:
 """
 
 import logging
+import threading
 import time
+from contextlib import nullcontext
 from typing import Optional, Iterator, Tuple, Dict, Any, Callable
 from dataclasses import dataclass
 from pathlib import Path
@@ -21,6 +23,10 @@ import duckdb
 logger = logging.getLogger(__name__)
 
 
+class PageLoadCancelled(Exception):
+    """Raised from a progress callback to abandon the page being loaded."""
+
+
 @dataclass
 class PaginationConfig:
     """Configuration for data pagination."""
@@ -30,6 +36,9 @@ class PaginationConfig:
     max_page_size: int = 10000
     min_page_size: int = 100
     
+    # Results with more rows than this are shown in the paginated view
+    pagination_threshold: int = 1000
+    
     # Memory thresholds (in MB)
     memory_threshold_mb: float = 100.0
     warning_threshold_mb: float = 500.0
@@ -55,6 +64,7 @@ class PageInfo:
     has_next: bool
     has_previous: bool
     memory_usage_mb: float = 0.0
+    offset_scan: bool = False  # Page was reached by rescanning all rows before it
 
 
 @dataclass
@@ -87,6 +97,7 @@ class DataPaginator:
         self.config = config or PaginationConfig()
         self.page_cache: Dict[int, pd.DataFrame] = {}
         self.cache_size_limit = 5  # Keep 5 pages in cache
+        self._cached_page_size: Optional[int] = None  # Size of the pages in page_cache
         self.total_rows: Optional[int] = None
         self.current_page = 0
         
@@ -169,6 +180,12 @@ class DataPaginator:
         self.page_cache.clear()
         logger.debug("Page cache cleared")
     
+    def _use_page_size(self, page_size: int):
+        """Drop cached pages when pages of a different size are requested."""
+        if page_size != self._cached_page_size:
+            self.page_cache.clear()
+            self._cached_page_size = page_size
+    
     def _manage_cache(self, page_number: int, data: pd.DataFrame):
         """Manage page cache size and add new data."""
         # Remove oldest entries if cache is full
@@ -187,10 +204,18 @@ class QueryPaginator(DataPaginator):
     Paginator for SQL query results.
     
     Handles pagination of query results with lazy loading from database.
+    
+    Arbitrary SQL has no key to seek on, so moving forward page by page reads
+    from a single open result stream instead of re-running the query with a
+    growing OFFSET. Only jumps to a non-adjacent page fall back to OFFSET,
+    which is flagged on the returned PageInfo.
     """
     
     def __init__(self, connection: duckdb.DuckDBPyConnection, 
-                 sql: str, config: Optional[PaginationConfig] = None):
+                 sql: str, config: Optional[PaginationConfig] = None,
+                 prefetched: Optional[pd.DataFrame] = None,
+                 stream: Optional[duckdb.DuckDBPyConnection] = None,
+                 db_manager=None):
         """
         Initialize query paginator.
         
@@ -198,13 +223,36 @@ class QueryPaginator(DataPaginator):
             connection: DuckDB connection
             sql: SQL query to paginate
             config: Pagination configuration
+            prefetched: Leading rows of the result that were already fetched
+            stream: Open result positioned right after the prefetched rows,
+                either a cursor or the main connection of ``db_manager``
+            db_manager: Optional DatabaseManager owning the connection, used to
+                run queries in the session the result came from
         """
         super().__init__(config)
         self.connection = connection
+        self.db_manager = db_manager
         self.sql = sql.strip().rstrip(';')
         self.base_sql = self._prepare_base_sql(sql)
         self.total_rows = None
+        self.estimated_rows: Optional[int] = None  # Used instead of COUNT(*) until an exact count is needed
+        self.plan_estimate = False  # estimated_rows is a guess (optimizer or rows read so far), not table statistics
         self._sample_data = None
+        self.prefetched = prefetched
+        self.execution_time = 0.0  # Seconds spent running the query before pagination took over
+        self._count_cursor: Optional[duckdb.DuckDBPyConnection] = None  # Cursor of a COUNT(*) in progress
+        
+        # Sequential read state
+        self._stream = stream
+        self._stream_position = len(prefetched) if prefetched is not None else 0
+        self._stream_buffer: Optional[pd.DataFrame] = None
+        self._stream_exhausted = False
+        self._stream_lock = threading.RLock()  # Pages load on worker threads
+    
+    @property
+    def _stream_on_main(self) -> bool:
+        """Whether the open result stream is the main connection's current result."""
+        return self._stream is not None and self._stream is self.connection and self.db_manager is not None
         
     def _prepare_base_sql(self, sql: str) -> str:
         """Prepare base SQL for pagination by wrapping in subquery if needed."""
@@ -220,26 +268,95 @@ class QueryPaginator(DataPaginator):
         # For complex queries, wrap in subquery
         return f"SELECT * FROM ({sql}) AS paginated_query"
     
+    @property
+    def is_total_estimated(self) -> bool:
+        """Whether get_total_rows() currently returns an estimate."""
+        return self.total_rows is None and self.estimated_rows is not None
+    
     def get_total_rows(self) -> int:
-        """Get total number of rows in query result."""
+        """Get total number of rows in query result (estimated when available)."""
+        if self.is_total_estimated:
+            return self.estimated_rows
+        
         if self.total_rows is None:
-            try:
-                count_sql = f"SELECT COUNT(*) as row_count FROM ({self.sql}) AS count_query"
-                result = self.connection.execute(count_sql).fetchone()
-                self.total_rows = result[0] if result else 0
-                logger.info(f"Query result has {self.total_rows} total rows")
-            except Exception as e:
-                logger.error(f"Failed to get row count: {e}")
-                self.total_rows = 0
+            self.total_rows = self._count_rows()
         
         return self.total_rows
     
+    def get_exact_total_rows(self) -> int:
+        """
+        Count the rows in the query result, replacing any estimate.
+        
+        The estimate stays in effect while counting so pages loading on other
+        threads do not start a second count.
+        """
+        if self.total_rows is None:
+            self.total_rows = self._count_rows()
+        return self.total_rows
+    
+    def _count_rows(self) -> int:
+        """Run COUNT(*) over the query in the session the result came from."""
+        count_sql = f"SELECT COUNT(*) as row_count FROM ({self.sql}) AS count_query"
+        try:
+            total_rows = self._run_count(count_sql)
+            prefetched_rows = len(self.prefetched) if self.prefetched is not None else 0
+            if total_rows < prefetched_rows and self.db_manager is not None:
+                # Fewer rows than were already read: the cursor lacked session state
+                logger.debug(f"Row count {total_rows} is below the {prefetched_rows} rows read; recounting")
+                total_rows = self._run_count(count_sql, on_main=True)
+            logger.info(f"Query result has {total_rows} total rows")
+            return total_rows
+        except duckdb.InterruptException:
+            # Leave the total unknown rather than caching a count of zero
+            raise
+        except Exception as e:
+            logger.error(f"Failed to get row count: {e}")
+            return 0
+    
+    def _run_count(self, count_sql: str, on_main: bool = False) -> int:
+        """Run a count query where it can be interrupted by interrupt_count()."""
+        if self.db_manager is None:
+            cursor = self.connection.cursor()
+            self._count_cursor = cursor
+            try:
+                try:
+                    result = cursor.execute(count_sql).fetchone()
+                except duckdb.CatalogException:
+                    # The query uses objects only visible on the main connection
+                    result = self.connection.execute(count_sql).fetchone()
+            finally:
+                self._count_cursor = None
+                cursor.close()
+            return result[0] if result else 0
+        
+        # A cursor of its own unless the query depends on the main connection's session
+        context = self.db_manager.main_connection() if on_main else self.db_manager.query_connection()
+        with context as connection:
+            self._count_cursor = connection
+            try:
+                result = connection.execute(count_sql).fetchone()
+            finally:
+                self._count_cursor = None
+        return result[0] if result else 0
+    
+    def interrupt_count(self):
+        """Interrupt a row count running on another thread."""
+        cursor = self._count_cursor
+        if cursor is not None:
+            try:
+                cursor.interrupt()
+            except Exception as e:
+                logger.debug(f"Failed to interrupt row count: {e}")
+    
     def get_sample_data(self, sample_size: int = 100) -> pd.DataFrame:
         """Get a small sample of data for analysis."""
+        if self._sample_data is None and self.prefetched is not None and len(self.prefetched) >= sample_size:
+            self._sample_data = self.prefetched.head(sample_size)
+        
         if self._sample_data is None:
             try:
                 sample_sql = f"{self.base_sql} LIMIT {sample_size}"
-                self._sample_data = self.connection.execute(sample_sql).df()
+                self._sample_data = self.query_dataframe(sample_sql)
                 logger.debug(f"Retrieved sample data: {len(self._sample_data)} rows")
             except Exception as e:
                 logger.error(f"Failed to get sample data: {e}")
@@ -261,11 +378,12 @@ class QueryPaginator(DataPaginator):
             Tuple[pd.DataFrame, PageInfo]: Page data and metadata
         """
         # Check cache first
+        self._use_page_size(page_size)
         if page_number in self.page_cache:
             logger.debug(f"Retrieved page {page_number} from cache")
             total_rows = self.get_total_rows()
             page_info = self.get_page_info(page_number, page_size, total_rows)
-            page_info.memory_usage_mb = self.page_cache[page_number].memory_usage(deep=True).sum() / (1024 * 1024)
+            page_info.memory_usage_mb = estimate_dataframe_bytes(self.page_cache[page_number]) / (1024 * 1024)
             return self.page_cache[page_number], page_info
         
         if progress_callback:
@@ -275,15 +393,19 @@ class QueryPaginator(DataPaginator):
             # Calculate offset
             offset = page_number * page_size
             
-            # Build paginated query
-            paginated_sql = f"{self.base_sql} LIMIT {page_size} OFFSET {offset}"
-            
-            if progress_callback:
-                progress_callback("Executing query...", 50)
-            
-            start_time = time.time()
-            data = self.connection.execute(paginated_sql).df()
-            load_time = time.time() - start_time
+            start_time = time.perf_counter()
+            with self._stream_lock:
+                data = self._read_sequential(offset, page_size)
+            offset_scan = data is None
+            if offset_scan:
+                # Build paginated query
+                paginated_sql = f"{self.base_sql} LIMIT {page_size} OFFSET {offset}"
+                
+                if progress_callback:
+                    progress_callback("Executing query...", 50)
+                
+                data = self.query_dataframe(paginated_sql)
+            load_time = time.perf_counter() - start_time
             
             if progress_callback:
                 progress_callback("Processing results...", 80)
@@ -291,7 +413,8 @@ class QueryPaginator(DataPaginator):
             # Get page info
             total_rows = self.get_total_rows()
             page_info = self.get_page_info(page_number, page_size, total_rows)
-            page_info.memory_usage_mb = data.memory_usage(deep=True).sum() / (1024 * 1024)
+            page_info.memory_usage_mb = estimate_dataframe_bytes(data) / (1024 * 1024)
+            page_info.offset_scan = offset_scan and offset > 0
             
             # Cache the page
             self._manage_cache(page_number, data)
@@ -302,12 +425,143 @@ class QueryPaginator(DataPaginator):
             logger.info(f"Loaded page {page_number}: {len(data)} rows in {load_time:.2f}s")
             return data, page_info
             
+        except PageLoadCancelled:
+            raise
         except Exception as e:
             logger.error(f"Failed to load page {page_number}: {e}")
             if progress_callback:
                 progress_callback(f"Error loading page: {e}", 0)
             raise
     
+    def _read_sequential(self, offset: int, row_count: int) -> Optional[pd.DataFrame]:
+        """
+        Serve rows from the prefetched rows and the open result stream.
+        
+        Args:
+            offset: Index of the first row wanted
+            row_count: Number of rows wanted
+            
+        Returns:
+            Optional[pd.DataFrame]: The rows, or None if reaching them needs a seek
+        """
+        prefetched_rows = len(self.prefetched) if self.prefetched is not None else 0
+        end = offset + row_count
+        
+        if end <= prefetched_rows:
+            # Page lies entirely within the rows fetched up front
+            return self.prefetched.iloc[offset:end].reset_index(drop=True)
+        
+        start = max(offset, prefetched_rows)
+        if start != self._stream_position or self._stream_exhausted:
+            return None
+        
+        if self._stream is None and (start != 0 or not self._open_stream()):
+            return None
+        
+        # A result on the main connection is read while no other statement can run there
+        context = self.db_manager.main_connection(owner=self) if self._stream_on_main else nullcontext()
+        with context:
+            if self._stream is None:
+                # Another statement replaced the result while waiting for the connection
+                return None
+            
+            parts = []
+            if offset < prefetched_rows:
+                parts.append(self.prefetched.iloc[offset:])
+            parts.append(self._read_stream(end - start))
+        
+        if len(parts) == 1:
+            return parts[0].reset_index(drop=True)
+        return pd.concat(parts, ignore_index=True)
+    
+    def _open_stream(self) -> bool:
+        """Start reading the query from the first row on a cursor of its own."""
+        if self.db_manager is not None and not self.db_manager.session_is_shared():
+            # The query may depend on session state a cursor does not have
+            return False
+        
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(self.sql)
+        except duckdb.CatalogException:
+            # The query uses objects only visible on the main connection
+            cursor.close()
+            self._stream_exhausted = True
+            return False
+        self._stream = cursor
+        return True
+    
+    def release_stream(self):
+        """
+        Stop reading the main connection's result once another statement replaces it.
+        
+        Called by the DatabaseManager while it holds the connection; later
+        pages are read with OFFSET queries.
+        """
+        self._stream = None
+        self._stream_buffer = None
+    
+    def query_dataframe(self, sql: str) -> pd.DataFrame:
+        """
+        Run a query in the session this result came from.
+        
+        Args:
+            sql: SQL query, usually derived from the paginated query
+            
+        Returns:
+            pd.DataFrame: The complete query result
+        """
+        if self.db_manager is None:
+            result = self.connection.execute(sql)
+            return compact_string_columns(result.df(), result.description)
+        
+        with self.db_manager.query_connection() as connection:
+            result = connection.execute(sql)
+            return compact_string_columns(result.df(), result.description)
+    
+    def _read_stream(self, row_count: int) -> pd.DataFrame:
+        """Read the next rows from the open result stream."""
+        parts = []
+        remaining = row_count
+        buffer = self._stream_buffer
+        
+        while remaining > 0:
+            if buffer is None or buffer.empty:
+                buffer = compact_string_columns(self._stream.fetch_df_chunk(), self._stream.description)
+                if buffer.empty:
+                    # End of result: the exact row count is now known
+                    self._stream_exhausted = True
+                    self.total_rows = self._stream_position + (row_count - remaining)
+                    break
+            parts.append(buffer.iloc[:remaining])
+            remaining -= len(parts[-1])
+            buffer = buffer.iloc[len(parts[-1]):]
+        
+        self._stream_buffer = buffer
+        self._stream_position += row_count - remaining
+        
+        if self._stream_exhausted:
+            self.close()
+        
+        if not parts:
+            return buffer if buffer is not None else pd.DataFrame()
+        return pd.concat(parts, ignore_index=True) if len(parts) > 1 else parts[0]
+    
+    def close(self):
+        """Close the result stream held by this paginator."""
+        with self._stream_lock:
+            if self._stream_on_main:
+                # The main connection stays open; its result ends with the next statement
+                self._stream = None
+                self._stream_buffer = None
+            elif self._stream is not None:
+                try:
+                    self._stream.close()
+                except Exception as e:
+                    logger.debug(f"Failed to close result stream: {e}")
+                self._stream = None
+                self._stream_buffer = None
+    
     def get_page_iterator(self, page_size: int, 
                          progress_callback: Optional[Callable[[str, int], None]] = None) -> Iterator[DataChunk]:
         """
@@ -328,9 +582,9 @@ class QueryPaginator(DataPaginator):
                 progress = int((chunk_number / total_chunks) * 100)
                 progress_callback(f"Loading chunk {chunk_number + 1} of {total_chunks}", progress)
             
-            start_time = time.time()
+            start_time = time.perf_counter()
             data, page_info = self.get_page(chunk_number, page_size)
-            load_time = time.time() - start_time
+            load_time = time.perf_counter() - start_time
             
             yield DataChunk(
                 data=data,
@@ -440,11 +694,12 @@ class FilePaginator(DataPaginator):
             Tuple[pd.DataFrame, PageInfo]: Page data and metadata
         """
         # Check cache first
+        self._use_page_size(page_size)
         if page_number in self.page_cache:
             logger.debug(f"Retrieved page {page_number} from cache")
             total_rows = self.get_total_rows()
             page_info = self.get_page_info(page_number, page_size, total_rows)
-            page_info.memory_usage_mb = self.page_cache[page_number].memory_usage(deep=True).sum() / (1024 * 1024)
+            page_info.memory_usage_mb = estimate_dataframe_bytes(self.page_cache[page_number]) / (1024 * 1024)
             return self.page_cache[page_number], page_info
         
         if progress_callback:
@@ -456,7 +711,7 @@ class FilePaginator(DataPaginator):
             if progress_callback:
                 progress_callback("Reading file...", 50)
             
-            start_time = time.time()
+            start_time = time.perf_counter()
             
             if self.file_type == 'csv':
                 # For CSV, we can use skiprows and nrows
@@ -474,7 +729,7 @@ class FilePaginator(DataPaginator):
                 end_idx = min(start_idx + page_size, len(full_data))
                 data = full_data.iloc[start_idx:end_idx].copy()
             
-            load_time = time.time() - start_time
+            load_time = time.perf_counter() - start_time
             
             if progress_callback:
                 progress_callback("Processing data...", 80)
@@ -482,7 +737,7 @@ class FilePaginator(DataPaginator):
             # Get page info
             total_rows = self.get_total_rows()
             page_info = self.get_page_info(page_number, page_size, total_rows)
-            page_info.memory_usage_mb = data.memory_usage(deep=True).sum() / (1024 * 1024)
+            page_info.memory_usage_mb = estimate_dataframe_bytes(data) / (1024 * 1024)
             
             # Cache the page
             self._manage_cache(page_number, data)
@@ -493,6 +748,8 @@ class FilePaginator(DataPaginator):
             logger.info(f"Loaded page {page_number}: {len(data)} rows in {load_time:.2f}s")
             return data, page_info
             
+        except PageLoadCancelled:
+            raise
         except Exception as e:
             logger.error(f"Failed to load page {page_number}: {e}")
             if progress_callback:
@@ -500,16 +757,66 @@ class FilePaginator(DataPaginator):
             raise
 
 
+_process = None  # psutil handle on this process, or False without psutil
+
+
 def get_memory_usage_mb() -> float:
     """Get current memory usage in MB."""
-    try:
-        import psutil
-        import os
-        process = psutil.Process(os.getpid())
-        return process.memory_info().rss / (1024 * 1024)
-    except ImportError:
+    global _process
+    if _process is None:
+        try:
+            import psutil
+            _process = psutil.Process()
+        except ImportError:
+            _process = False
+    if not _process:
         # Fallback if psutil not available
         return 0.0
+    return _process.memory_info().rss / (1024 * 1024)
+
+
+def estimate_dataframe_bytes(df: pd.DataFrame, sample_size: int = 1000) -> int:
+    """
+    Estimate the memory used by a DataFrame without walking every cell.
+    
+    ``memory_usage(deep=True)`` inspects each Python object in object columns,
+    which takes seconds on million-row results. Large frames are measured on an
+    evenly strided sample of rows and scaled up instead.
+    
+    Args:
+        df: DataFrame to measure
+        sample_size: Number of rows measured exactly
+        
+    Returns:
+        int: Estimated size in bytes
+    """
+    row_count = len(df)
+    if row_count <= sample_size:
+        return int(df.memory_usage(deep=True).sum())
+    
+    sample = df.iloc[::row_count // sample_size]
+    return int(sample.memory_usage(deep=True).sum() * row_count / len(sample))
+
+
+def compact_string_columns(data: pd.DataFrame, description) -> pd.DataFrame:
+    """
+    Store VARCHAR result columns as Arrow-backed strings.
+    
+    Older pandas versions hand DuckDB strings back as one Python object per
+    value, several times the size of the text itself. Arrow keeps the text
+    in a single buffer; newer pandas already does so and is left as is.
+    
+    Args:
+        data: DataFrame read from a DuckDB result, converted in place
+        description: The result's column descriptions
+        
+    Returns:
+        pd.DataFrame: The same DataFrame
+    """
+    for position, column in enumerate(description):
+        if column[1] == 'VARCHAR' and data.dtypes.iloc[position] == object:
+            data.isetitem(position, data.iloc[:, position].astype("string[pyarrow]"))
+    return data
 
 
 def format_memory_size(size_mb: float) -> str:
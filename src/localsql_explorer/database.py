@@ -8,17 +8,57 @@ This module provides the DatabaseManager class which handles:
 - Error handling and validation
 """
 
+import functools
+import json
 import logging
+import re
 import sqlite3
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Set, Tuple, Union
 
 import duckdb
 import pandas as pd
+import pyarrow as pa
 from pydantic import BaseModel, Field
 
+from .data_pagination import compact_string_columns
+
 logger = logging.getLogger(__name__)
 
+# Plain "SELECT <columns> FROM <table> [ORDER BY ...]" whose row count equals the table's
+_SINGLE_TABLE_SCAN_RE = re.compile(
+    r'^\s*SELECT\s+(?!DISTINCT\b)(?:(?!\bFROM\b).)+?\bFROM\s+([A-Za-z_][A-Za-z0-9_]*)'
+    r'(?:\s+ORDER\s+BY\s+(?:(?!\b(?:LIMIT|OFFSET)\b)[^;])+?)?\s*;?\s*$',
+    re.IGNORECASE | re.DOTALL
+)
+
+# A LIMIT closing the statement bounds the whole result; one inside a subquery
+# would be followed by its closing parenthesis
+_TRAILING_LIMIT_RE = re.compile(r'\bLIMIT\s+(\d+)(?:\s+OFFSET\s+\d+)?\s*;?\s*$', re.IGNORECASE)
+
+# Session state that makes a query resolve differently on the main connection
+# than on a new cursor: variables, connection-local settings, temporary tables
+# and views (including registered DataFrames), and the current schema
+_SESSION_STATE_SQL = """
+SELECT
+    (SELECT count(*) FROM duckdb_variables()),
+    (SELECT string_agg(name || '=' || coalesce(value, ''), ',' ORDER BY name) FROM duckdb_settings()),
+    (SELECT count(*) FROM duckdb_tables() WHERE temporary) + (SELECT count(*) FROM duckdb_views() WHERE temporary),
+    current_database(),
+    current_schema()
+"""
+
+
+def _uses_main_connection(method):
+    """Run a DatabaseManager method with exclusive use of the main connection."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.main_connection():
+            return method(self, *args, **kwargs)
+    return wrapper
+
 
 class TableMetadata(BaseModel):
     """Metadata for a registered table."""
@@ -39,6 +79,7 @@ class QueryResult(BaseModel):
     
     success: bool = Field(..., description="Whether query executed successfully")
     data: Optional[pd.DataFrame] = Field(None, description="Query result data")
+    arrow_table: Optional[pa.Table] = Field(None, description="Query result data when fetched as Arrow")
     error: Optional[str] = Field(None, description="Error message if failed")
     execution_time: float = Field(0.0, description="Execution time in seconds")
     row_count: int = Field(0, description="Number of rows returned")
@@ -57,6 +98,12 @@ class DatabaseManager:
     - Persistence operations
     """
     
+    # DuckDB table functions that read each file type without going through pandas
+    NATIVE_READERS = {
+        'csv': 'read_csv_auto',
+        'parquet': 'read_parquet',
+    }
+    
     def __init__(self, db_path: Optional[Union[str, Path]] = None):
         """
         Initialize the database manager.
@@ -67,6 +114,10 @@ class DatabaseManager:
         self.db_path = Path(db_path) if db_path else None
         self.connection: Optional[duckdb.DuckDBPyConnection] = None
         self.tables: Dict[str, TableMetadata] = {}
+        self.tables_version = 0  # Incremented whenever tables or their contents may change
+        self._connection_lock = threading.RLock()  # Held while a statement runs on the main connection
+        self._stream_owner = None  # Reader of a result still open on the main connection
+        self._session_shared: Optional[Tuple[int, bool]] = None  # (tables_version, shared)
         self._connect()
     
     def _connect(self) -> None:
@@ -82,6 +133,92 @@ class DatabaseManager:
             logger.error(f"Failed to connect to database: {e}")
             raise
     
+    @property
+    def connection_lock(self) -> threading.RLock:
+        """Lock serializing statements on the main connection and reads of their results."""
+        return self._connection_lock
+    
+    @contextmanager
+    def main_connection(self, owner=None):
+        """
+        Use the main connection without other threads running statements on it.
+        
+        DuckDB keeps one open result per connection and a new statement
+        replaces it, so a result left open for ``owner`` is released first
+        when anyone else takes the connection.
+        
+        Args:
+            owner: Reader of the result still open on the connection, if the caller is it
+            
+        Yields:
+            duckdb.DuckDBPyConnection: The main connection
+        """
+        with self._connection_lock:
+            if self._stream_owner is not None and self._stream_owner is not owner:
+                stream_owner, self._stream_owner = self._stream_owner, None
+                stream_owner.release_stream()
+            yield self.connection
+    
+    def set_stream_owner(self, owner) -> None:
+        """
+        Record the reader of the result left open on the main connection.
+        
+        Must be called while holding main_connection(). The owner's
+        ``release_stream()`` is called as soon as another statement runs.
+        """
+        self._stream_owner = owner
+    
+    def session_is_shared(self) -> bool:
+        """
+        Check whether a new cursor resolves queries as the main connection does.
+        
+        That is not the case once the session has variables, connection-local
+        settings, temporary tables or views, or another current schema. The
+        answer is kept until a statement that may change it runs.
+        
+        Returns:
+            bool: True if a query gives the same result on a cursor
+        """
+        cached = self._session_shared
+        if cached is not None and cached[0] == self.tables_version:
+            return cached[1]
+        
+        with self.main_connection() as connection:
+            version = self.tables_version
+            cursor = connection.cursor()
+            try:
+                shared = connection.execute(_SESSION_STATE_SQL).fetchone() == cursor.execute(_SESSION_STATE_SQL).fetchone()
+            except duckdb.Error as e:
+                logger.debug(f"Could not compare session state: {e}")
+                shared = False
+            finally:
+                cursor.close()
+            self._session_shared = (version, shared)
+        return shared
+    
+    @contextmanager
+    def query_connection(self):
+        """
+        Get a connection for running a whole query from a worker thread.
+        
+        This is a cursor of its own when the query resolves there as on the
+        main connection, so it does not wait for or end other queries.
+        Otherwise it is the main connection, held for as long as it is used.
+        
+        Yields:
+            duckdb.DuckDBPyConnection: Connection to run the query on
+        """
+        if self.session_is_shared():
+            cursor = self.connection.cursor()
+            try:
+                yield cursor
+            finally:
+                cursor.close()
+        else:
+            with self.main_connection() as connection:
+                yield connection
+    
+    @_uses_main_connection
     def register_table(
         self,
         name: str,
@@ -105,46 +242,13 @@ class DatabaseManager:
             ValueError: If table name is invalid or already exists
             Exception: If registration fails
         """
-        if not name or not name.strip():
-            raise ValueError(f"Invalid table name: {name}")
-        
-        # Check for valid SQL identifier (more permissive than original)
-        import re
-        if not re.match(r'^[a-zA-Z_][a-zA-Z0-9_]*$', name):
-            raise ValueError(f"Invalid table name: {name}")
-        
-        if name in self.tables:
-            raise ValueError(f"Table '{name}' already exists")
+        self._validate_table_name(name)
         
         try:
-            # Create a proper table instead of just registering a view
-            # First register as view for DuckDB to understand the schema
-            self.connection.register(f"temp_{name}", dataframe)
-            
-            # Then create a proper table from the view
-            self.connection.execute(f"CREATE TABLE {name} AS SELECT * FROM temp_{name}")
-            
-            # Clean up the temporary view
-            self.connection.execute(f"DROP VIEW temp_{name}")
-            
-            # Create metadata
-            from datetime import datetime
-            columns = [
-                {"name": col, "type": str(dataframe[col].dtype)}
-                for col in dataframe.columns
-            ]
-            
-            metadata = TableMetadata(
-                name=name,
-                file_path=file_path,
-                file_type=file_type,
-                row_count=len(dataframe),
-                column_count=len(dataframe.columns),
-                columns=columns,
-                created_at=datetime.now().isoformat()
-            )
+            metadata = self._create_table(name, dataframe, file_path, file_type)
             
             self.tables[name] = metadata
+            self.tables_version += 1
             logger.info(f"Registered table '{name}' with {len(dataframe)} rows, {len(dataframe.columns)} columns")
             
             return metadata
@@ -153,6 +257,244 @@ class DatabaseManager:
             logger.error(f"Failed to register table '{name}': {e}")
             raise
     
+    @_uses_main_connection
+    def register_tables(
+        self,
+        tables: List[Tuple[str, pd.DataFrame, Optional[str], Optional[str]]]
+    ) -> List[TableMetadata]:
+        """
+        Register several DataFrames as tables in a single transaction.
+        
+        Either all tables are created or, if one fails, none are.
+        
+        Args:
+            tables: (name, dataframe, file_path, file_type) for each table
+            
+        Returns:
+            List[TableMetadata]: Metadata for the registered tables, in order
+            
+        Raises:
+            ValueError: If a table name is invalid, repeated or already exists
+            Exception: If registration fails
+        """
+        names = [table[0] for table in tables]
+        for name in names:
+            self._validate_table_name(name)
+        if len(set(names)) != len(names):
+            raise ValueError("Table names in a batch must be unique")
+        
+        self.connection.execute("BEGIN TRANSACTION")
+        try:
+            registered = [self._create_table(*table) for table in tables]
+            self.connection.execute("COMMIT")
+        except Exception as e:
+            self.connection.execute("ROLLBACK")
+            logger.error(f"Failed to register {len(tables)} tables: {e}")
+            raise
+        
+        for metadata in registered:
+            self.tables[metadata.name] = metadata
+        self.tables_version += 1
+        
+        logger.info(f"Registered {len(registered)} tables: {', '.join(names)}")
+        return registered
+    
+    def create_table_from_file(
+        self,
+        name: str,
+        file_path: Union[str, Path],
+        file_type: str
+    ) -> TableMetadata:
+        """
+        Create a table by scanning a CSV or Parquet file with DuckDB's own reader.
+        
+        The file is parsed once, by DuckDB, rather than into a DataFrame first.
+        This runs on its own cursor so it can be called from a worker thread;
+        the table is not listed in ``tables`` until passed to add_tables().
+        
+        Args:
+            name: Table name
+            file_path: Path to the file
+            file_type: File type, one of NATIVE_READERS
+            
+        Returns:
+            TableMetadata: Metadata for the created table
+            
+        Raises:
+            ValueError: If the table name is invalid or the file type has no native reader
+            Exception: If DuckDB cannot read the file
+        """
+        return self._create_table_from_reader(name, file_type, "?", [str(file_path)], str(file_path), str(file_path))
+    
+    def create_table_from_files(
+        self,
+        name: str,
+        file_paths: List[Union[str, Path]],
+        file_type: str
+    ) -> TableMetadata:
+        """
+        Create one table by scanning several CSV or Parquet files in a single call.
+        
+        Columns are matched by name across the files, so files with missing or
+        reordered columns can be combined, and a ``filename`` column records
+        the file each row came from. Like create_table_from_file, this runs on
+        its own cursor and the table is not listed until passed to add_tables().
+        
+        Args:
+            name: Table name
+            file_paths: Paths to the files
+            file_type: File type shared by all the files, one of NATIVE_READERS
+            
+        Returns:
+            TableMetadata: Metadata for the created table
+            
+        Raises:
+            ValueError: If the table name is invalid or the file type has no native reader
+            Exception: If DuckDB cannot read the files
+        """
+        return self._create_table_from_reader(
+            name, file_type, "?, union_by_name = true, filename = true",
+            [[str(file_path) for file_path in file_paths]], None, f"{len(file_paths)} files"
+        )
+    
+    def _create_table_from_reader(
+        self,
+        name: str,
+        file_type: str,
+        reader_args: str,
+        params: list,
+        file_path: Optional[str],
+        source: str
+    ) -> TableMetadata:
+        """Create a table from a native reader call and build its metadata."""
+        self._validate_table_name(name)
+        reader = self.NATIVE_READERS.get(file_type)
+        if reader is None:
+            raise ValueError(f"No native reader for file type: {file_type}")
+        
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(f"CREATE TABLE {name} AS SELECT * FROM {reader}({reader_args})", params)
+            try:
+                row_count = cursor.execute(f"SELECT COUNT(*) FROM {name}").fetchone()[0]
+                columns = [
+                    {"name": col[0], "type": col[1]}
+                    for col in cursor.execute(f"DESCRIBE {name}").fetchall()
+                ]
+            except Exception:
+                cursor.execute(f"DROP TABLE IF EXISTS {name}")
+                raise
+        finally:
+            cursor.close()
+        
+        from datetime import datetime
+        logger.info(f"Created table '{name}' from {source} with {row_count} rows, {len(columns)} columns")
+        
+        return TableMetadata(
+            name=name,
+            file_path=file_path,
+            file_type=file_type,
+            row_count=row_count,
+            column_count=len(columns),
+            columns=columns,
+            created_at=datetime.now().isoformat()
+        )
+    
+    def add_tables(self, tables: List[TableMetadata]) -> None:
+        """
+        Record tables that were created by create_table_from_file.
+        
+        Args:
+            tables: Metadata of the created tables
+        """
+        for metadata in tables:
+            self.tables[metadata.name] = metadata
+        self.tables_version += 1
+    
+    def unique_table_name(self, base_name: str, reserved: Optional[Set[str]] = None) -> str:
+        """
+        Get a table name that does not clash with existing tables.
+        
+        Args:
+            base_name: Preferred table name
+            reserved: Additional names to avoid, e.g. others in the same import
+            
+        Returns:
+            str: base_name if free, otherwise base_name_<n> with n one past
+            the highest suffix already in use
+        """
+        taken = self.tables.keys() | (reserved or set())
+        if base_name not in taken:
+            return base_name
+        
+        suffix_re = re.compile(rf'{re.escape(base_name)}_(\d+)')
+        suffixes = [int(match.group(1)) for name in taken if (match := suffix_re.fullmatch(name))]
+        return f"{base_name}_{max(suffixes, default=0) + 1}"
+    
+    def _validate_table_name(self, name: str) -> None:
+        """
+        Check that a name can be used for a new table.
+        
+        Raises:
+            ValueError: If table name is invalid or already exists
+        """
+        if not name or not name.strip():
+            raise ValueError(f"Invalid table name: {name}")
+        
+        # Check for valid SQL identifier (more permissive than original)
+        if not re.match(r'^[a-zA-Z_][a-zA-Z0-9_]*$', name):
+            raise ValueError(f"Invalid table name: {name}")
+        
+        if name in self.tables:
+            raise ValueError(f"Table '{name}' already exists")
+    
+    def _relation_from_df(self, dataframe: pd.DataFrame) -> duckdb.DuckDBPyRelation:
+        """
+        Build a relation over a DataFrame for creating a table.
+
+        Frames from row-oriented sources such as Excel hold Python objects in
+        object columns, which DuckDB has to inspect value by value. Converting
+        them to Arrow once types each column in a single pass; columns Arrow
+        cannot type (mixed values) are left to DuckDB.
+        """
+        if (dataframe.dtypes == object).any():
+            try:
+                return self.connection.from_arrow(pa.Table.from_pandas(dataframe, preserve_index=False))
+            except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+                pass
+        return self.connection.from_df(dataframe)
+
+    def _create_table(
+        self,
+        name: str,
+        dataframe: pd.DataFrame,
+        file_path: Optional[str] = None,
+        file_type: Optional[str] = None
+    ) -> TableMetadata:
+        """Create a DuckDB table from a DataFrame and build its metadata."""
+        # A proper table rather than a registered view: views over the frame are not
+        # visible to worker cursors and cannot be renamed. The relation scans the
+        # frame in place, so no intermediate view needs to be named and dropped.
+        self._relation_from_df(dataframe).create(name)
+        
+        # Create metadata
+        from datetime import datetime
+        columns = [
+            {"name": col, "type": str(dataframe[col].dtype)}
+            for col in dataframe.columns
+        ]
+        
+        return TableMetadata(
+            name=name,
+            file_path=file_path,
+            file_type=file_type,
+            row_count=len(dataframe),
+            column_count=len(dataframe.columns),
+            columns=columns,
+            created_at=datetime.now().isoformat()
+        )
+    
+    @_uses_main_connection
     def attach_sqlite_database(
         self,
         sqlite_path: Union[str, Path],
@@ -174,7 +516,6 @@ class DatabaseManager:
             base_name = sqlite_path.stem
         
         # Sanitize base name
-        import re
         base_name = re.sub(r'[^\w]', '_', base_name).lower()
         
         registered_tables = []
@@ -236,6 +577,7 @@ class DatabaseManager:
                 )
                 
                 self.tables[sanitized_name] = metadata
+                self.tables_version += 1
                 registered_tables.append(metadata)
                 
                 logger.info(f"Registered SQLite table '{table_name}' as '{sanitized_name}' ({row_count} rows, {len(columns)} columns)")
@@ -246,19 +588,23 @@ class DatabaseManager:
             logger.error(f"Failed to attach SQLite database {sqlite_path}: {e}")
             raise
     
-    def execute_query(self, sql: str) -> QueryResult:
+    @_uses_main_connection
+    def execute_query(self, sql: str, return_arrow: bool = False) -> QueryResult:
         """
         Execute a SQL query against the database.
         
         Args:
             sql: SQL query string
+            return_arrow: Return rows as a pyarrow.Table in ``arrow_table``
+                instead of converting them to a DataFrame in ``data``
             
         Returns:
             QueryResult: Result of the query execution
         """
         import time
         
-        start_time = time.time()
+        start_time = time.perf_counter()
+        self._track_changes(sql)
         
         try:
             # Execute the query
@@ -274,30 +620,37 @@ class DatabaseManager:
                 sql_trimmed.startswith('SHOW')
             )
             
-            if is_select_query:
-                data = result.df()
+            data = None
+            arrow_table = None
+            if is_select_query and return_arrow:
+                # Arrow keeps DuckDB's columnar buffers; no per-cell Python objects
+                arrow_table = result.fetch_arrow_table()
+                row_count = arrow_table.num_rows
+                affected_rows = None
+            elif is_select_query:
+                data = compact_string_columns(result.df(), result.description)
                 row_count = len(data) if data is not None else 0
                 affected_rows = None
             else:
                 # For non-SELECT queries, get affected rows if available
-                data = None
                 row_count = 0
                 affected_rows = result.rowcount if hasattr(result, 'rowcount') else None
             
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             
             logger.info(f"Query executed successfully in {execution_time:.3f}s")
             
             return QueryResult(
                 success=True,
                 data=data,
+                arrow_table=arrow_table,
                 execution_time=execution_time,
                 row_count=row_count,
                 affected_rows=affected_rows
             )
             
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             error_msg = str(e)
             logger.error(f"Query failed after {execution_time:.3f}s: {error_msg}")
             
@@ -307,6 +660,167 @@ class DatabaseManager:
                 execution_time=execution_time
             )
     
+    @_uses_main_connection
+    def execute_query_adaptive(self, sql: str, pagination_threshold: int,
+                               config=None) -> Tuple[QueryResult, Optional[object]]:
+        """
+        Execute a query once and decide between a full result and pagination.
+        
+        Rows are streamed from the result until it is exhausted or more than
+        ``pagination_threshold`` rows have been read. Small results are returned
+        complete; larger ones come back with a paginator seeded with the rows
+        already fetched, so the query is never run a second time just to size it.
+        
+        Args:
+            sql: SQL query string
+            pagination_threshold: Maximum number of rows shown without pagination
+            config: Optional pagination configuration
+            
+        Returns:
+            Tuple[QueryResult, Optional[QueryPaginator]]: The paginator is None
+            when the result holds the complete data
+        """
+        import time
+        
+        # Only read-only statements are streamed; everything else runs as usual,
+        # as do queries whose own LIMIT keeps them within the threshold
+        if not sql.strip().upper().startswith(('SELECT', 'WITH')):
+            return self.execute_query(sql), None
+        limit = _TRAILING_LIMIT_RE.search(sql)
+        if limit and int(limit.group(1)) <= pagination_threshold:
+            return self.execute_query(sql), None
+        
+        start_time = time.perf_counter()
+        self._track_changes(sql)
+        
+        try:
+            # Settled now, since checking later would end the result left open below
+            self.session_is_shared()
+            
+            # Runs on the main connection so session state (SET VARIABLE, USE,
+            # search_path) applies as it does for any other query
+            stream = self.connection.execute(sql)
+            
+            chunks = []
+            fetched_rows = 0
+            while fetched_rows <= pagination_threshold:
+                chunk = stream.fetch_df_chunk()
+                if chunk.empty:
+                    break
+                chunks.append(chunk)
+                fetched_rows += len(chunk)
+            
+            if chunks:
+                data = pd.concat(chunks, ignore_index=True) if len(chunks) > 1 else chunks[0]
+            else:
+                data = pd.DataFrame(columns=[column[0] for column in stream.description])
+            data = compact_string_columns(data, stream.description)
+            
+            execution_time = time.perf_counter() - start_time
+            result = QueryResult(
+                success=True,
+                data=data,
+                execution_time=execution_time,
+                row_count=len(data)
+            )
+            
+            if fetched_rows > pagination_threshold:
+                logger.info(f"Query exceeded {pagination_threshold} rows, using pagination")
+                # The paginator keeps reading this result until another statement
+                # runs on the main connection, then falls back to OFFSET queries
+                paginator = self.create_query_paginator(sql, config, prefetched=data, stream=self.connection)
+                self.set_stream_owner(paginator)
+                paginator.execution_time = execution_time
+                return result, paginator
+            
+            logger.info(f"Query executed successfully in {execution_time:.3f}s")
+            return result, None
+            
+        except Exception as e:
+            execution_time = time.perf_counter() - start_time
+            error_msg = str(e)
+            logger.error(f"Query failed after {execution_time:.3f}s: {error_msg}")
+            
+            return QueryResult(
+                success=False,
+                error=error_msg,
+                execution_time=execution_time
+            ), None
+    
+    def _track_changes(self, sql: str) -> None:
+        """Bump the tables version unless the SQL is a single read-only statement."""
+        statement = sql.strip().rstrip(';')
+        if ';' in statement or not statement.upper().startswith(('SELECT', 'WITH', 'EXPLAIN', 'DESCRIBE', 'SHOW')):
+            self.tables_version += 1
+    
+    def interrupt(self) -> None:
+        """Interrupt the query currently running on the main connection."""
+        if self.connection:
+            self.connection.interrupt()
+        logger.info("Query interruption requested")
+    
+    def estimate_rows(self, sql: str) -> Optional[int]:
+        """
+        Estimate the row count of a query from table statistics.
+        
+        Only plain single-table scans (no filtering, grouping, joins or limits)
+        are estimated, using DuckDB's ``estimated_size`` so no data is read.
+        
+        Args:
+            sql: SQL query string
+            
+        Returns:
+            Optional[int]: Estimated row count, or None if it cannot be estimated
+        """
+        match = _SINGLE_TABLE_SCAN_RE.match(sql)
+        if not match:
+            return None
+        
+        # A cursor leaves any result open on the main connection intact
+        cursor = self.connection.cursor()
+        try:
+            row = cursor.execute(
+                "SELECT estimated_size FROM duckdb_tables() WHERE table_name = ?",
+                [match.group(1)]
+            ).fetchone()
+        except Exception as e:
+            logger.debug(f"Could not estimate row count: {e}")
+            return None
+        finally:
+            cursor.close()
+        
+        return int(row[0]) if row and row[0] is not None else None
+    
+    def estimate_plan_rows(self, sql: str) -> Optional[int]:
+        """
+        Estimate the row count of any query from its optimized plan.
+        
+        Unlike ``estimate_rows`` this reads the optimizer's cardinality guess,
+        which can be far off for filters and joins; treat it as a placeholder
+        until the rows are counted.
+        
+        Args:
+            sql: SQL query string
+            
+        Returns:
+            Optional[int]: Estimated row count, or None if the plan has none
+        """
+        cursor = self.connection.cursor()
+        try:
+            row = cursor.execute(f"EXPLAIN (FORMAT JSON) {sql.strip().rstrip(';')}").fetchone()
+            plan = json.loads(row[1])
+            estimate = plan[0].get("extra_info", {}).get("Estimated Cardinality")
+        except Exception as e:
+            logger.debug(f"Could not estimate row count from plan: {e}")
+            return None
+        finally:
+            cursor.close()
+        
+        try:
+            return int(estimate) if estimate is not None else None
+        except ValueError:
+            return None
+    
     def get_table_metadata(self, table_name: str) -> Optional[TableMetadata]:
         """Get metadata for a specific table."""
         return self.tables.get(table_name)
@@ -361,6 +875,30 @@ class DatabaseManager:
         
         return metadata.columns
     
+    @_uses_main_connection
+    def get_schema_columns(self) -> Dict[str, List[str]]:
+        """
+        Get the column names of every registered table in a single query.
+        
+        Returns:
+            Dict[str, List[str]]: Column names in ordinal order keyed by table name
+        """
+        columns: Dict[str, List[str]] = {name: [] for name in self.tables}
+        if not self.connection or not columns:
+            return columns
+        
+        rows = self.connection.execute(
+            "SELECT table_name, column_name FROM information_schema.columns "
+            "WHERE table_schema = current_schema() "
+            "ORDER BY table_name, ordinal_position"
+        ).fetchall()
+        for table_name, column_name in rows:
+            if table_name in columns:
+                columns[table_name].append(column_name)
+        
+        return columns
+    
+    @_uses_main_connection
     def drop_table(self, table_name: str) -> bool:
         """
         Drop a table from the database.
@@ -381,6 +919,7 @@ class DatabaseManager:
             
             # Remove from metadata
             del self.tables[table_name]
+            self.tables_version += 1
             
             logger.info(f"Dropped table '{table_name}'")
             return True
@@ -389,6 +928,7 @@ class DatabaseManager:
             logger.error(f"Failed to drop table '{table_name}': {e}")
             return False
     
+    @_uses_main_connection
     def rename_table(self, old_name: str, new_name: str) -> bool:
         """
         Rename a table in the database.
@@ -417,6 +957,7 @@ class DatabaseManager:
             metadata.name = new_name
             self.tables[new_name] = metadata
             del self.tables[old_name]
+            self.tables_version += 1
             
             logger.info(f"Renamed table '{old_name}' to '{new_name}'")
             return True
@@ -425,6 +966,7 @@ class DatabaseManager:
             logger.error(f"Failed to rename table '{old_name}' to '{new_name}': {e}")
             return False
     
+    @_uses_main_connection
     def save_database(self, file_path: Union[str, Path]) -> bool:
         """
         Save the current database to a file.
@@ -470,6 +1012,7 @@ class DatabaseManager:
             logger.error(f"Failed to save database to {file_path}: {e}")
             return False
     
+    @_uses_main_connection
     def load_database(self, file_path: Union[str, Path]) -> bool:
         """
         Load a database from a file.
@@ -497,6 +1040,7 @@ class DatabaseManager:
             
             # Rebuild table metadata
             self.tables.clear()
+            self.tables_version += 1
             
             # Get list of tables from database
             tables_df = self.connection.execute("SHOW TABLES").df()
@@ -532,6 +1076,7 @@ class DatabaseManager:
             logger.error(f"Failed to load database from {file_path}: {e}")
             return False
     
+    @_uses_main_connection
     def close(self) -> None:
         """Close the database connection."""
         if self.connection:
@@ -539,6 +1084,7 @@ class DatabaseManager:
             self.connection = None
             logger.info("Database connection closed")
     
+    @_uses_main_connection
     def rename_table(self, old_name: str, new_name: str) -> bool:
         """
         Rename a table in the database.
@@ -569,6 +1115,7 @@ class DatabaseManager:
             # Update tables dictionary
             self.tables[new_name] = metadata
             del self.tables[old_name]
+            self.tables_version += 1
             
             logger.info(f"Table renamed from '{old_name}' to '{new_name}'")
             return True
@@ -577,6 +1124,7 @@ class DatabaseManager:
             logger.error(f"Failed to rename table from '{old_name}' to '{new_name}': {e}")
             return False
     
+    @_uses_main_connection
     def drop_table(self, table_name: str) -> bool:
         """
         Drop a table from the database.
@@ -597,6 +1145,7 @@ class DatabaseManager:
             
             # Remove from metadata
             del self.tables[table_name]
+            self.tables_version += 1
             
             logger.info(f"Table '{table_name}' dropped")
             return True
@@ -605,12 +1154,14 @@ class DatabaseManager:
             logger.error(f"Failed to drop table '{table_name}': {e}")
             return False
     
-    def analyze_table_columns(self, table_name: str):
+    def analyze_table_columns(self, table_name: str, progress_callback=None):
         """
         Perform detailed column analysis for a table.
         
         Args:
             table_name: Name of the table to analyze
+            progress_callback: Optional callback receiving each column's metadata
+                as it completes, with the number of columns done and in total
             
         Returns:
             TableColumnAnalysis: Detailed column analysis or None if table not found
@@ -623,14 +1174,10 @@ class DatabaseManager:
         
         try:
             # Get table data
-            query_result = self.execute_query(f"SELECT * FROM {table_name}")
-            
-            if not query_result.success or query_result.data is None:
-                logger.error(f"Failed to retrieve data for table '{table_name}'")
-                return None
+            data = self._read_table(table_name)
             
             # Perform column analysis
-            analysis = column_analyzer.analyze_table(query_result.data, table_name)
+            analysis = column_analyzer.analyze_table(data, table_name, progress_callback)
             logger.info(f"Column analysis completed for table '{table_name}'")
             
             return analysis
@@ -654,27 +1201,39 @@ class DatabaseManager:
             return None
         
         try:
-            # Execute query to get all table data
-            query_result = self.execute_query(f"SELECT * FROM {table_name}")
-            
-            if not query_result.success or query_result.data is None:
-                logger.error(f"Failed to retrieve data for table '{table_name}'")
-                return None
-            
-            logger.info(f"Retrieved {len(query_result.data)} rows for table '{table_name}'")
-            return query_result.data
+            data = self._read_table(table_name)
+            logger.info(f"Retrieved {len(data)} rows for table '{table_name}'")
+            return data
             
         except Exception as e:
             logger.error(f"Failed to get dataframe for table '{table_name}': {e}")
             return None
     
-    def create_query_paginator(self, sql: str, config=None):
+    def _read_table(self, table_name: str) -> pd.DataFrame:
+        """
+        Read a complete registered table on a cursor of its own.
+        
+        Registered tables are visible to every cursor, so worker threads can
+        read them without waiting for or ending a query on the main connection.
+        """
+        cursor = self.connection.cursor()
+        try:
+            result = cursor.execute(f"SELECT * FROM {table_name}")
+            return compact_string_columns(result.df(), result.description)
+        finally:
+            cursor.close()
+    
+    def create_query_paginator(self, sql: str, config=None, prefetched: Optional[pd.DataFrame] = None,
+                               stream=None):
         """
         Create a paginator for a SQL query.
         
         Args:
             sql: SQL query to paginate
             config: Optional pagination configuration
+            prefetched: Optional leading rows of the result that were already fetched
+            stream: Optional open result positioned right after the prefetched rows,
+                either a cursor or the main connection
             
         Returns:
             QueryPaginator: Paginator for the query
@@ -685,7 +1244,21 @@ class DatabaseManager:
             raise RuntimeError("Database not connected")
         
         pagination_config = config or PaginationConfig()
-        return QueryPaginator(self.connection, sql, pagination_config)
+        paginator = QueryPaginator(
+            self.connection, sql, pagination_config, prefetched=prefetched, stream=stream, db_manager=self
+        )
+        paginator.estimated_rows = self.estimate_rows(sql)
+        if paginator.estimated_rows is None:
+            estimate = self.estimate_plan_rows(sql)
+            if estimate is not None:
+                # Never show fewer rows than were already read
+                paginator.estimated_rows = max(estimate, len(prefetched) if prefetched is not None else 0)
+                paginator.plan_estimate = True
+            elif prefetched is not None:
+                # Show the rows read so far until a background count replaces them
+                paginator.estimated_rows = len(prefetched)
+                paginator.plan_estimate = True
+        return paginator
     
     def create_table_paginator(self, table_name: str, config=None):
         """
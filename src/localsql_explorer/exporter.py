@@ -9,10 +9,14 @@ This module provides the ResultExporter class which handles:
 """
 
 import logging
+import weakref
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Callable, Dict, List, Optional, Union
 
+import duckdb
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 from pydantic import BaseModel, Field
 
 logger = logging.getLogger(__name__)
@@ -58,9 +62,25 @@ class ResultExporter:
     
     SUPPORTED_FORMATS = ['csv', 'excel', 'parquet']
     
+    # Export format by file extension
+    EXTENSION_FORMATS = {
+        '.csv': 'csv',
+        '.xlsx': 'excel',
+        '.xls': 'excel',
+        '.parquet': 'parquet',
+        '.pq': 'parquet'
+    }
+    
+    # Rows fetched per record batch when streaming a query to a file
+    STREAM_BATCH_SIZE = 100_000
+    
+    # Maximum number of rows on an Excel worksheet (including the header)
+    EXCEL_MAX_ROWS = 1_048_576
+    
     def __init__(self):
         """Initialize the result exporter."""
         self.export_history: List[ExportResult] = []
+        self._arrow_cache: Optional[tuple] = None  # (weakref to DataFrame, Arrow table or None)
     
     def export_to_csv(
         self,
@@ -98,17 +118,34 @@ class ResultExporter:
             # Ensure directory exists
             file_path.parent.mkdir(parents=True, exist_ok=True)
             
-            # Prepare export arguments
-            export_args = {
-                'path_or_buf': file_path,
-                'sep': options.delimiter,
-                'encoding': options.encoding,
-                'index': options.include_index,
-                'header': options.include_header,
-            }
+            table = None
+            if self._is_utf8(options) and not options.include_index:
+                table = self._to_arrow(dataframe)
             
-            # Export to CSV
-            dataframe.to_csv(**export_args)
+            if table is not None:
+                # DuckDB's writer avoids pandas' per-value formatting loop and
+                # writes the same text as the COPY used for whole-result exports
+                connection = duckdb.connect()
+                try:
+                    connection.from_arrow(table).write_csv(
+                        str(file_path),
+                        sep=options.delimiter,
+                        header=options.include_header
+                    )
+                finally:
+                    connection.close()
+            else:
+                # Prepare export arguments
+                export_args = {
+                    'path_or_buf': file_path,
+                    'sep': options.delimiter,
+                    'encoding': options.encoding,
+                    'index': options.include_index,
+                    'header': options.include_header,
+                }
+                
+                # Export to CSV
+                dataframe.to_csv(**export_args)
             
             # Get file size
             file_size = file_path.stat().st_size if file_path.exists() else None
@@ -174,16 +211,22 @@ class ResultExporter:
             # Ensure directory exists
             file_path.parent.mkdir(parents=True, exist_ok=True)
             
-            # Prepare export arguments
-            export_args = {
-                'excel_writer': file_path,
-                'sheet_name': options.sheet_name,
-                'index': options.include_index,
-                'header': options.include_header,
-            }
+            table = None if options.include_index else self._to_arrow(dataframe)
             
-            # Export to Excel
-            dataframe.to_excel(**export_args)
+            if table is not None:
+                # Write through the same write-only workbook as streamed exports
+                self._stream_to_excel(table.to_reader(), file_path, options, None)
+            else:
+                # Prepare export arguments
+                export_args = {
+                    'excel_writer': file_path,
+                    'sheet_name': options.sheet_name,
+                    'index': options.include_index,
+                    'header': options.include_header,
+                }
+                
+                # Export to Excel
+                dataframe.to_excel(**export_args)
             
             # Get file size
             file_size = file_path.stat().st_size if file_path.exists() else None
@@ -249,14 +292,13 @@ class ResultExporter:
             # Ensure directory exists
             file_path.parent.mkdir(parents=True, exist_ok=True)
             
-            # Prepare export arguments
-            export_args = {
-                'path': file_path,
-                'index': options.include_index,
-            }
-            
             # Export to Parquet
-            dataframe.to_parquet(**export_args)
+            import pyarrow.parquet as pq  # Only needed for Parquet; kept off the startup path
+            
+            table = None if options.include_index else self._to_arrow(dataframe)
+            if table is None:
+                table = pa.Table.from_pandas(dataframe, preserve_index=options.include_index)
+            pq.write_table(table, file_path)
             
             # Get file size
             file_size = file_path.stat().st_size if file_path.exists() else None
@@ -310,15 +352,7 @@ class ResultExporter:
         # Detect format from extension if not specified
         if not format_type:
             extension = file_path.suffix.lower()
-            format_map = {
-                '.csv': 'csv',
-                '.xlsx': 'excel',
-                '.xls': 'excel',
-                '.parquet': 'parquet',
-                '.pq': 'parquet'
-            }
-            
-            format_type = format_map.get(extension)
+            format_type = self.EXTENSION_FORMATS.get(extension)
             
             if not format_type:
                 error_msg = f"Cannot determine export format from extension: {extension}"
@@ -358,6 +392,238 @@ class ResultExporter:
                 error=error_msg
             )
     
+    def export_query(
+        self,
+        connection,
+        sql: str,
+        file_path: Union[str, Path],
+        format_type: Optional[str] = None,
+        options: Optional[ExportOptions] = None,
+        progress_callback: Optional[Callable[[int], None]] = None
+    ) -> ExportResult:
+        """
+        Stream the result of a query to a file without materializing it.
+        
+        UTF-8 CSV and Parquet files are written by DuckDB's COPY statement, so
+        rows never pass through Python. Other exports, and queries COPY cannot
+        wrap, are read in Arrow record batches which are written as they
+        arrive, so memory use is bounded by the batch size rather than the
+        result size.
+        
+        Args:
+            connection: DuckDB connection to run the query on; nothing else
+                may run on it until the export returns
+            sql: SQL query whose result is exported
+            file_path: Output file path
+            format_type: Optional format override ('csv', 'excel', 'parquet')
+            options: Export options
+            progress_callback: Optional callback receiving the rows written so far
+            
+        Returns:
+            ExportResult: Result of the export operation
+        """
+        file_path = Path(file_path)
+        options = options or ExportOptions()
+        format_type = format_type or self.EXTENSION_FORMATS.get(file_path.suffix.lower())
+        warnings = []
+        
+        if format_type not in self.SUPPORTED_FORMATS:
+            error_msg = f"Unsupported export format: {format_type or file_path.suffix}"
+            logger.error(error_msg)
+            return ExportResult(
+                success=False,
+                file_path=str(file_path),
+                file_type=format_type or 'unknown',
+                error=error_msg
+            )
+        
+        if file_path.exists() and not options.overwrite:
+            error_msg = f"File already exists and overwrite is disabled: {file_path}"
+            logger.error(error_msg)
+            return ExportResult(
+                success=False,
+                file_path=str(file_path),
+                file_type=format_type,
+                error=error_msg
+            )
+        
+        if options.include_index:
+            warnings.append("Row index is not written when streaming query results")
+        
+        try:
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            
+            row_count = self._copy_query(connection, sql, file_path, format_type, options)
+            if row_count is not None:
+                if progress_callback:
+                    progress_callback(row_count)
+            else:
+                reader = connection.execute(sql).fetch_record_batch(self.STREAM_BATCH_SIZE)
+                write_batches = {
+                    'csv': self._stream_to_csv,
+                    'excel': self._stream_to_excel,
+                    'parquet': self._stream_to_parquet,
+                }[format_type]
+                row_count = write_batches(reader, file_path, options, progress_callback)
+            
+            file_size = file_path.stat().st_size if file_path.exists() else None
+            
+            logger.info(f"Successfully streamed {row_count} rows to {format_type}: {file_path}")
+            
+            result = ExportResult(
+                success=True,
+                file_path=str(file_path),
+                file_type=format_type,
+                row_count=row_count,
+                file_size=file_size,
+                warnings=warnings
+            )
+            
+        except Exception as e:
+            error_msg = f"Failed to export query results to {file_path}: {str(e)}"
+            logger.error(error_msg)
+            
+            result = ExportResult(
+                success=False,
+                file_path=str(file_path),
+                file_type=format_type,
+                error=error_msg
+            )
+        
+        self.export_history.append(result)
+        return result
+    
+    def _copy_query(self, connection, sql: str, file_path: Path, format_type: str,
+                    options: ExportOptions) -> Optional[int]:
+        """
+        Write a query result with DuckDB's COPY statement.
+        
+        Returns:
+            Number of rows written, or None if the export is not one COPY
+            writes or the query cannot be wrapped (e.g. SHOW or PRAGMA)
+        """
+        if format_type == 'csv' and self._is_utf8(options):
+            delimiter = options.delimiter.replace("'", "''")
+            header = 'true' if options.include_header else 'false'
+            copy_options = f"FORMAT csv, HEADER {header}, DELIMITER '{delimiter}'"
+        elif format_type == 'parquet':
+            copy_options = "FORMAT parquet"
+        else:
+            return None
+        
+        target = str(file_path).replace("'", "''")
+        # The newlines keep a trailing line comment from swallowing the parenthesis
+        copy_sql = f"COPY (\n{sql.strip().rstrip(';')}\n) TO '{target}' ({copy_options})"
+        try:
+            return connection.execute(copy_sql).fetchone()[0]
+        except duckdb.Error as e:
+            logger.debug(f"Streaming export instead of COPY: {e}")
+            return None
+    
+    def _stream_to_csv(self, reader, file_path: Path, options: ExportOptions,
+                       progress_callback: Optional[Callable[[int], None]]) -> int:
+        """Write record batches to a CSV file."""
+        row_count = 0
+        
+        if self._is_utf8(options):
+            write_options = pa_csv.WriteOptions(
+                include_header=options.include_header,
+                delimiter=options.delimiter
+            )
+            with pa_csv.CSVWriter(file_path, reader.schema, write_options=write_options) as writer:
+                for batch in reader:
+                    writer.write_batch(batch)
+                    row_count += batch.num_rows
+                    if progress_callback:
+                        progress_callback(row_count)
+            return row_count
+        
+        # Arrow only writes UTF-8, so other encodings go through pandas chunk by chunk
+        with open(file_path, 'w', encoding=options.encoding, newline='') as handle:
+            for batch in reader:
+                batch.to_pandas().to_csv(
+                    handle,
+                    sep=options.delimiter,
+                    index=False,
+                    header=options.include_header and row_count == 0
+                )
+                row_count += batch.num_rows
+                if progress_callback:
+                    progress_callback(row_count)
+        return row_count
+    
+    def _to_arrow(self, dataframe: pd.DataFrame) -> Optional[pa.Table]:
+        """
+        Convert a DataFrame to Arrow, or None if a column has mixed types.
+        
+        The last conversion is kept while its DataFrame is alive, so exporting
+        the same result to several files converts it only once. Result frames
+        are replaced rather than modified, so the identity check is sufficient.
+        The conversion is dropped as soon as its DataFrame is collected.
+        """
+        if self._arrow_cache is not None and self._arrow_cache[0]() is dataframe:
+            return self._arrow_cache[1]
+        
+        try:
+            table = pa.Table.from_pandas(dataframe, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+            logger.debug(f"Falling back to pandas writer: {e}")
+            table = None
+        
+        self._arrow_cache = (weakref.ref(dataframe, self._release_arrow_cache), table)
+        return table
+    
+    def _release_arrow_cache(self, dataframe_ref: weakref.ref) -> None:
+        """Forget a cached conversion once its DataFrame has been collected."""
+        if self._arrow_cache is not None and self._arrow_cache[0] is dataframe_ref:
+            self._arrow_cache = None
+    
+    @staticmethod
+    def _is_utf8(options: ExportOptions) -> bool:
+        """Check whether the export encoding is the UTF-8 the Arrow and DuckDB CSV writers produce."""
+        return options.encoding.lower().replace('-', '') == 'utf8'
+    
+    def _stream_to_parquet(self, reader, file_path: Path, options: ExportOptions,
+                           progress_callback: Optional[Callable[[int], None]]) -> int:
+        """Write record batches to a Parquet file."""
+        import pyarrow.parquet as pq
+        
+        row_count = 0
+        with pq.ParquetWriter(file_path, reader.schema) as writer:
+            for batch in reader:
+                writer.write_batch(batch)
+                row_count += batch.num_rows
+                if progress_callback:
+                    progress_callback(row_count)
+        return row_count
+    
+    def _stream_to_excel(self, reader, file_path: Path, options: ExportOptions,
+                         progress_callback: Optional[Callable[[int], None]]) -> int:
+        """Write record batches to an Excel file using a write-only workbook."""
+        from openpyxl import Workbook
+        
+        workbook = Workbook(write_only=True)
+        worksheet = workbook.create_sheet(options.sheet_name)
+        
+        max_rows = self.EXCEL_MAX_ROWS
+        if options.include_header:
+            worksheet.append(reader.schema.names)
+            max_rows -= 1
+        
+        row_count = 0
+        for batch in reader:
+            row_count += batch.num_rows
+            if row_count > max_rows:
+                raise ValueError(f"Result exceeds Excel's limit of {max_rows:,} rows per sheet")
+            
+            for row in zip(*(column.to_pylist() for column in batch.columns)):
+                worksheet.append(row)
+            if progress_callback:
+                progress_callback(row_count)
+        
+        workbook.save(file_path)
+        return row_count
+    
     def get_export_history(self) -> List[ExportResult]:
         """Get the history of export operations."""
         return self.export_history.copy()
@@ -14,7 +14,6 @@ from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Union
 
 import pandas as pd
-import pyarrow.parquet as pq
 from pydantic import BaseModel, Field
 
 logger = logging.getLogger(__name__)
@@ -443,6 +442,8 @@ class FileImporter:
         Returns:
             ImportResult: Result of the import operation
         """
+        import pyarrow.parquet as pq  # Only needed for Parquet; kept off the startup path
+        
         file_path = Path(file_path)
         options = options or ImportOptions()
         warnings = []
@@ -671,6 +672,9 @@ class FileImporter:
             raise ValueError(f"Not an Excel file: {file_path}")
         
         try:
+            if file_path.suffix.lower() == '.xlsx':
+                return self._detect_xlsx_sheets(file_path)
+            
             # Read Excel file to get sheet information
             excel_file = pd.ExcelFile(file_path)
             sheet_infos = []
@@ -734,6 +738,73 @@ class FileImporter:
             logger.error(error_msg)
             raise ValueError(error_msg)
     
+    def _detect_xlsx_sheets(self, file_path: Path, sample_rows: int = 5) -> List[SheetInfo]:
+        """
+        Analyze an .xlsx workbook without loading its cell data.
+        
+        The workbook is opened read-only so sizes come from each sheet's stored
+        dimensions, and only the header and preview rows are parsed.
+        
+        Args:
+            file_path: Path to .xlsx file
+            sample_rows: Number of data rows to include in each preview
+            
+        Returns:
+            List of SheetInfo objects containing metadata about each sheet
+        """
+        from openpyxl import load_workbook
+        
+        workbook = load_workbook(file_path, read_only=True, data_only=True)
+        sheet_infos = []
+        
+        try:
+            for index, sheet_name in enumerate(workbook.sheetnames):
+                try:
+                    worksheet = workbook[sheet_name]
+                    if worksheet.max_row is None or worksheet.max_column is None:
+                        # No stored dimensions; this requires a scan of the sheet
+                        worksheet.calculate_dimension(force=True)
+                    
+                    rows = list(worksheet.iter_rows(max_row=sample_rows + 1, values_only=True))
+                    header = list(rows[0]) if rows else []
+                    columns = [
+                        str(value) if value is not None else f"Unnamed: {i}"
+                        for i, value in enumerate(header)
+                    ]
+                    sample = [row for row in rows[1:] if any(value is not None for value in row)]
+                    
+                    # Counts follow the stored dimensions, the first row being the header
+                    row_count = max(worksheet.max_row - 1, 0)
+                    column_count = worksheet.max_column if any(value is not None for value in header) else 0
+                    
+                    sheet_infos.append(SheetInfo(
+                        name=sheet_name,
+                        index=index,
+                        row_count=row_count,
+                        column_count=column_count,
+                        columns=columns if column_count else [],
+                        sample_data=pd.DataFrame(sample, columns=columns) if sample else None,
+                        is_empty=row_count <= 1 or column_count == 0,
+                        has_merged_cells=False
+                    ))
+                    
+                except Exception as e:
+                    logger.warning(f"Could not analyze sheet '{sheet_name}': {e}")
+                    sheet_infos.append(SheetInfo(
+                        name=sheet_name,
+                        index=index,
+                        row_count=0,
+                        column_count=0,
+                        columns=[],
+                        sample_data=None,
+                        is_empty=True,
+                        has_merged_cells=False
+                    ))
+        finally:
+            workbook.close()
+        
+        return sheet_infos
+    
     def import_excel_multiple_sheets(
         self,
         file_path: Union[str, Path],
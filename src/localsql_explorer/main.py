@@ -193,21 +193,15 @@ def query_command(
         db_manager.register_table(table_name, import_result.dataframe)
         typer.echo(f"Registered table: {table_name}")
         
-        # Execute query
         typer.echo(f"Executing query: {sql}")
-        query_result = db_manager.execute_query(sql)
         
-        if not query_result.success:
-            typer.echo(f"Error executing query: {query_result.error}", err=True)
-            raise typer.Exit(1)
-        
-        # Display or export results
         if output:
-            # Export to file
-            export_result = result_exporter.export_result(
-                query_result.data,
+            # Stream the result straight to the file in Arrow record batches
+            export_result = result_exporter.export_query(
+                db_manager.connection,
+                sql,
                 output,
-                format_type
+                result_exporter.EXTENSION_FORMATS.get(f".{format_type}", format_type)
             )
             
             if export_result.success:
@@ -217,18 +211,24 @@ def query_command(
                 typer.echo(f"Error exporting results: {export_result.error}", err=True)
                 raise typer.Exit(1)
         else:
+            query_result = db_manager.execute_query(sql, return_arrow=True)
+            
+            if not query_result.success:
+                typer.echo(f"Error executing query: {query_result.error}", err=True)
+                raise typer.Exit(1)
+            
             # Display results to console
             typer.echo(f"Query executed successfully in {query_result.execution_time:.3f}s")
             typer.echo(f"Rows returned: {query_result.row_count}")
             typer.echo("")
             
-            if query_result.data is not None and not query_result.data.empty:
-                # Show first few rows
+            if query_result.row_count > 0:
+                # Only the rows shown are converted to pandas
                 typer.echo("Results (first 10 rows):")
-                typer.echo(query_result.data.head(10).to_string(index=False))
+                typer.echo(query_result.arrow_table.slice(0, 10).to_pandas().to_string(index=False))
                 
-                if len(query_result.data) > 10:
-                    typer.echo(f"... and {len(query_result.data) - 10} more rows")
+                if query_result.row_count > 10:
+                    typer.echo(f"... and {query_result.row_count - 10} more rows")
             else:
                 typer.echo("No results returned")
         
@@ -11,14 +11,100 @@ This module provides:
 
 import json
 import logging
+import queue
+import re
+import threading
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 
 from pydantic import BaseModel, Field
 
 logger = logging.getLogger(__name__)
 
+# Table names following FROM and JOIN keywords
+_TABLE_RE = re.compile(r'(?:FROM|JOIN)\s+([a-zA-Z_][a-zA-Z0-9_]*)', re.IGNORECASE)
+
+# Names defined by a WITH clause, e.g. "WITH recent AS (" or ", totals(n) AS MATERIALIZED ("
+_CTE_RE = re.compile(
+    r'(?:\bWITH(?:\s+RECURSIVE)?|,)\s*([a-zA-Z_][a-zA-Z0-9_]*)\s*(?:\([^)]*\)\s*)?'
+    r'AS\s*(?:(?:NOT\s+)?MATERIALIZED\s*)?\(',
+    re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=None)
+def _load_sqlglot():
+    """Import sqlglot if it is installed; looked up once, when the first query is recorded."""
+    try:
+        import sqlglot
+        return sqlglot
+    except ImportError:
+        return None
+
+
+@lru_cache(maxsize=1024)
+def extract_tables_from_sql(sql: str) -> Tuple[str, ...]:
+    """
+    Extract the names of the tables a query reads or changes.
+    
+    The query is parsed with sqlglot when it is installed (the ``sqlglot``
+    extra), which also finds quoted and schema-qualified names and tables of
+    DDL statements while skipping files and table functions read in FROM.
+    Otherwise, or if sqlglot cannot parse the query, the names following FROM
+    and JOIN keywords are used. Either way names are listed in the order they
+    appear, and names of common table expressions defined in the query are
+    left out.
+    
+    Results are cached per SQL string, since the same query is looked up
+    on success, on error and when tables are dropped, and is often re-run.
+    
+    Args:
+        sql: SQL query text
+        
+    Returns:
+        Tuple of distinct table names
+    """
+    tables = _extract_tables_parsed(sql)
+    if tables is None:
+        cte_names = {match.group(1).lower() for match in _CTE_RE.finditer(sql)}
+        tables = (
+            match.group(1) for match in _TABLE_RE.finditer(sql)
+            if match.group(1).lower() not in cte_names
+        )
+    return tuple(dict.fromkeys(tables))
+
+
+def _extract_tables_parsed(sql: str) -> Optional[List[str]]:
+    """Get the table names from sqlglot's syntax tree, or None if it is unavailable or fails."""
+    sqlglot = _load_sqlglot()
+    if sqlglot is None:
+        return None
+    
+    from sqlglot import exp
+    try:
+        statements = sqlglot.parse(sql, read="duckdb")
+    except sqlglot.errors.SqlglotError as e:
+        logger.debug(f"sqlglot could not parse query, using keyword matching: {e}")
+        return None
+    
+    tables = []
+    for statement in statements:
+        if statement is None:
+            continue
+        cte_names = {cte.alias_or_name.lower() for cte in statement.find_all(exp.CTE)}
+        for table in statement.find_all(exp.Table):
+            # Table functions such as read_csv(...) have no name
+            if not table.name or table.name.lower() in cte_names:
+                continue
+            start = table.this.meta.get("start", 0)
+            if sql[start] == "'":
+                # A file DuckDB reads directly, e.g. FROM 'data.parquet'
+                continue
+            tables.append((start, table.name))
+    return [name for _, name in sorted(tables)]
+
 
 class QueryEntry(BaseModel):
     """A single query entry in the history."""
@@ -66,6 +152,14 @@ class QueryHistory:
         """
         self.storage_path = storage_path or self._get_default_storage_path()
         self.queries: Dict[str, QueryEntry] = {}
+        
+        # Changes are written to disk by a background thread so queries don't wait on I/O
+        self._save_queue: queue.Queue = queue.Queue()
+        self._save_thread: Optional[threading.Thread] = None
+        self._save_lock = threading.Lock()
+        self._save_version = 0
+        self._saved_version = 0
+        
         self.load_history()
         
     def _get_default_storage_path(self) -> Path:
@@ -123,7 +217,7 @@ class QueryHistory:
         )
         
         self.queries[query_id] = entry
-        self.save_history()
+        self._schedule_save()
         
         logger.info(f"Added query to history: {query_id}")
         return query_id
@@ -141,7 +235,7 @@ class QueryHistory:
         """
         if query_id in self.queries:
             self.queries[query_id].is_favorite = is_favorite
-            self.save_history()
+            self._schedule_save()
             logger.info(f"Query {query_id} favorite status: {is_favorite}")
             return True
         return False
@@ -159,7 +253,7 @@ class QueryHistory:
         """
         if query_id in self.queries and tag not in self.queries[query_id].tags:
             self.queries[query_id].tags.append(tag)
-            self.save_history()
+            self._schedule_save()
             return True
         return False
     
@@ -176,7 +270,7 @@ class QueryHistory:
         """
         if query_id in self.queries and tag in self.queries[query_id].tags:
             self.queries[query_id].tags.remove(tag)
-            self.save_history()
+            self._schedule_save()
             return True
         return False
     
@@ -193,7 +287,7 @@ class QueryHistory:
         """
         if query_id in self.queries:
             self.queries[query_id].description = description
-            self.save_history()
+            self._schedule_save()
             return True
         return False
     
@@ -309,7 +403,7 @@ class QueryHistory:
         """
         if query_id in self.queries:
             del self.queries[query_id]
-            self.save_history()
+            self._schedule_save()
             logger.info(f"Deleted query: {query_id}")
             return True
         return False
@@ -333,23 +427,77 @@ class QueryHistory:
             deleted_count = len(self.queries)
             self.queries.clear()
         
-        self.save_history()
+        self._schedule_save()
         logger.info(f"Cleared {deleted_count} queries from history")
         return deleted_count
     
     def save_history(self):
-        """Save history to storage."""
-        try:
-            data = {
-                "version": "1.0",
-                "queries": {qid: q.to_dict() for qid, q in self.queries.items()}
-            }
+        """Save history to storage immediately."""
+        self._save_version += 1
+        self._write_snapshot(self._save_version, dict(self.queries))
+    
+    def close(self, timeout: float = 2.0):
+        """
+        Flush pending background saves and stop the writer thread.
+        
+        Args:
+            timeout: Seconds to wait for outstanding writes
+        """
+        if self._save_thread is not None and self._save_thread.is_alive():
+            self._save_queue.put_nowait(None)
+            self._save_thread.join(timeout)
+        self._save_thread = None
+    
+    def _schedule_save(self):
+        """Queue a snapshot of the history for the background writer."""
+        self._save_version += 1
+        
+        if self._save_thread is None or not self._save_thread.is_alive():
+            self._save_thread = threading.Thread(
+                target=self._save_worker, name="query-history-writer", daemon=True
+            )
+            self._save_thread.start()
+        
+        self._save_queue.put_nowait((self._save_version, dict(self.queries)))
+    
+    def _save_worker(self):
+        """Write queued snapshots until a None sentinel is received."""
+        while True:
+            item = self._save_queue.get()
+            stop = item is None
             
-            with open(self.storage_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # Only the newest of several queued snapshots needs writing
+            while not self._save_queue.empty():
+                newer = self._save_queue.get_nowait()
+                if newer is None:
+                    stop = True
+                else:
+                    item = newer
+            
+            if item is not None:
+                self._write_snapshot(*item)
+            if stop:
+                return
+    
+    def _write_snapshot(self, version: int, queries: Dict[str, QueryEntry]):
+        """Write a history snapshot unless a newer one has already been saved."""
+        with self._save_lock:
+            if version <= self._saved_version:
+                return
+            
+            try:
+                data = {
+                    "version": "1.0",
+                    "queries": {qid: q.to_dict() for qid, q in queries.items()}
+                }
                 
-        except Exception as e:
-            logger.error(f"Failed to save query history: {e}")
+                with open(self.storage_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2, ensure_ascii=False)
+                
+                self._saved_version = version
+                
+            except Exception as e:
+                logger.error(f"Failed to save query history: {e}")
     
     def load_history(self):
         """Load history from storage."""
@@ -385,11 +533,4 @@ class QueryHistory:
     
     def _extract_tables_from_sql(self, sql: str) -> List[str]:
         """Extract table names from SQL query (basic implementation)."""
-        import re
-        
-        # Simple regex to find table names after FROM and JOIN keywords
-        # This is a basic implementation - could be enhanced with proper SQL parsing
-        pattern = r'(?:FROM|JOIN)\s+([a-zA-Z_][a-zA-Z0-9_]*)'
-        matches = re.findall(pattern, sql, re.IGNORECASE)
-        
-        return list(set(matches))  # Remove duplicates
\ No newline at end of file
+        return list(extract_tables_from_sql(sql))
\ No newline at end of file
@@ -0,0 +1,136 @@
+"""
+Query result caching for LocalSQL Explorer.
+
+This module provides:
+- An in-memory LRU cache of query results
+- SQL normalization so formatting-only edits reuse cached results
+- Detection of queries whose results must not be reused
+"""
+
+import logging
+import re
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+from .data_pagination import estimate_dataframe_bytes
+
+logger = logging.getLogger(__name__)
+
+# Functions whose results change between runs, and direct reads of files that may change on disk
+_VOLATILE_SQL_RE = re.compile(
+    r"\b(?:random|uuid|gen_random_uuid|now|today|current_\w+|get_current_\w+|"
+    r"nextval|currval|setseed|read_\w+)\b|'[^']*\.[a-zA-Z]\w*'",
+    re.IGNORECASE
+)
+
+
+class QueryResultCache:
+    """
+    Least-recently-used cache of query results.
+
+    Entries are keyed by normalized SQL and the database's tables version, so
+    any change to the loaded tables makes earlier results unreachable; they are
+    dropped the next time a result is stored.
+    """
+
+    def __init__(self, max_entries: int = 32, max_memory_mb: float = 256.0):
+        """
+        Initialize the result cache.
+
+        Args:
+            max_entries: Maximum number of results kept
+            max_memory_mb: Maximum estimated size of all cached results
+        """
+        self.max_entries = max_entries
+        self.max_bytes = int(max_memory_mb * 1024 * 1024)
+        self._entries: "OrderedDict[Tuple[str, int], Tuple[Any, int]]" = OrderedDict()
+        self._total_bytes = 0
+
+    @staticmethod
+    def normalize_sql(sql: str) -> str:
+        """
+        Normalize SQL so that formatting-only differences share a cache entry.
+
+        Comments and redundant whitespace are removed and keywords upper-cased;
+        identifiers and string literals are left as written.
+        """
+        import sqlparse  # Deferred until the first query; not needed to show the window
+        
+        # Whitespace is collapsed in a second pass so removed comments leave no gaps
+        formatted = sqlparse.format(sql, strip_comments=True)
+        formatted = sqlparse.format(formatted, strip_whitespace=True, keyword_case='upper')
+        return formatted.strip().rstrip(';').strip()
+
+    @staticmethod
+    def is_cacheable(sql: str) -> bool:
+        """Check whether a query's result can safely be reused."""
+        statement = sql.strip().rstrip(';')
+        if ';' in statement or not statement.upper().startswith(('SELECT', 'WITH')):
+            return False
+        return _VOLATILE_SQL_RE.search(sql) is None
+
+    def get(self, sql: str, tables_version: int) -> Optional[Any]:
+        """
+        Get a cached result.
+
+        Args:
+            sql: SQL query text
+            tables_version: Current tables version of the database
+
+        Returns:
+            The cached result, or None if there is none
+        """
+        if not self.is_cacheable(sql):
+            # Never stored, so skip normalizing the SQL
+            return None
+
+        key = (self.normalize_sql(sql), tables_version)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        self._entries.move_to_end(key)
+        logger.debug(f"Result cache hit: {sql[:100]}")
+        return entry[0]
+
+    def put(self, sql: str, tables_version: int, result: Any) -> None:
+        """
+        Cache a query result, evicting least recently used entries when full.
+
+        Args:
+            sql: SQL query text
+            tables_version: Tables version the query ran against
+            result: Query result to cache; its ``data`` DataFrame is sized
+        """
+        if not self.is_cacheable(sql):
+            return
+
+        size = estimate_dataframe_bytes(result.data) if result.data is not None else 0
+        if size > self.max_bytes:
+            return
+
+        # Results for other tables versions can no longer be looked up
+        for stale_key in [k for k in self._entries if k[1] != tables_version]:
+            self._remove(stale_key)
+
+        key = (self.normalize_sql(sql), tables_version)
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (result, size)
+        self._total_bytes += size
+
+        while len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        """Remove all cached results."""
+        self._entries.clear()
+        self._total_bytes = 0
+
+    def _remove(self, key: Tuple[str, int]) -> None:
+        """Remove an entry and release its size from the total."""
+        _, size = self._entries.pop(key)
+        self._total_bytes -= size
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -11,13 +11,13 @@ This module provides comprehensive data profiling including:
 
 import logging
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
 from pydantic import BaseModel, Field
 
-from .column_analysis import ColumnAnalyzer, TableColumnAnalysis
+from .column_analysis import ColumnAnalyzer, ColumnMetadata, TableColumnAnalysis
 
 logger = logging.getLogger(__name__)
 
@@ -169,32 +169,47 @@ class TableProfiler:
         """Initialize table profiler."""
         self.column_analyzer = ColumnAnalyzer()
     
-    def profile_table(self, df: pd.DataFrame, table_name: str) -> TableProfilingReport:
+    def profile_table(self, df: pd.DataFrame, table_name: str,
+                      progress_callback: Optional[Callable[[str, int], None]] = None) -> TableProfilingReport:
         """
         Perform comprehensive profiling of a table.
         
         Args:
             df: DataFrame to profile
             table_name: Name of the table
+            progress_callback: Optional callback for (message, percentage) updates
+                as each stage of the profile starts
             
         Returns:
             TableProfilingReport: Comprehensive profiling report
         """
         logger.info(f"Starting comprehensive profiling for table: {table_name}")
         
+        def report_progress(message: str, percentage: int):
+            if progress_callback:
+                progress_callback(message, percentage)
+        
+        def column_done(column: ColumnMetadata, done: int, total: int):
+            report_progress(f"Analyzed column '{column.name}' ({done}/{total})", 10 + 40 * done // total)
+        
         # Start with column analysis
-        column_analysis = self.column_analyzer.analyze_table(df, table_name)
+        report_progress("Analyzing column statistics...", 10)
+        column_analysis = self.column_analyzer.analyze_table(df, table_name, column_done)
         
         # Perform distribution analysis
+        report_progress("Generating distribution analysis...", 50)
         distributions = self._analyze_distributions(df)
         
         # Perform correlation analysis
+        report_progress("Calculating correlations...", 70)
         correlations = self._analyze_correlations(df)
         
         # Perform pattern analysis
+        report_progress("Detecting patterns...", 85)
         patterns = self._analyze_patterns(df)
         
         # Generate quality report
+        report_progress("Compiling report...", 95)
         quality_report = self._generate_quality_report(df, table_name, column_analysis)
         
         # Generate insights
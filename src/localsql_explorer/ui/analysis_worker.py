@@ -0,0 +1,74 @@
+"""
+Background table analysis workers for LocalSQL Explorer.
+
+Loads table data and runs column analysis off the UI thread so large tables
+do not freeze the window while they are read and summarized.
+"""
+
+import logging
+
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from ..database import DatabaseManager
+
+logger = logging.getLogger(__name__)
+
+
+class ColumnAnalysisWorker(QThread):
+    """
+    Worker thread that analyzes the columns of a table.
+    
+    Signals:
+        column_analyzed: Emitted with (column_name, columns_done, total_columns)
+            as each column's statistics are computed
+        analysis_finished: Emitted with the TableColumnAnalysis, or None if the
+            table could not be analyzed
+        analysis_error: Emitted with an error message if analysis failed
+    """
+    
+    column_analyzed = pyqtSignal(str, int, int)  # column name, done, total
+    analysis_finished = pyqtSignal(object)  # TableColumnAnalysis or None
+    analysis_error = pyqtSignal(str)
+    
+    def __init__(self, db_manager: DatabaseManager, table_name: str, parent=None):
+        super().__init__(parent)
+        self.db_manager = db_manager
+        self.table_name = table_name
+    
+    def run(self):
+        """Analyze the table's columns in a background thread."""
+        try:
+            analysis = self.db_manager.analyze_table_columns(
+                self.table_name,
+                lambda column, done, total: self.column_analyzed.emit(column.name, done, total)
+            )
+            self.analysis_finished.emit(analysis)
+        except Exception as e:
+            logger.error(f"Column analysis failed for '{self.table_name}': {e}")
+            self.analysis_error.emit(str(e))
+
+
+class TableLoadWorker(QThread):
+    """
+    Worker thread that reads a complete table into a DataFrame.
+    
+    Signals:
+        data_loaded: Emitted with the DataFrame, or None if the table could not be read
+        load_error: Emitted with an error message if loading failed
+    """
+    
+    data_loaded = pyqtSignal(object)  # DataFrame or None
+    load_error = pyqtSignal(str)
+    
+    def __init__(self, db_manager: DatabaseManager, table_name: str, parent=None):
+        super().__init__(parent)
+        self.db_manager = db_manager
+        self.table_name = table_name
+    
+    def run(self):
+        """Load the table in a background thread."""
+        try:
+            self.data_loaded.emit(self.db_manager.get_table_dataframe(self.table_name))
+        except Exception as e:
+            logger.error(f"Failed to load table '{self.table_name}': {e}")
+            self.load_error.emit(str(e))
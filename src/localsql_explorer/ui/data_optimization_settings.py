@@ -43,6 +43,7 @@ class DataOptimizationSettingsDialog(QDialog):
             default_page_size=self.config.default_page_size,
             max_page_size=self.config.max_page_size,
             min_page_size=self.config.min_page_size,
+            pagination_threshold=self.config.pagination_threshold,
             memory_threshold_mb=self.config.memory_threshold_mb,
             warning_threshold_mb=self.config.warning_threshold_mb,
             chunk_size=self.config.chunk_size,
@@ -130,7 +131,7 @@ class DataOptimizationSettingsDialog(QDialog):
         auto_layout = QFormLayout(auto_group)
         
         self.pagination_threshold_spin = QSpinBox()
-        self.pagination_threshold_spin.setRange(1000, 1000000)
+        self.pagination_threshold_spin.setRange(100, 1000000)
         self.pagination_threshold_spin.setSuffix(" rows")
         auto_layout.addRow("Enable pagination when result exceeds:", self.pagination_threshold_spin)
         
@@ -251,6 +252,7 @@ class DataOptimizationSettingsDialog(QDialog):
         self.default_page_size_spin.setValue(self.config.default_page_size)
         self.min_page_size_spin.setValue(self.config.min_page_size)
         self.max_page_size_spin.setValue(self.config.max_page_size)
+        self.pagination_threshold_spin.setValue(self.config.pagination_threshold)
         
         # Memory settings
         self.memory_threshold_spin.setValue(self.config.memory_threshold_mb)
@@ -271,7 +273,6 @@ class DataOptimizationSettingsDialog(QDialog):
         self.preload_adjacent_cb.setChecked(False)
         
         # Default values for new settings
-        self.pagination_threshold_spin.setValue(10000)
         self.cache_size_spin.setValue(5)
     
     def save_settings(self) -> PaginationConfig:
@@ -284,6 +285,7 @@ class DataOptimizationSettingsDialog(QDialog):
         self.config.default_page_size = self.default_page_size_spin.value()
         self.config.min_page_size = self.min_page_size_spin.value()
         self.config.max_page_size = self.max_page_size_spin.value()
+        self.config.pagination_threshold = self.pagination_threshold_spin.value()
         self.config.memory_threshold_mb = self.memory_threshold_spin.value()
         self.config.warning_threshold_mb = self.warning_threshold_spin.value()
         self.config.max_memory_usage_mb = self.max_memory_spin.value()
@@ -355,6 +357,7 @@ class DataOptimizationSettingsDialog(QDialog):
             current.default_page_size != self.original_config.default_page_size or
             current.min_page_size != self.original_config.min_page_size or
             current.max_page_size != self.original_config.max_page_size or
+            current.pagination_threshold != self.original_config.pagination_threshold or
             current.memory_threshold_mb != self.original_config.memory_threshold_mb or
             current.warning_threshold_mb != self.original_config.warning_threshold_mb or
             current.max_memory_usage_mb != self.original_config.max_memory_usage_mb or
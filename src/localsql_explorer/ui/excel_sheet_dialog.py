@@ -6,6 +6,7 @@ This module provides the ExcelSheetSelectionDialog class which allows users to:
 - Select one, multiple, or all worksheets for import
 - Preview worksheet data and metadata
 - Configure table naming for imported sheets
+- Apply the choice to the remaining Excel files of a multi-file import
 """
 
 import logging
@@ -64,13 +65,25 @@ class ExcelSheetSelectionDialog(QDialog):
     - Data preview for selected sheets
     - Table naming configuration
     - Select All/None buttons
+    - Optional "apply to remaining files" choice for multi-file imports
     """
     
-    def __init__(self, file_path: str, sheet_infos: List[SheetInfo], parent=None):
+    def __init__(self, file_path: str, sheet_infos: List[SheetInfo], parent=None, remaining_files: int = 0):
+        """
+        Initialize the dialog.
+        
+        Args:
+            file_path: Path to the Excel file
+            sheet_infos: Information about each worksheet
+            parent: Parent widget
+            remaining_files: Excel files still to import after this one; when
+                non-zero the choice can be applied to them as well
+        """
         super().__init__(parent)
         
         self.file_path = Path(file_path)
         self.sheet_infos = sheet_infos
+        self.remaining_files = remaining_files
         self.selected_sheets = []
         
         self.setWindowTitle(f"Import Excel Worksheets - {self.file_path.name}")
@@ -165,6 +178,15 @@ class ExcelSheetSelectionDialog(QDialog):
         
         # Bottom buttons
         button_layout = QHBoxLayout()
+        
+        self.apply_to_remaining_check = None
+        if self.remaining_files > 0:
+            self.apply_to_remaining_check = QCheckBox(
+                f"Apply to the remaining {self.remaining_files} Excel "
+                f"{'file' if self.remaining_files == 1 else 'files'}"
+            )
+            button_layout.addWidget(self.apply_to_remaining_check)
+        
         button_layout.addStretch()
         
         self.cancel_btn = QPushButton("Cancel")
@@ -268,6 +290,14 @@ class ExcelSheetSelectionDialog(QDialog):
         else:
             self.import_btn.setText(f"Import {selected_count} Sheets")
         
+        # Only "all sheets" and "first sheet" carry over to other files
+        if self.apply_to_remaining_check is not None:
+            applicable = self._selection_policy() is not None
+            self.apply_to_remaining_check.setEnabled(applicable)
+            self.apply_to_remaining_check.setToolTip(
+                "" if applicable else "Select all sheets or only the first sheet to apply to other files"
+            )
+        
         # Update naming preview
         self.update_naming_preview()
     
@@ -320,6 +350,31 @@ class ExcelSheetSelectionDialog(QDialog):
         """Get the base table name from user input."""
         return self.base_name_edit.text().strip() or self.file_path.stem
     
+    def get_sheet_policy(self) -> Optional[str]:
+        """
+        Get the choice to apply to the remaining Excel files, once the dialog has closed.
+        
+        Returns:
+            "all_sheets", "first_sheet", "skip" if the dialog was cancelled, or
+            None if the choice is not to be applied to other files
+        """
+        check = self.apply_to_remaining_check
+        if check is None or not check.isEnabled() or not check.isChecked():
+            return None
+        if self.result() != QDialog.DialogCode.Accepted:
+            return "skip"
+        return self._selection_policy()
+    
+    def _selection_policy(self) -> Optional[str]:
+        """Describe the current selection in a form that applies to other files."""
+        non_empty_names = [sheet_info.name for sheet_info in self.sheet_infos if not sheet_info.is_empty]
+        selected_names = self.get_selected_sheet_names()
+        if selected_names and selected_names == non_empty_names:
+            return "all_sheets"
+        if non_empty_names and selected_names == non_empty_names[:1]:
+            return "first_sheet"
+        return None
+    
     def _sanitize_name(self, name: str) -> str:
         """Sanitize a name for SQL table usage."""
         import re
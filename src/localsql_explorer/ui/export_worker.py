@@ -0,0 +1,122 @@
+"""
+Background export worker for LocalSQL Explorer.
+
+Writes query results and DataFrames to files on the global thread pool so
+the UI stays responsive while large exports are written.
+"""
+
+import logging
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+from ..database import DatabaseManager
+from ..exporter import ExportOptions, ExportResult, ResultExporter
+
+logger = logging.getLogger(__name__)
+
+
+class ExportSignals(QObject):
+    """
+    Signals emitted by an ExportRunnable.
+
+    Signals:
+        progress: Emitted with the number of rows written so far
+        finished: Emitted with the ExportResult when the export ends
+    """
+
+    progress = pyqtSignal(int)  # rows written
+    finished = pyqtSignal(object)  # ExportResult
+
+
+def _failed_result(file_path, format_type: Optional[str], error: Exception) -> ExportResult:
+    """Build the result reported when an export raises."""
+    logger.error(f"Background export failed: {error}", exc_info=True)
+    return ExportResult(
+        success=False,
+        file_path=str(file_path),
+        file_type=format_type or Path(file_path).suffix.lstrip('.') or 'unknown',
+        error=str(error)
+    )
+
+
+class ExportRunnable(QRunnable):
+    """Runnable that streams the result of a query to a file."""
+
+    def __init__(self, exporter: ResultExporter, db_manager: DatabaseManager, sql: str, file_path: str,
+                 format_type: Optional[str] = None, options: Optional[ExportOptions] = None):
+        """
+        Initialize the export runnable.
+
+        Args:
+            exporter: Result exporter used to write the file
+            db_manager: Database manager whose session the query runs in
+            sql: SQL query whose result is exported
+            file_path: Output file path
+            format_type: Optional format override ('csv', 'excel', 'parquet')
+            options: Export options
+        """
+        super().__init__()
+        self.exporter = exporter
+        self.db_manager = db_manager
+        self.sql = sql
+        self.file_path = file_path
+        self.format_type = format_type
+        self.options = options
+        self.signals = ExportSignals()
+
+    def run(self):
+        """Write the export on a pool thread."""
+        try:
+            # A cursor unless the query depends on the session, which holds the
+            # main connection so no other statement ends the result mid-export
+            with self.db_manager.query_connection() as connection:
+                result = self.exporter.export_query(
+                    connection,
+                    self.sql,
+                    self.file_path,
+                    self.format_type,
+                    self.options,
+                    progress_callback=self.signals.progress.emit
+                )
+        except Exception as e:
+            result = _failed_result(self.file_path, self.format_type, e)
+
+        self.signals.finished.emit(result)
+
+
+class DataFrameExportRunnable(QRunnable):
+    """Runnable that writes a DataFrame to a file."""
+
+    def __init__(self, exporter: ResultExporter, dataframe: pd.DataFrame, file_path: str,
+                 format_type: Optional[str] = None, options: Optional[ExportOptions] = None):
+        """
+        Initialize the export runnable.
+
+        Args:
+            exporter: Result exporter used to write the file
+            dataframe: DataFrame to export; it must not be modified while the export runs
+            file_path: Output file path
+            format_type: Optional format override ('csv', 'excel', 'parquet')
+            options: Export options
+        """
+        super().__init__()
+        self.exporter = exporter
+        self.dataframe = dataframe
+        self.file_path = file_path
+        self.format_type = format_type
+        self.options = options
+        self.signals = ExportSignals()
+
+    def run(self):
+        """Write the export on a pool thread."""
+        try:
+            result = self.exporter.export_result(self.dataframe, self.file_path, self.format_type, self.options)
+        except Exception as e:
+            result = _failed_result(self.file_path, self.format_type, e)
+
+        # Let the frame go now rather than while the outcome is shown in a modal dialog
+        self.dataframe = None
+        self.signals.finished.emit(result)
@@ -0,0 +1,180 @@
+"""
+Background import workers for LocalSQL Explorer.
+
+Reads files and workbook metadata off the UI thread so importing a large
+file does not freeze the window.
+"""
+
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Optional
+
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from ..database import DatabaseManager
+from ..importer import FileImporter
+
+logger = logging.getLogger(__name__)
+
+
+class SheetDetectWorker(QThread):
+    """
+    Worker thread that detects the worksheets of an Excel file.
+    
+    Signals:
+        sheet_infos_ready: Emitted with the list of SheetInfo objects
+        detect_error: Emitted with an error message if the file could not be analyzed
+    """
+    
+    sheet_infos_ready = pyqtSignal(list)  # List[SheetInfo]
+    detect_error = pyqtSignal(str)
+    
+    def __init__(self, file_importer: FileImporter, file_path: str, parent=None):
+        super().__init__(parent)
+        self.file_importer = file_importer
+        self.file_path = file_path
+    
+    def run(self):
+        """Detect the workbook's sheets in a background thread."""
+        try:
+            self.sheet_infos_ready.emit(self.file_importer.detect_excel_sheets(self.file_path))
+        except Exception as e:
+            logger.error(f"Sheet detection failed for '{self.file_path}': {e}")
+            self.detect_error.emit(str(e))
+
+
+class FileImportWorker(QThread):
+    """
+    Worker thread that reads a file, or selected sheets of an Excel file.
+    
+    Signals:
+        import_finished: Emitted with the ImportResult, or the BatchImportResult
+            when sheet names were given
+        import_error: Emitted with an error message if reading failed
+    """
+    
+    import_finished = pyqtSignal(object)  # ImportResult or BatchImportResult
+    import_error = pyqtSignal(str)
+    
+    def __init__(self, file_importer: FileImporter, file_path: str,
+                 sheet_names=None, base_table_name=None, parent=None):
+        super().__init__(parent)
+        self.file_importer = file_importer
+        self.file_path = file_path
+        self.sheet_names = sheet_names
+        self.base_table_name = base_table_name
+    
+    def run(self):
+        """Read the file in a background thread."""
+        try:
+            if self.sheet_names:
+                result = self.file_importer.import_excel_multiple_sheets(
+                    self.file_path, self.sheet_names, self.base_table_name
+                )
+            else:
+                result = self.file_importer.import_file(self.file_path)
+            self.import_finished.emit(result)
+        except Exception as e:
+            logger.error(f"Import failed for '{self.file_path}': {e}")
+            self.import_error.emit(str(e))
+
+
+class CombinedFileImportWorker(QThread):
+    """
+    Worker thread that loads several CSV or Parquet files into one table.
+    
+    Signals:
+        table_loaded: Emitted with the TableMetadata of the created table;
+            record it with DatabaseManager.add_tables
+        load_error: Emitted with an error message if DuckDB could not read the files
+    """
+    
+    table_loaded = pyqtSignal(object)  # TableMetadata
+    load_error = pyqtSignal(str)
+    
+    def __init__(self, db_manager: DatabaseManager, table_name: str, file_paths: List[str],
+                 file_type: str, parent=None):
+        super().__init__(parent)
+        self.db_manager = db_manager
+        self.table_name = table_name
+        self.file_paths = file_paths
+        self.file_type = file_type
+    
+    def run(self):
+        """Scan all the files into one table in a background thread."""
+        try:
+            self.table_loaded.emit(
+                self.db_manager.create_table_from_files(self.table_name, self.file_paths, self.file_type)
+            )
+        except Exception as e:
+            logger.error(f"Combined import of {len(self.file_paths)} files failed: {e}")
+            self.load_error.emit(str(e))
+
+
+class BatchFileImportWorker(QThread):
+    """
+    Worker thread that reads several files in parallel.
+    
+    Given a database manager and table names, CSV and Parquet files are loaded
+    straight into DuckDB tables with its native readers; files DuckDB cannot
+    read, or all files without a database, are read into DataFrames instead.
+    Both paths release the GIL while parsing, so files are read on a thread
+    pool and a batch takes about as long as its slowest files rather than the
+    sum of all of them.
+    
+    Signals:
+        table_loaded: Emitted with (position in file_paths, TableMetadata) when a
+            file was loaded into a table; record it with DatabaseManager.add_tables
+        file_imported: Emitted with (position in file_paths, ImportResult) when a
+            file was read into a DataFrame
+        file_failed: Emitted with (position in file_paths, error message) if reading raised
+    """
+    
+    table_loaded = pyqtSignal(int, object)  # index, TableMetadata
+    file_imported = pyqtSignal(int, object)  # index, ImportResult
+    file_failed = pyqtSignal(int, str)  # index, error message
+    
+    MAX_WORKERS = 8
+    
+    def __init__(self, file_importer: FileImporter, file_paths: List[str],
+                 db_manager: Optional[DatabaseManager] = None,
+                 table_names: Optional[List[str]] = None, parent=None):
+        super().__init__(parent)
+        self.file_importer = file_importer
+        self.file_paths = file_paths
+        self.db_manager = db_manager
+        self.table_names = table_names
+    
+    def run(self):
+        """Read the files on a thread pool, reporting each as it completes."""
+        max_workers = min(self.MAX_WORKERS, os.cpu_count() or 1, len(self.file_paths))
+        with ThreadPoolExecutor(max_workers=max(max_workers, 1)) as executor:
+            futures = {
+                executor.submit(self._read_file, index): index
+                for index in range(len(self.file_paths))
+            }
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    signal, outcome = future.result()
+                    signal.emit(index, outcome)
+                except Exception as e:
+                    logger.error(f"Import failed for '{self.file_paths[index]}': {e}")
+                    self.file_failed.emit(index, str(e))
+    
+    def _read_file(self, index: int):
+        """Load one file into a table if possible, otherwise into a DataFrame."""
+        file_path = self.file_paths[index]
+        if self.db_manager is not None and self.table_names is not None:
+            file_type = self.file_importer.detect_file_type(file_path)
+            if file_type in DatabaseManager.NATIVE_READERS:
+                try:
+                    metadata = self.db_manager.create_table_from_file(
+                        self.table_names[index], file_path, file_type
+                    )
+                    return self.table_loaded, metadata
+                except Exception as e:
+                    logger.info(f"DuckDB could not read '{file_path}', reading it with pandas: {e}")
+        
+        return self.file_imported, self.file_importer.import_file(file_path)
@@ -5,14 +5,17 @@ This module provides the MainWindow class which serves as the primary applicatio
 and coordinates all UI components including the table list, SQL editor, and results view.
 """
 
+import importlib
 import logging
 import sys
+import time
+import weakref
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Dict
 
 import pandas as pd
 
-from PyQt6.QtCore import QSettings, QSize, Qt, pyqtSignal
+from PyQt6.QtCore import QEventLoop, QRunnable, QSettings, QSize, QThreadPool, QTimer, Qt, pyqtSignal
 from PyQt6.QtGui import QAction, QIcon, QKeySequence
 from PyQt6.QtWidgets import (
     QApplication,
@@ -32,8 +35,9 @@ from PyQt6.QtWidgets import (
     QLabel,
 )
 
-from ..database import DatabaseManager
-from ..exporter import ResultExporter
+from ..data_pagination import PaginationConfig, estimate_dataframe_bytes
+from ..database import DatabaseManager, QueryResult, TableMetadata
+from ..exporter import ExportOptions, ResultExporter
 from ..importer import FileImporter
 from ..models import AppConfig, UserPreferences
 from .results_view import ResultsTableView
@@ -43,15 +47,42 @@ from .tabbed_sql_editor import TabbedSQLEditor
 from .table_list import TableListWidget
 from .excel_sheet_dialog import ExcelSheetSelectionDialog
 from .export_dialog import ExportOptionsDialog
+from .analysis_worker import ColumnAnalysisWorker, TableLoadWorker
+from .export_worker import DataFrameExportRunnable, ExportRunnable
+from .import_worker import BatchFileImportWorker, CombinedFileImportWorker, FileImportWorker, SheetDetectWorker
 from .progress_dialog import DatabaseSaveDialog, DatabaseLoadDialog
 from .query_dialogs import QueryErrorDialog, QueryMetricsDialog
 from .query_history_panel import QueryHistoryPanel
-from .query_worker import QueryWorker, PaginatedQueryWorker, MultiQueryWorker
-from ..query_history import QueryHistory
+from .query_worker import QueryRunnable, MultiQueryWorker
+from ..query_history import QueryHistory, extract_tables_from_sql
+from ..result_cache import QueryResultCache
 from ..themes import theme_manager, ThemeType
 
 logger = logging.getLogger(__name__)
 
+# Dialog modules imported on first use; loaded ahead of time to avoid a first-click stall
+_PRELOADED_DIALOG_MODULES = (
+    ".column_metadata_dialog",
+    ".table_profiling_dialog",
+    ".data_optimization_settings",
+)
+
+
+class _ModulePreloader(QRunnable):
+    """Imports modules on a pool thread so their first use does not block the UI."""
+    
+    def __init__(self, module_names, package: str):
+        super().__init__()
+        self.module_names = module_names
+        self.package = package
+    
+    def run(self):
+        for module_name in self.module_names:
+            try:
+                importlib.import_module(module_name, self.package)
+            except Exception as e:
+                logger.debug(f"Could not preload {module_name}: {e}")
+
 
 class MainWindow(QMainWindow):
     """
@@ -70,6 +101,47 @@ class MainWindow(QMainWindow):
     query_executed = pyqtSignal(str, bool)  # SQL, success
     database_loaded = pyqtSignal(str)  # Database path
     
+    # Queries above either limit get a "View metrics" link in the status bar
+    METRICS_LINK_ROWS = 1000
+    METRICS_LINK_SECONDS = 1.0
+    METRICS_SAMPLE_ROWS = 100  # Rows kept for metrics after the last result is released
+    
+    # Minimum seconds between progress updates during bulk operations (about 30 per second)
+    PROGRESS_INTERVAL = 0.033
+    
+    # Child widget signals and the slots they drive, connected as each widget is created
+    _SIGNAL_CONNECTIONS = {
+        'sql_editor': [
+            ('query_requested', 'run_query'),
+            ('all_queries_requested', 'run_all_queries'),
+        ],
+        'results_view': [
+            ('export_requested', 'export_results'),
+            ('export_filtered_requested', 'export_filtered_results_from_view'),
+        ],
+        'paginated_results': [
+            ('export_requested', 'export_results'),
+            ('export_all_requested', 'export_all_results'),
+            ('export_filtered_requested', 'export_filtered_results_from_view'),
+            ('status_updated', 'update_status'),
+            ('metrics_requested', 'show_paginated_metrics'),
+        ],
+        'table_list': [
+            ('table_selected', 'on_table_selected'),
+            ('table_preview_requested', 'preview_table'),
+            ('table_renamed', 'on_table_renamed'),
+            ('table_dropped', 'on_table_dropped'),
+            ('table_column_analysis_requested', 'show_column_analysis'),
+            ('table_profiling_requested', 'show_table_profiling'),
+            ('files_dropped', 'import_dropped_files'),
+            ('import_files_requested', 'import_multiple_files'),
+        ],
+        'query_history_panel': [
+            ('query_selected', 'load_query_from_history'),
+            ('query_edited', 'replace_query_from_history'),
+        ],
+    }
+    
     def __init__(self, config: Optional[AppConfig] = None):
         """
         Initialize the main window.
@@ -102,7 +174,7 @@ class MainWindow(QMainWindow):
         self.splitter: Optional[QSplitter] = None
         
         # Large data settings
-        self.pagination_threshold = 10000  # Use pagination for results > 10k rows
+        self.pagination_threshold = PaginationConfig.pagination_threshold  # Paginate larger results
         self.current_results_mode = "standard"  # "standard" or "paginated"
         
         # Settings
@@ -110,17 +182,67 @@ class MainWindow(QMainWindow):
         
         # Query tracking for metrics
         self.last_query_sql = ""
-        self.last_query_result = None
+        self._last_query_ref: Optional[weakref.ref] = None  # The results view keeps the frame alive
+        self._last_query_sample: Optional[pd.DataFrame] = None  # Used once the frame is released
         self.last_query_time = 0.0
-        
-        # Background query execution
-        self.query_worker: Optional[QueryWorker] = None
-        self.paginated_worker: Optional[PaginatedQueryWorker] = None
+        self._last_tables_used: Optional[set] = None  # Lower-cased, filled lazily
+        self._memory_estimate: Optional[tuple] = None  # (weakref to result frame, estimated bytes)
+        
+        # Bursts of status indicator updates (e.g. one per imported sheet) refresh once
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(100)
+        self._status_timer.timeout.connect(self._do_update_status_indicators)
+        
+        # Progress updates skipped by the throttle; the latest is applied once the interval passes
+        self._last_progress_ts = 0.0
+        self._pending_progress: Optional[tuple] = None  # (update callable, args)
+        self._progress_flush_timer = QTimer(self)
+        self._progress_flush_timer.setSingleShot(True)
+        self._progress_flush_timer.timeout.connect(self._flush_progress)
+        self._progress_last_msg: Optional[str] = None
+        self._progress_last_pct = -1
+        
+        # Results of recent unpaginated queries, reused while the tables are unchanged
+        self.result_cache = QueryResultCache()
+        self._query_tables_version = 0  # Tables version the running query started against
+        
+        # Background query execution; queries reuse pooled threads
+        self.query_pool = QThreadPool(self)
+        self.query_pool.setMaxThreadCount(2)  # A cancelled query may still be unwinding
+        self.query_worker: Optional[QueryRunnable] = None
+        self._pending_query_sql: Optional[str] = None  # Runs once a cancelled query has stopped
         self.multi_query_worker: Optional[MultiQueryWorker] = None
+        self._export_runnable: Optional[QRunnable] = None
+        self._analysis_worker: Optional[ColumnAnalysisWorker] = None
+        self._table_load_worker: Optional[TableLoadWorker] = None
+        self._importing = False  # Imports wait for workers in a local event loop
+        self._excel_sheet_policy: Optional[str] = None  # Sheet choice applied to the rest of a batch
+        
+        # Message boxes reused for routine notifications, keyed by icon
+        self._message_boxes: dict = {}
+        
+        # Tables version and columns the auto-completion schema was last built from
+        self._schema_cache_key: Optional[int] = None
+        self._schema_columns: Optional[Dict[str, List[str]]] = None
+        
+        # Schema refreshes requested in quick succession are applied once
+        self._schema_timer = QTimer(self)
+        self._schema_timer.setSingleShot(True)
+        self._schema_timer.setInterval(100)
+        self._schema_timer.timeout.connect(self._do_update_schema_info)
+        self._schema_force_pending = False
         
         self.init_ui()
         self.init_database()
         self.restore_window_state()
+        
+        # Load dialog modules in the background once the event loop is running
+        QTimer.singleShot(0, self._preload_heavy_dialogs)
+    
+    def _preload_heavy_dialogs(self):
+        """Import rarely used dialog modules on a worker thread."""
+        QThreadPool.globalInstance().start(_ModulePreloader(_PRELOADED_DIALOG_MODULES, __package__))
     
     def init_ui(self):
         """Initialize the user interface."""
@@ -159,11 +281,11 @@ class MainWindow(QMainWindow):
         file_menu = menubar.addMenu("&File")
         
         # Import action
-        import_action = QAction("&Import File...", self)
-        import_action.setShortcut(QKeySequence("Ctrl+I"))
-        import_action.setStatusTip("Import CSV, Excel, or Parquet file")
-        import_action.triggered.connect(self.import_file)
-        file_menu.addAction(import_action)
+        self.import_action = QAction("&Import File...", self)
+        self.import_action.setShortcut(QKeySequence("Ctrl+I"))
+        self.import_action.setStatusTip("Import CSV, Excel, or Parquet file")
+        self.import_action.triggered.connect(self.import_file)
+        file_menu.addAction(self.import_action)
         
         file_menu.addSeparator()
         
@@ -233,6 +355,13 @@ class MainWindow(QMainWindow):
         self.run_query_action.triggered.connect(self.run_query)
         query_menu.addAction(self.run_query_action)
         
+        self.cancel_query_action = QAction("C&ancel Query", self)
+        self.cancel_query_action.setShortcut(QKeySequence("Shift+F5"))
+        self.cancel_query_action.setStatusTip("Interrupt the running query")
+        self.cancel_query_action.triggered.connect(self.cancel_query)
+        self.cancel_query_action.setEnabled(False)
+        query_menu.addAction(self.cancel_query_action)
+        
         query_menu.addSeparator()
         
         clear_editor_action = QAction("&Clear Editor", self)
@@ -272,6 +401,11 @@ class MainWindow(QMainWindow):
         show_metrics_action.triggered.connect(self.show_last_query_metrics)
         query_menu.addAction(show_metrics_action)
         
+        refresh_schema_action = QAction("Refresh &Schema", self)
+        refresh_schema_action.setStatusTip("Reload table and column names for auto-completion")
+        refresh_schema_action.triggered.connect(self.refresh_schema)
+        query_menu.addAction(refresh_schema_action)
+        
         # View Menu
         view_menu = menubar.addMenu("&View")
         
@@ -311,7 +445,7 @@ class MainWindow(QMainWindow):
         toolbar.setMovable(False)
         
         # Add main actions to toolbar
-        toolbar.addAction(self.findChild(QAction, "") or QAction("Import", self))
+        toolbar.addAction(self.import_action)
         toolbar.addSeparator()
         toolbar.addAction(self.run_query_action)
     
@@ -325,20 +459,14 @@ class MainWindow(QMainWindow):
         
         # Create tabbed SQL editor
         self.sql_editor = TabbedSQLEditor(self.config.preferences)
-        self.sql_editor.query_requested.connect(self.run_query)
-        self.sql_editor.all_queries_requested.connect(self.run_all_queries)
+        self._connect_signals('sql_editor')
         
         # Create results views (standard and paginated)
         self.results_view = ResultsTableView()
-        self.results_view.export_requested.connect(self.export_results)
-        self.results_view.export_filtered_requested.connect(self.export_filtered_results_from_view)
+        self._connect_signals('results_view')
         
         self.paginated_results = PaginatedTableWidget()
-        self.paginated_results.export_requested.connect(self.export_results)
-        self.paginated_results.export_all_requested.connect(self.export_all_results)
-        self.paginated_results.export_filtered_requested.connect(self.export_filtered_results_from_view)
-        self.paginated_results.status_updated.connect(self.update_status)
-        self.paginated_results.metrics_requested.connect(self.show_paginated_metrics)
+        self._connect_signals('paginated_results')
         
         # Create a stacked widget to manage results views
         self.results_stack = QStackedWidget()
@@ -366,16 +494,7 @@ class MainWindow(QMainWindow):
         # Table list dock
         self.table_dock = QDockWidget("Tables", self)
         self.table_list = TableListWidget()
-        self.table_list.table_selected.connect(self.on_table_selected)
-        self.table_list.table_preview_requested.connect(self.preview_table)
-        self.table_list.table_renamed.connect(self.on_table_renamed)
-        self.table_list.table_dropped.connect(self.on_table_dropped)
-        self.table_list.table_column_analysis_requested.connect(self.show_column_analysis)
-        self.table_list.table_profiling_requested.connect(self.show_table_profiling)
-        
-        # Connect new drag-and-drop signals
-        self.table_list.files_dropped.connect(self.import_dropped_files)
-        self.table_list.import_files_requested.connect(self.import_multiple_files)
+        self._connect_signals('table_list')
         
         self.table_dock.setWidget(self.table_list)
         self.table_dock.setFeatures(
@@ -388,8 +507,7 @@ class MainWindow(QMainWindow):
         # Query history dock
         self.history_dock = QDockWidget("Query History", self)
         self.query_history_panel = QueryHistoryPanel(self.query_history)
-        self.query_history_panel.query_selected.connect(self.load_query_from_history)
-        self.query_history_panel.query_edited.connect(self.replace_query_from_history)
+        self._connect_signals('query_history_panel')
         
         self.history_dock.setWidget(self.query_history_panel)
         self.history_dock.setFeatures(
@@ -402,6 +520,12 @@ class MainWindow(QMainWindow):
         # Add dock toggle actions to view menu
         self.add_dock_actions_to_menu()
     
+    def _connect_signals(self, widget_name: str):
+        """Connect a child widget's signals to the slots listed in _SIGNAL_CONNECTIONS."""
+        widget = getattr(self, widget_name)
+        for signal_name, slot_name in self._SIGNAL_CONNECTIONS[widget_name]:
+            getattr(widget, signal_name).connect(getattr(self, slot_name))
+    
     def add_dock_actions_to_menu(self):
         """Add dock widget toggle actions to the View menu."""
         # Find the View menu
@@ -447,45 +571,160 @@ class MainWindow(QMainWindow):
         self.memory_label = QLabel("💾 0 MB")
         self.memory_label.setToolTip("Estimated memory usage")
         self.status_bar.addPermanentWidget(self.memory_label)
+        
+        # Metrics link offered after large or slow queries (hidden by default)
+        self.metrics_link_label = QLabel("<a href='#metrics'>View metrics</a>")
+        self.metrics_link_label.setToolTip("Show detailed metrics for the last query")
+        self.metrics_link_label.linkActivated.connect(lambda _: self.show_last_query_metrics())
+        self.metrics_link_label.setVisible(False)
+        self.status_bar.insertPermanentWidget(0, self.metrics_link_label)
+    
+    def _show_message(self, icon: QMessageBox.Icon, title: str, text: str,
+                      buttons: QMessageBox.StandardButton = QMessageBox.StandardButton.Ok,
+                      default_button: QMessageBox.StandardButton = QMessageBox.StandardButton.NoButton
+                      ) -> QMessageBox.StandardButton:
+        """
+        Show a modal message box, reusing one box per icon.
+        
+        Args:
+            icon: Message box icon
+            title: Window title
+            text: Message text
+            buttons: Buttons to offer
+            default_button: Button activated by Enter
+            
+        Returns:
+            QMessageBox.StandardButton: The button clicked
+        """
+        box = self._message_boxes.get(icon)
+        if box is None or box.isVisible():
+            # A box of this kind may still be open in an outer event loop
+            box = QMessageBox(self)
+            box.setIcon(icon)
+            if self._message_boxes.setdefault(icon, box) is not box:
+                # Only the first box per icon is kept for reuse
+                box.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        
+        box.setWindowTitle(title)
+        box.setText(text)
+        box.setStandardButtons(buttons)
+        box.setDefaultButton(default_button)
+        return QMessageBox.StandardButton(box.exec())
+    
+    def _show_info(self, title: str, text: str):
+        """Show an information message."""
+        self._show_message(QMessageBox.Icon.Information, title, text)
+    
+    def _show_warning(self, title: str, text: str):
+        """Show a warning message."""
+        self._show_message(QMessageBox.Icon.Warning, title, text)
+    
+    def _show_critical(self, title: str, text: str):
+        """Show an error message."""
+        self._show_message(QMessageBox.Icon.Critical, title, text)
+    
+    def _ask_question(self, title: str, text: str,
+                      buttons: QMessageBox.StandardButton = QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                      default_button: QMessageBox.StandardButton = QMessageBox.StandardButton.NoButton
+                      ) -> QMessageBox.StandardButton:
+        """Ask a question and return the button clicked."""
+        return self._show_message(QMessageBox.Icon.Question, title, text, buttons, default_button)
     
     def show_progress(self, message: str, progress: int = 0):
         """Show progress bar with message."""
+        self._discard_pending_progress(self.show_progress)
+        if (message == self._progress_last_msg and abs(progress - self._progress_last_pct) < 5
+                and self.progress_bar.isVisible()):
+            # Nothing visible would change, so skip the repaint
+            return
+        self._progress_last_msg = message
+        self._progress_last_pct = progress
         self.status_bar.showMessage(message)
         self.progress_bar.setValue(progress)
         self.progress_bar.setVisible(True)
-        QApplication.processEvents()  # Update UI immediately
+    
+    def show_busy(self, message: str):
+        """Show an indeterminate progress bar for work of unknown length."""
+        self.progress_bar.setRange(0, 0)
+        self.show_progress(message)
     
     def hide_progress(self):
         """Hide progress bar."""
+        # A deferred update must not show the bar again
+        self._discard_pending_progress(self.show_progress)
+        self._progress_last_msg = None
+        self._progress_last_pct = -1
         self.progress_bar.setVisible(False)
-        QApplication.processEvents()
+        self.progress_bar.setRange(0, 100)
+    
+    def _throttled_progress(self, update, *args, final: bool = False):
+        """
+        Apply a progress update at most once per PROGRESS_INTERVAL.
+        
+        Updates arriving sooner are dropped except the latest, which is
+        applied when the interval has passed.
+        
+        Args:
+            update: Callable that applies the update, e.g. show_progress
+            *args: Arguments for the callable
+            final: Apply immediately, e.g. for the first or last step
+        """
+        elapsed = time.monotonic() - self._last_progress_ts
+        if final or elapsed >= self.PROGRESS_INTERVAL:
+            self._pending_progress = None
+            self._progress_flush_timer.stop()
+            self._last_progress_ts = time.monotonic()
+            update(*args)
+            return
+        
+        self._pending_progress = (update, args)
+        if not self._progress_flush_timer.isActive():
+            self._progress_flush_timer.start(int((self.PROGRESS_INTERVAL - elapsed) * 1000) + 1)
+    
+    def _discard_pending_progress(self, update):
+        """Drop a deferred progress update made through the given callable."""
+        if self._pending_progress is not None and self._pending_progress[0] == update:
+            self._pending_progress = None
+            self._progress_flush_timer.stop()
+    
+    def _flush_progress(self):
+        """Apply the latest progress update skipped by the throttle."""
+        if self._pending_progress is not None:
+            update, args = self._pending_progress
+            self._pending_progress = None
+            self._last_progress_ts = time.monotonic()
+            update(*args)
     
     def update_status_indicators(self):
+        """Schedule an update of the status bar indicators."""
+        self._status_timer.start()
+    
+    def _do_update_status_indicators(self):
         """Update status bar indicators."""
         # Update table count
         if self.table_list:
-            table_count = len(self.table_list.get_all_tables())
+            table_count = len(self.table_list.tables)
             self.table_count_label.setText(f"📊 {table_count} tables")
         
+        # Keep auto-completion in step with added, dropped or renamed tables
+        self.update_schema_info()
+        
         # Update memory usage (rough estimate)
         total_memory = 0
         
         # Check both standard and paginated views
         if self.current_results_mode == "standard" and self.results_view and self.results_view.has_data():
             try:
-                df = self.results_view.get_dataframe()
-                if df is not None:
-                    memory_bytes = df.memory_usage(deep=True).sum()
-                    total_memory += memory_bytes
-            except:
+                # The displayed frame itself; get_dataframe() would copy it
+                total_memory += self._estimate_result_bytes(self.results_view.filtered_data)
+            except Exception:
                 pass
         elif self.current_results_mode == "paginated" and self.paginated_results:
             # For paginated view, estimate based on current page
             try:
                 if hasattr(self.paginated_results, 'current_data') and self.paginated_results.current_data is not None:
-                    memory_bytes = self.paginated_results.current_data.memory_usage(deep=True).sum()
-                    total_memory += memory_bytes
-            except:
+                    total_memory += self._estimate_result_bytes(self.paginated_results.current_data)
+            except Exception:
                 pass
         
         memory_mb = total_memory / (1024 * 1024)
@@ -499,6 +738,15 @@ class MainWindow(QMainWindow):
             self.connection_label.setText("🔴 Disconnected")
             self.connection_label.setStyleSheet("color: red; font-weight: bold;")
     
+    def _estimate_result_bytes(self, df: pd.DataFrame) -> int:
+        """Estimate a result's memory use, reusing the estimate while the frame is unchanged."""
+        if self._memory_estimate is not None and self._memory_estimate[0]() is df:
+            return self._memory_estimate[1]
+        
+        estimate = estimate_dataframe_bytes(df)
+        self._memory_estimate = (weakref.ref(df), estimate)
+        return estimate
+    
     def update_status(self, message: str):
         """Update the status bar with a message."""
         if hasattr(self, 'status_bar'):
@@ -514,25 +762,16 @@ class MainWindow(QMainWindow):
             from .query_dialogs import QueryMetricsDialog
             
             # Create and show metrics dialog with custom title
-            metrics_dialog = QueryMetricsDialog(self, sql, result_data, 0.0)  # execution_time not relevant for analysis
+            metrics_dialog = QueryMetricsDialog(
+                self, sql, result_data, 0.0,  # execution_time not relevant for analysis
+                header_text=f"<b>Metrics Type:</b> {title_prefix}"
+            )
             metrics_dialog.setWindowTitle(f"{title_prefix} - Query Execution Metrics")
-            
-            # Update the dialog title in the UI if possible
-            if hasattr(metrics_dialog, 'summary_frame'):
-                # Add a label to indicate the type of metrics
-                metrics_type_label = QLabel(f"<b>Metrics Type:</b> {title_prefix}")
-                metrics_type_label.setStyleSheet("color: #0066cc; font-size: 12px; margin: 5px;")
-                # Try to insert at the top of the dialog
-                layout = metrics_dialog.layout()
-                if layout:
-                    layout.insertWidget(0, metrics_type_label)
-            
             metrics_dialog.exec()
             
         except Exception as e:
             logger.error(f"Error showing paginated metrics: {e}")
-            QMessageBox.warning(
-                self,
+            self._show_warning(
                 "Metrics Error", 
                 f"Unable to display metrics: {str(e)}"
             )
@@ -602,122 +841,220 @@ class MainWindow(QMainWindow):
         """Import files that were dropped onto the table list."""
         self.import_files(file_paths)
     
-    def import_excel_with_sheet_selection(self, file_path: str) -> bool:
+    def import_excel_with_sheet_selection(self, file_path: str, remaining_files: int = 0) -> List[str]:
         """
         Import Excel file with sheet selection dialog.
         
         Args:
             file_path: Path to Excel file
+            remaining_files: Excel files still to import after this one in the
+                same batch; the dialog then offers to apply its choice to them
             
         Returns:
-            True if import was successful, False if cancelled or failed
+            Names of the imported tables; empty if cancelled or failed
         """
+        policy = self._excel_sheet_policy
+        if policy == "skip":
+            return []
+        
         try:
             # Analyze the Excel file to get sheet information
-            self.show_progress(f"Analyzing Excel file...", 10)
-            sheet_infos = self.file_importer.detect_excel_sheets(file_path)
+            self.show_busy("Analyzing Excel file...")
+            sheet_infos = self._detect_excel_sheets(file_path)
+            self.progress_bar.setRange(0, 100)
             
             # If only one non-empty sheet, import directly without dialog
             non_empty_sheets = [s for s in sheet_infos if not s.is_empty]
             if len(non_empty_sheets) <= 1:
                 self.show_progress(f"Importing single sheet...", 50)
-                result = self.file_importer.import_file(file_path)
+                result = self._read_file(file_path)
                 if result.success and result.dataframe is not None:
-                    return self._register_imported_table(file_path, result)
-                return False
-            
-            # Show sheet selection dialog
-            self.hide_progress()  # Hide progress during dialog
-            dialog = ExcelSheetSelectionDialog(file_path, sheet_infos, self)
-            
-            if dialog.exec() == QDialog.DialogCode.Accepted:
+                    table_name = self._register_imported_table(file_path, result)
+                    return [table_name] if table_name else []
+                return []
+            
+            if policy == "all_sheets":
+                selected_sheet_names = [s.name for s in non_empty_sheets]
+                base_table_name = Path(file_path).stem
+            elif policy == "first_sheet":
+                selected_sheet_names = [non_empty_sheets[0].name]
+                base_table_name = Path(file_path).stem
+            else:
+                # Show sheet selection dialog
+                self.hide_progress()  # Hide progress during dialog
+                dialog = ExcelSheetSelectionDialog(file_path, sheet_infos, self, remaining_files)
+                accepted = dialog.exec() == QDialog.DialogCode.Accepted
+                
+                # Remember the choice for the rest of this batch if asked to
+                self._excel_sheet_policy = dialog.get_sheet_policy()
+                if not accepted:
+                    # User cancelled
+                    return []
+                
                 selected_sheet_names = dialog.get_selected_sheet_names()
                 base_table_name = dialog.get_base_table_name()
+            
+            if not selected_sheet_names:
+                return []
+            
+            # Show progress for batch import
+            self.show_progress(f"Importing {len(selected_sheet_names)} sheets...", 20)
+            
+            # Import selected sheets
+            batch_result = self._read_file(file_path, selected_sheet_names, base_table_name)
+            
+            if batch_result.success:
+                # Pick a free name for each sheet, then register them together
+                taken_names = set()
+                pending = []
+                for import_result in batch_result.successful_imports:
+                    table_name = import_result.metadata.get('table_name')
+                    if table_name:
+                        # Avoid existing tables and sheets earlier in this import
+                        table_name = self.db_manager.unique_table_name(table_name, taken_names)
+                        taken_names.add(table_name)
+                        pending.append((table_name, import_result))
                 
-                if not selected_sheet_names:
-                    return False
+                registered = self.db_manager.register_tables([
+                    (table_name, import_result.dataframe, file_path, import_result.file_type)
+                    for table_name, import_result in pending
+                ])
                 
-                # Show progress for batch import
-                self.show_progress(f"Importing {len(selected_sheet_names)} sheets...", 20)
+                for table_name, import_result in pending:
+                    logger.info(f"Successfully imported sheet '{import_result.metadata.get('sheet_name')}' as table '{table_name}'")
                 
-                # Import selected sheets
-                batch_result = self.file_importer.import_excel_multiple_sheets(
-                    file_path, selected_sheet_names, base_table_name
-                )
+                # Update table list
+                if self.table_list:
+                    self.table_list.add_tables(registered)
                 
-                if batch_result.success:
-                    # Register each successfully imported sheet
-                    for import_result in batch_result.successful_imports:
-                        table_name = import_result.metadata.get('table_name')
-                        if table_name and self.db_manager:
-                            # Check for name conflicts
-                            original_name = table_name
-                            counter = 1
-                            while table_name in self.db_manager.tables:
-                                table_name = f"{original_name}_{counter}"
-                                counter += 1
-                            
-                            # Register with database
-                            metadata = self.db_manager.register_table(
-                                table_name,
-                                import_result.dataframe,
-                                file_path,
-                                import_result.file_type
-                            )
-                            
-                            # Add source sheet information to metadata
-                            metadata.metadata['source_sheet'] = import_result.metadata.get('sheet_name')
-                            metadata.metadata['source_file'] = Path(file_path).name
-                            
-                            # Update table list
-                            if self.table_list:
-                                self.table_list.add_table(metadata)
-                            
-                            logger.info(f"Successfully imported sheet '{import_result.metadata.get('sheet_name')}' as table '{table_name}'")
-                    
-                    # Show summary message
-                    total_imported = len(batch_result.successful_imports)
-                    total_failed = len(batch_result.failed_imports)
-                    
-                    if total_failed > 0:
-                        QMessageBox.information(
-                            self,
-                            "Import Complete",
-                            f"Excel import completed:\n• {total_imported} sheets imported successfully\n• {total_failed} sheets failed to import"
-                        )
-                    
-                    return True
-                else:
-                    QMessageBox.warning(
-                        self,
-                        "Import Failed", 
-                        f"Failed to import Excel sheets:\n{batch_result.warnings}"
+                # Show summary message
+                total_imported = len(batch_result.successful_imports)
+                total_failed = len(batch_result.failed_imports)
+                
+                if total_failed > 0:
+                    self._show_info(
+                        "Import Complete",
+                        f"Excel import completed:\n• {total_imported} sheets imported successfully\n• {total_failed} sheets failed to import"
                     )
-                    return False
+                
+                return [metadata.name for metadata in registered]
             else:
-                # User cancelled
-                return False
+                self._show_warning(
+                    "Import Failed", 
+                    f"Failed to import Excel sheets:\n{batch_result.warnings}"
+                )
+                return []
                 
         except Exception as e:
             logger.error(f"Failed to import Excel file {file_path}: {e}")
-            QMessageBox.critical(
-                self,
+            self._show_critical(
                 "Excel Import Error",
                 f"Failed to import Excel file:\n{str(e)}"
             )
-            return False
+            return []
+    
+    def _detect_excel_sheets(self, file_path: str) -> list:
+        """
+        Detect an Excel file's sheets in a worker thread.
+        
+        Raises:
+            ValueError: If the file could not be analyzed
+        """
+        worker = SheetDetectWorker(self.file_importer, file_path, self)
+        outcome = self._wait_for_worker(worker, worker.sheet_infos_ready, worker.detect_error)
+        
+        if 'result' not in outcome:
+            raise ValueError(outcome.get('error', f"Failed to analyze Excel file {file_path}"))
+        return outcome['result']
+    
+    def _read_file(self, file_path: str, sheet_names: Optional[List[str]] = None,
+                   base_table_name: Optional[str] = None):
+        """
+        Read a file, or the given sheets of an Excel file, in a worker thread.
+        
+        Returns:
+            ImportResult, or BatchImportResult when sheet names are given
+            
+        Raises:
+            ValueError: If the file could not be read
+        """
+        worker = FileImportWorker(self.file_importer, file_path, sheet_names, base_table_name, self)
+        outcome = self._wait_for_worker(worker, worker.import_finished, worker.import_error)
+        
+        if 'result' not in outcome:
+            raise ValueError(outcome.get('error', f"Failed to import {file_path}"))
+        return outcome['result']
+    
+    def _wait_for_worker(self, worker, result_signal, error_signal) -> dict:
+        """
+        Run a worker thread and wait for it in a local event loop.
+        
+        The window keeps repainting and receiving the worker's signals while
+        waiting, which lets the sequential import flow stay off the UI thread.
+        
+        Returns:
+            Dictionary with the emitted 'result' or 'error'
+        """
+        outcome = {}
+        result_signal.connect(lambda result: outcome.update(result=result))
+        error_signal.connect(lambda error: outcome.update(error=error))
+        self._run_worker_until_finished(worker)
+        return outcome
+    
+    def _run_worker_until_finished(self, worker):
+        """Start a worker thread and process events until it finishes."""
+        loop = QEventLoop()
+        worker.finished.connect(loop.quit)
+        worker.start()
+        loop.exec()
+        worker.deleteLater()
+    
+    def _read_files(self, file_paths: List[str], table_names: Optional[List[str]], total_files: int,
+                    file_names: Dict[str, str]) -> list:
+        """
+        Read several non-Excel files in parallel, showing progress as each completes.
+        
+        Args:
+            file_paths: Files to read
+            table_names: Names for tables loaded directly by DuckDB, or None to
+                read every file into a DataFrame
+            total_files: Size of the whole import, for the progress bar
+            file_names: File name of each path, for progress messages
+            
+        Returns:
+            TableMetadata of a loaded table, ImportResult, or an error message
+            string, for each file in order
+        """
+        outcomes = [None] * len(file_paths)
+        done_count = 0
+        throttled_progress = self._throttled_progress
+        show_progress = self.show_progress
+        
+        def file_done(index, outcome):
+            nonlocal done_count
+            outcomes[index] = outcome
+            done_count += 1
+            throttled_progress(
+                show_progress,
+                f"Read {file_names[file_paths[index]]} ({done_count}/{total_files})...",
+                int(done_count / total_files * 50),  # Reading is the first half of the import
+                final=done_count == len(file_paths)
+            )
+        
+        worker = BatchFileImportWorker(self.file_importer, file_paths, self.db_manager, table_names, self)
+        worker.table_loaded.connect(file_done)
+        worker.file_imported.connect(file_done)
+        worker.file_failed.connect(file_done)
+        self._run_worker_until_finished(worker)
+        return outcomes
     
-    def _register_imported_table(self, file_path: str, result) -> bool:
-        """Helper method to register a single imported table."""
+    def _register_imported_table(self, file_path: str, result) -> Optional[str]:
+        """Register a single imported file as a table, returning its name or None on failure."""
         try:
             # Generate table name and check for conflicts  
-            table_name = self.file_importer.get_suggested_table_name(file_path)
-            original_name = table_name
-            counter = 1
-            
-            while table_name in self.db_manager.tables:
-                table_name = f"{original_name}_{counter}"
-                counter += 1
+            table_name = self.db_manager.unique_table_name(
+                self.file_importer.get_suggested_table_name(file_path)
+            )
             
             # Register with database
             if self.db_manager:
@@ -733,18 +1070,132 @@ class MainWindow(QMainWindow):
                     self.table_list.add_table(metadata)
                 
                 # Show warnings if any (e.g., detected delimiter)
+                file_name = Path(file_path).name
                 if result.warnings:
                     warning_msg = "\n".join(result.warnings)
-                    logger.info(f"Import warnings for {Path(file_path).name}: {warning_msg}")
+                    logger.info(f"Import warnings for {file_name}: {warning_msg}")
                     # Show in status bar for non-intrusive notification
-                    self.status_bar.showMessage(f"Imported {Path(file_path).name} - {warning_msg}", 5000)
+                    self.status_bar.showMessage(f"Imported {file_name} - {warning_msg}", 5000)
                 
-                logger.info(f"Successfully imported {Path(file_path).name} as table '{table_name}'")
-                return True
-            return False
+                logger.info(f"Successfully imported {file_name} as table '{table_name}'")
+                return table_name
+            return None
         except Exception as e:
             logger.error(f"Failed to register table for {file_path}: {e}")
-            return False
+            return None
+    
+    def _register_imported_tables(self, items: List[tuple], failed_imports: List[tuple]) -> List[str]:
+        """
+        Register several imported files as tables in a single transaction.
+        
+        If the batch cannot be registered as a whole, each table is registered
+        on its own so one bad file does not fail the others.
+        
+        Args:
+            items: (file_path, ImportResult) for each file read successfully
+            failed_imports: List that (file name, error) pairs are appended to
+            
+        Returns:
+            Names of the registered tables
+        """
+        if not items:
+            return []
+        if not self.db_manager:
+            failed_imports.extend((Path(file_path).name, "Database not initialized") for file_path, _ in items)
+            return []
+        
+        table_names = self._pick_table_names([file_path for file_path, _ in items])
+        
+        try:
+            registered = self.db_manager.register_tables([
+                (table_name, result.dataframe, file_path, result.file_type)
+                for table_name, (file_path, result) in zip(table_names, items)
+            ])
+        except Exception as e:
+            logger.warning(f"Batch registration failed, registering tables one at a time: {e}")
+            registered_names = []
+            for file_path, result in items:
+                table_name = self._register_imported_table(file_path, result)
+                if table_name:
+                    registered_names.append(table_name)
+                else:
+                    failed_imports.append((Path(file_path).name, "Failed to register table"))
+            return registered_names
+        
+        if self.table_list:
+            self.table_list.add_tables(registered)
+        
+        for table_name, (file_path, result) in zip(table_names, items):
+            file_name = Path(file_path).name
+            if result.warnings:
+                warning_msg = "\n".join(result.warnings)
+                logger.info(f"Import warnings for {file_name}: {warning_msg}")
+            logger.info(f"Successfully imported {file_name} as table '{table_name}'")
+        
+        return [metadata.name for metadata in registered]
+    
+    def _pick_table_names(self, file_paths: List[str]) -> List[str]:
+        """Pick a free table name for each file, avoiding names taken earlier in the batch."""
+        # Bound once; called for every file of a batch
+        unique_table_name = self.db_manager.unique_table_name
+        suggested_table_name = self.file_importer.get_suggested_table_name
+        
+        taken_names = set()
+        table_names = []
+        for file_path in file_paths:
+            table_name = unique_table_name(suggested_table_name(file_path), taken_names)
+            taken_names.add(table_name)
+            table_names.append(table_name)
+        return table_names
+    
+    def _combinable_file_type(self, suffixes: List[str]) -> Optional[str]:
+        """
+        Get the file type shared by several natively readable files, or None.
+        
+        Args:
+            suffixes: Lower-cased extension of each file being imported
+        """
+        if len(suffixes) < 2 or not self.db_manager:
+            return None
+        
+        file_types = {self.file_importer.SUPPORTED_EXTENSIONS.get(suffix) for suffix in suffixes}
+        if len(file_types) != 1:
+            return None
+        file_type = file_types.pop()
+        return file_type if file_type in self.db_manager.NATIVE_READERS else None
+    
+    def _import_combined_files(self, file_paths: List[str], file_type: str):
+        """
+        Import several CSV or Parquet files as one table, scanned by DuckDB in a single call.
+        
+        Args:
+            file_paths: Files to combine
+            file_type: File type shared by all the files
+        """
+        table_name = self.db_manager.unique_table_name("combined")
+        self.show_busy(f"Combining {len(file_paths)} files...")
+        
+        worker = CombinedFileImportWorker(self.db_manager, table_name, file_paths, file_type, self)
+        outcome = self._wait_for_worker(worker, worker.table_loaded, worker.load_error)
+        self.hide_progress()
+        
+        if 'result' not in outcome:
+            error_msg = outcome.get('error', "Unknown error")
+            self.status_bar.showMessage(f"Import failed: {error_msg}")
+            self._show_critical("Import Error", f"Failed to combine files:\n{error_msg}")
+            return
+        
+        metadata = outcome['result']
+        self.db_manager.add_tables([metadata])
+        if self.table_list:
+            self.table_list.add_tables([metadata])
+        self.update_schema_info()
+        
+        self.status_bar.showMessage(
+            f"Combined {len(file_paths)} files into table '{table_name}' ({metadata.row_count:,} rows)"
+        )
+        self.table_imported.emit(table_name)
+        self.update_status_indicators()
     
     def import_files(self, file_paths: List[str]):
         """
@@ -756,61 +1207,121 @@ class MainWindow(QMainWindow):
         if not file_paths:
             return
         
+        if self._importing:
+            # Events are still processed while files are read; don't start a second import
+            self.status_bar.showMessage("An import is already in progress")
+            return
+        
         total_files = len(file_paths)
         successful_imports = 0
+        imported_tables = []
         failed_imports = []
-        
-        for i, file_path in enumerate(file_paths):
-            try:
-                # Update progress for current file
-                file_name = Path(file_path).name
-                progress = int((i / total_files) * 100)
-                self.show_progress(f"Importing {file_name} ({i+1}/{total_files})...", progress)
+        file_names = {}  # File name of each path
+        self._importing = True
+        try:
+            self._excel_sheet_policy = None
+            
+            # Split the files by type, parsing each path once
+            excel_paths = []
+            other_paths = []
+            suffixes = []
+            for path in file_paths:
+                parsed = Path(path)
+                file_names[path] = parsed.name
+                suffix = parsed.suffix.lower()
+                suffixes.append(suffix)
+                if suffix in {'.xlsx', '.xls'}:
+                    excel_paths.append(path)
+                else:
+                    other_paths.append(path)
+            
+            # Several files of one type DuckDB reads natively can be scanned into a single table
+            combined_type = self._combinable_file_type(suffixes)
+            if combined_type and self._ask_question(
+                "Combine Files",
+                f"Combine the {total_files} {combined_type.upper()} files into a single table?\n\n"
+                f"Columns are matched by name and a 'filename' column records the file each row came from. "
+                f"Choose No to import each file as its own table.",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                QMessageBox.StandardButton.No
+            ) == QMessageBox.StandardButton.Yes:
+                self._import_combined_files(file_paths, combined_type)
+                return
+            
+            # Load all non-Excel files in parallel, with DuckDB's own readers where it can
+            # read them; files read into DataFrames are then registered in one transaction
+            if other_paths:
+                table_names = self._pick_table_names(other_paths) if self.db_manager else None
                 
-                # Check if this is an Excel file for multi-sheet handling
-                if Path(file_path).suffix.lower() in ['.xlsx', '.xls']:
-                    success = self.import_excel_with_sheet_selection(file_path)
-                    if success:
-                        successful_imports += 1
+                loaded = []
+                pending = []
+                add_failure = failed_imports.append
+                outcomes = self._read_files(other_paths, table_names, total_files, file_names)
+                for file_path, result in zip(other_paths, outcomes):
+                    file_name = file_names[file_path]
+                    if isinstance(result, TableMetadata):
+                        loaded.append(result)
+                        logger.info(f"Successfully imported {file_name} as table '{result.name}'")
+                    elif isinstance(result, str):
+                        add_failure((file_name, result))
+                    elif result.success and result.dataframe is not None:
+                        pending.append((file_path, result))
                     else:
-                        failed_imports.append((file_name, "User cancelled or import failed"))
-                else:
-                    # Import non-Excel files normally
-                    result = self.file_importer.import_file(file_path)
+                        add_failure((file_name, result.error or "Unknown error"))
+                
+                if loaded:
+                    self.db_manager.add_tables(loaded)
+                    if self.table_list:
+                        self.table_list.add_tables(loaded)
+                    imported_tables.extend(metadata.name for metadata in loaded)
+                
+                if pending:
+                    self.show_progress(f"Registering {len(pending)} tables...", 50)
+                registered_names = self._register_imported_tables(pending, failed_imports)
+                imported_tables.extend(registered_names)
+                successful_imports += len(loaded) + len(registered_names)
+            
+            # Excel files one at a time, since each may need the sheet selection dialog
+            for i, file_path in enumerate(excel_paths):
+                file_name = file_names[file_path]
+                try:
+                    # Update progress for current file
+                    done = len(other_paths) + i
+                    self._throttled_progress(
+                        self.show_progress,
+                        f"Importing {file_name} ({done + 1}/{total_files})...",
+                        50 + int((done / total_files) * 45)
+                    )
                     
-                    if result.success and result.dataframe is not None:
-                        success = self._register_imported_table(file_path, result)
-                        if success:
-                            successful_imports += 1
-                        else:
-                            failed_imports.append((file_name, "Database not initialized"))
+                    table_names = self.import_excel_with_sheet_selection(file_path, len(excel_paths) - i - 1)
+                    if table_names:
+                        successful_imports += 1
+                        imported_tables.extend(table_names)
                     else:
-                        failed_imports.append((file_name, result.error or "Unknown error"))
-                    
-            except Exception as e:
-                failed_imports.append((file_name, str(e)))
-                logger.error(f"Failed to import {file_name}: {e}")
-        
-        # Complete the import process
-        self.show_progress("Finalizing imports...", 95)
+                        failed_imports.append((file_name, "User cancelled or import failed"))
+                        
+                except Exception as e:
+                    failed_imports.append((file_name, str(e)))
+                    logger.error(f"Failed to import {file_name}: {e}")
+        finally:
+            self._importing = False
         
         # Update schema info for auto-completion
         if successful_imports > 0:
             self.update_schema_info()
         
-        self.show_progress("Import completed", 100)
         self.hide_progress()
         
         # Show results summary
         if total_files == 1:
             # Single file import - use original behavior
             if successful_imports == 1:
-                self.status_bar.showMessage(f"Imported {Path(file_paths[0]).name} successfully")
-                self.table_imported.emit(list(self.db_manager.tables.keys())[-1])
+                self.status_bar.showMessage(f"Imported {file_names[file_paths[0]]} successfully")
+                self.table_imported.emit(imported_tables[-1])
             else:
                 error_msg = failed_imports[0][1] if failed_imports else "Unknown error"
                 self.status_bar.showMessage(f"Import failed: {error_msg}")
-                QMessageBox.critical(self, "Import Error", error_msg)
+                self._show_critical("Import Error", error_msg)
         else:
             # Multiple file import - show summary
             self._show_import_summary(successful_imports, failed_imports)
@@ -819,35 +1330,37 @@ class MainWindow(QMainWindow):
     
     def _show_import_summary(self, successful_imports: int, failed_imports: List[tuple]):
         """Show a summary dialog for multi-file import results."""
-        total_files = successful_imports + len(failed_imports)
+        failed_count = len(failed_imports)
+        total_files = successful_imports + failed_count
         
         if failed_imports:
             # Some failures - show detailed summary
-            message = f"Import completed with {successful_imports}/{total_files} files imported successfully.\n\n"
+            lines = [
+                f"Import completed with {successful_imports}/{total_files} files imported successfully.",
+                "",
+                "Failed imports:",
+            ]
+            lines.extend(f"• {file_name}: {error}" for file_name, error in failed_imports[:5])  # Show first 5 failures
             
-            if failed_imports:
-                message += "Failed imports:\n"
-                for file_name, error in failed_imports[:5]:  # Show first 5 failures
-                    message += f"• {file_name}: {error}\n"
-                
-                if len(failed_imports) > 5:
-                    message += f"... and {len(failed_imports) - 5} more failures."
+            if failed_count > 5:
+                lines.append(f"... and {failed_count - 5} more failures.")
             
-            QMessageBox.warning(self, "Import Summary", message)
+            self._show_warning("Import Summary", "\n".join(lines))
         else:
             # All successful
             message = f"Successfully imported all {successful_imports} files!"
             self.status_bar.showMessage(message)
-            QMessageBox.information(self, "Import Complete", message)
+            self._show_info("Import Complete", message)
     
     def save_database(self):
         """Save the current database to a file with progress tracking."""
         if not self.db_manager:
-            QMessageBox.warning(self, "Warning", "No database to save")
+            self._show_warning("Warning", "No database to save")
             return
         
-        if not self.table_list or len(self.table_list.get_all_tables()) == 0:
-            QMessageBox.information(self, "No Data", "No tables to save. Import some data first.")
+        table_count = len(self.table_list.tables) if self.table_list else 0
+        if table_count == 0:
+            self._show_info("No Data", "No tables to save. Import some data first.")
             return
         
         file_path, _ = QFileDialog.getSaveFileName(
@@ -868,9 +1381,7 @@ class MainWindow(QMainWindow):
                 self.config.add_recent_database(file_path)
                 
                 # Show success message
-                table_count = len(self.table_list.get_all_tables())
-                QMessageBox.information(
-                    self,
+                self._show_info(
                     "Save Successful", 
                     f"Successfully saved database with {table_count} tables to:\n{file_path}"
                 )
@@ -894,9 +1405,8 @@ class MainWindow(QMainWindow):
         
         if file_path:
             # Confirm if current data will be lost
-            if self.table_list and len(self.table_list.get_all_tables()) > 0:
-                reply = QMessageBox.question(
-                    self,
+            if self.table_list and self.table_list.tables:
+                reply = self._ask_question(
                     "Load Database",
                     "Loading a database will replace your current tables. Continue?",
                     QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
@@ -910,22 +1420,20 @@ class MainWindow(QMainWindow):
             
             if progress_dialog.exec() == QDialog.DialogCode.Accepted:
                 # Success - update UI
+                tables = self.db_manager.list_tables()
                 if self.table_list:
-                    self.table_list.clear()
-                    for metadata in self.db_manager.list_tables():
-                        self.table_list.add_table(metadata)
+                    self.table_list.set_tables(tables)
                 
                 # Update schema info for SQL editor auto-completion
-                self.update_schema_info()
+                self.update_schema_info(force=True)
                 
-                table_count = len(self.db_manager.list_tables())
+                table_count = len(tables)
                 self.status_bar.showMessage(f"Loaded database with {table_count} tables")
                 self.config.add_recent_database(file_path)
                 self.database_loaded.emit(file_path)
                 
                 # Show success message
-                QMessageBox.information(
-                    self,
+                self._show_info(
                     "Load Successful",
                     f"Successfully loaded database with {table_count} tables from:\n{Path(file_path).name}"
                 )
@@ -933,42 +1441,53 @@ class MainWindow(QMainWindow):
                 # Failed or cancelled
                 self.status_bar.showMessage("Database load cancelled or failed")
     
-    def export_results(self):
-        """Export query results to a file with enhanced options and support for both view modes."""
-        # Determine which view is active and get data
+    def _get_export_dataframe(self) -> Optional[tuple]:
+        """
+        Get the displayed results to export and the export dialog context.
+        
+        Shows a message and returns None when there is nothing to export or
+        the user declines exporting only the current page.
+        
+        Returns:
+            (dataframe, export_context), or None
+        """
         dataframe = None
         export_context = "query_results"
         
         if self.current_results_mode == "standard":
-            if not self.results_view or not self.results_view.has_data():
-                QMessageBox.information(self, "Export", "No results to export")
-                return
-            dataframe = self.results_view.get_dataframe()
-            
+            if self.results_view and self.results_view.has_data():
+                # The displayed frame itself, so repeated exports share one Arrow conversion
+                dataframe = self.results_view.filtered_data
         elif self.current_results_mode == "paginated":
-            if not self.paginated_results or not hasattr(self.paginated_results, 'current_data'):
-                QMessageBox.information(self, "Export", "No results to export")
-                return
-            dataframe = self.paginated_results.current_data
-            export_context = "paginated_results"
-            
-            # For paginated results, warn user about partial export
-            if hasattr(self.paginated_results, 'current_page_info') and self.paginated_results.current_page_info:
-                reply = QMessageBox.question(
-                    self,
-                    "Export Current Page",
-                    f"This will export only the current page ({self.paginated_results.current_page_info.start_row + 1:,}-{self.paginated_results.current_page_info.end_row:,} of {self.paginated_results.current_page_info.total_rows:,} rows). Continue?",
-                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-                )
-                if reply != QMessageBox.StandardButton.Yes:
-                    return
-        else:
-            QMessageBox.information(self, "Export", "No results to export")
-            return
+            if self.paginated_results:
+                dataframe = getattr(self.paginated_results, 'current_data', None)
+                export_context = "paginated_results"
+        
+        if dataframe is None or len(dataframe) == 0:
+            self._show_info("Export", "No results to export")
+            return None
+        
+        # For paginated results, warn user about partial export
+        page_info = None
+        if export_context == "paginated_results":
+            page_info = getattr(self.paginated_results, 'current_page_info', None)
+        if page_info:
+            reply = self._ask_question(
+                "Export Current Page",
+                f"This will export only the current page ({page_info.start_row + 1:,}-{page_info.end_row:,} of {page_info.total_rows:,} rows). Continue?",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+            )
+            if reply != QMessageBox.StandardButton.Yes:
+                return None
         
-        if dataframe is None or dataframe.empty:
-            QMessageBox.information(self, "Export", "No results to export")
+        return dataframe, export_context
+    
+    def export_results(self):
+        """Export query results to a file with enhanced options and support for both view modes."""
+        export_data = self._get_export_dataframe()
+        if export_data is None:
             return
+        dataframe, export_context = export_data
         
         # Create enhanced export dialog
         dialog = ExportOptionsDialog(self, export_context)
@@ -977,49 +1496,14 @@ class MainWindow(QMainWindow):
             file_path = dialog.get_file_path()
             export_options = dialog.get_export_options()
             
-            self.status_bar.showMessage(f"Exporting results to {file_path}...")
-            
-            try:
-                if dataframe is not None:
-                    # Use the enhanced exporter with custom options
-                    # Get the format type from the dialog
-                    format_type = dialog.get_file_format()
-                    result = self.result_exporter.export_result(
-                        dataframe, 
-                        file_path, 
-                        format_type,
-                        export_options
-                    )
-                    
-                    if result.success:
-                        file_size_mb = result.file_size / (1024*1024) if result.file_size else 0
-                        self.status_bar.showMessage(
-                            f"Exported {result.row_count} rows to {Path(file_path).name} "
-                            f"({file_size_mb:.1f} MB)"
-                        )
-                        
-                        # Show success message with details
-                        QMessageBox.information(
-                            self, 
-                            "Export Successful",
-                            f"Successfully exported {result.row_count} rows to:\n{file_path}\n\n"
-                            f"File size: {file_size_mb:.1f} MB"
-                        )
-                    else:
-                        self.status_bar.showMessage(f"Export failed: {result.error}")
-                        QMessageBox.critical(self, "Export Error", result.error or "Unknown error")
-                else:
-                    self.status_bar.showMessage("No data to export")
-                
-            except Exception as e:
-                error_msg = f"Export failed: {str(e)}"
-                self.status_bar.showMessage(error_msg)
-                QMessageBox.critical(self, "Export Error", error_msg)
+            self._start_dataframe_export(
+                dataframe, file_path, dialog.get_file_format(), export_options, "rows"
+            )
     
     def export_filtered_results_from_view(self, filtered_dataframe: pd.DataFrame):
         """Export filtered results from view (called with filtered DataFrame)."""
-        if filtered_dataframe is None or filtered_dataframe.empty:
-            QMessageBox.information(self, "Export", "No filtered results to export")
+        if filtered_dataframe is None or len(filtered_dataframe) == 0:
+            self._show_info("Export", "No filtered results to export")
             return
         
         # Create enhanced export dialog
@@ -1029,45 +1513,64 @@ class MainWindow(QMainWindow):
             file_path = dialog.get_file_path()
             export_options = dialog.get_export_options()
             
-            self.status_bar.showMessage(f"Exporting filtered results to {file_path}...")
+            self._start_dataframe_export(
+                filtered_dataframe, file_path, dialog.get_file_format(), export_options, "filtered rows"
+            )
+    
+    def _start_dataframe_export(self, dataframe: pd.DataFrame, file_path: str, format_type: Optional[str],
+                                export_options: ExportOptions, rows_label: str):
+        """
+        Write a DataFrame to a file on the thread pool.
+        
+        Args:
+            dataframe: Data to export
+            file_path: Output file path
+            format_type: Format chosen in the export dialog
+            export_options: Export options
+            rows_label: How the rows are described in messages, e.g. "filtered rows"
+        """
+        if self._export_runnable is not None:
+            self._show_info("Export", "An export is already in progress")
+            return
+        
+        self.show_busy(f"Exporting {rows_label} to {Path(file_path).name}...")
+        
+        runnable = DataFrameExportRunnable(self.result_exporter, dataframe, file_path, format_type, export_options)
+        runnable.signals.finished.connect(lambda result: self._on_dataframe_export_finished(result, rows_label))
+        self._export_runnable = runnable
+        QThreadPool.globalInstance().start(runnable)
+    
+    def _on_dataframe_export_finished(self, export_result, rows_label: str):
+        """Report the outcome of a background DataFrame export."""
+        self._export_runnable = None
+        self.hide_progress()
+        
+        file_path = export_result.file_path
+        if export_result.success:
+            file_size_mb = export_result.file_size / (1024*1024) if export_result.file_size else 0
+            self.status_bar.showMessage(
+                f"Exported {export_result.row_count} {rows_label} to {Path(file_path).name} "
+                f"({file_size_mb:.1f} MB)"
+            )
             
-            try:
-                # Use the enhanced exporter with custom options
-                format_type = dialog.get_file_format()
-                result = self.result_exporter.export_result(
-                    filtered_dataframe, 
-                    file_path, 
-                    format_type,
-                    export_options
-                )
-                
-                if result.success:
-                    file_size_mb = result.file_size / (1024*1024) if result.file_size else 0
-                    self.status_bar.showMessage(
-                        f"Exported {result.row_count} filtered rows to {Path(file_path).name} "
-                        f"({file_size_mb:.1f} MB)"
-                    )
-                    
-                    # Show success message with details
-                    QMessageBox.information(
-                        self, 
-                        "Export Successful",
-                        f"Successfully exported {result.row_count} filtered rows to:\n{file_path}\n\n"
-                        f"File size: {file_size_mb:.1f} MB"
-                    )
-                else:
-                    self.status_bar.showMessage(f"Export failed: {result.error}")
-                    QMessageBox.critical(self, "Export Error", result.error or "Unknown error")
-                    
-            except Exception as e:
-                error_msg = f"Export failed: {str(e)}"
-                self.status_bar.showMessage(error_msg)
-                QMessageBox.critical(self, "Export Error", error_msg)
+            # Show success message with details
+            self._show_info(
+                "Export Successful",
+                f"Successfully exported {export_result.row_count} {rows_label} to:\n{file_path}\n\n"
+                f"File size: {file_size_mb:.1f} MB"
+            )
+        else:
+            self.status_bar.showMessage(f"Export failed: {export_result.error}")
+            self._show_critical("Export Error", export_result.error or "Unknown error")
     
     def export_all_results(self):
         """Export all query results (complete dataset, not just current page)."""
         if not self.last_query_sql:
-            QMessageBox.information(self, "Export", "No query results available to export")
+            self._show_info("Export", "No query results available to export")
+            return
+        
+        if self._export_runnable is not None:
+            self._show_info("Export", "An export is already in progress")
             return
             
         # Get file path from user
@@ -1081,55 +1584,48 @@ class MainWindow(QMainWindow):
         if not file_path:
             return
             
-        try:
-            self.status_bar.showMessage("Exporting all results...")
-            
-            # Execute the original query to get complete results
-            complete_result = self.db_manager.execute_query(self.last_query_sql)
+        # Stream the complete result to disk in the background
+        self.show_busy("Exporting all results...")  # Total row count is not known up front
+        
+        runnable = ExportRunnable(
+            self.result_exporter,
+            self.db_manager,
+            self.last_query_sql,
+            file_path,
+            options=ExportOptions(overwrite=True)  # Overwrite was confirmed in the save dialog
+        )
+        runnable.signals.progress.connect(self._on_export_progress)
+        runnable.signals.finished.connect(self._on_export_all_finished)
+        self._export_runnable = runnable
+        QThreadPool.globalInstance().start(runnable)
+    
+    def _on_export_progress(self, rows_written: int):
+        """Show how many rows a background export has written."""
+        self.status_bar.showMessage(f"Exported {rows_written:,} rows...")
+    
+    def _on_export_all_finished(self, export_result):
+        """Report the outcome of a background export."""
+        self._export_runnable = None
+        self.hide_progress()
+        
+        file_name = Path(export_result.file_path).name
+        if export_result.success:
+            file_size_mb = export_result.file_size / (1024*1024) if export_result.file_size else 0
+            self.status_bar.showMessage(
+                f"Exported all {export_result.row_count:,} rows to {file_name} "
+                f"({file_size_mb:.1f} MB)"
+            )
             
-            if complete_result.success and complete_result.data is not None:
-                # Use the exporter to save the complete dataset
-                from localsql_explorer.exporter import ResultExporter
-                exporter = ResultExporter()
-                
-                export_result = exporter.export_dataframe(
-                    complete_result.data,
-                    file_path,
-                    metadata={
-                        'query': self.last_query_sql,
-                        'export_type': 'complete_results',
-                        'total_rows': len(complete_result.data),
-                        'export_timestamp': pd.Timestamp.now().isoformat()
-                    }
-                )
-                
-                if export_result.success:
-                    file_size_mb = export_result.file_size / (1024*1024) if export_result.file_size else 0
-                    self.status_bar.showMessage(
-                        f"Exported all {export_result.row_count:,} rows to {Path(file_path).name} "
-                        f"({file_size_mb:.1f} MB)"
-                    )
-                    
-                    QMessageBox.information(
-                        self,
-                        "Export Complete",
-                        f"Successfully exported complete dataset:\n"
-                        f"• {export_result.row_count:,} total rows\n"
-                        f"• File: {Path(file_path).name}\n"
-                        f"• Size: {file_size_mb:.1f} MB"
-                    )
-                else:
-                    self.status_bar.showMessage(f"Export failed: {export_result.error}")
-                    QMessageBox.critical(self, "Export Error", export_result.error or "Unknown error")
-            else:
-                error_msg = complete_result.error or "Failed to retrieve complete results"
-                self.status_bar.showMessage(f"Export failed: {error_msg}")
-                QMessageBox.critical(self, "Export Error", error_msg)
-                
-        except Exception as e:
-            error_msg = f"Export failed: {str(e)}"
-            self.status_bar.showMessage(error_msg)
-            QMessageBox.critical(self, "Export Error", error_msg)
+            self._show_info(
+                "Export Complete",
+                f"Successfully exported complete dataset:\n"
+                f"• {export_result.row_count:,} total rows\n"
+                f"• File: {file_name}\n"
+                f"• Size: {file_size_mb:.1f} MB"
+            )
+        else:
+            self.status_bar.showMessage(f"Export failed: {export_result.error}")
+            self._show_critical("Export Error", export_result.error or "Unknown error")
     
     def run_query(self):
         """Execute the SQL query in the editor with enhanced error handling and metrics."""
@@ -1142,30 +1638,42 @@ class MainWindow(QMainWindow):
             return
         
         # Check if a query is already running
-        if self.query_worker and self.query_worker.isRunning():
-            reply = QMessageBox.question(
-                self,
-                "Query Running",
-                "A query is already running. Do you want to cancel it and run this query?",
-                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                QMessageBox.StandardButton.No
-            )
-            if reply == QMessageBox.StandardButton.Yes:
+        if self.query_worker and self.query_worker.is_running():
+            if not self.query_worker.is_cancelled:
+                reply = self._ask_question(
+                    "Query Running",
+                    "A query is already running. Do you want to cancel it and run this query?",
+                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                    QMessageBox.StandardButton.No
+                )
+                if reply != QMessageBox.StandardButton.Yes:
+                    return
+                if not (self.query_worker and self.query_worker.is_running()):
+                    # The query ended while the question was open
+                    self._start_query(sql)
+                    return
                 self.query_worker.cancel()
-                self.query_worker.wait()
-            else:
-                return
+            
+            # Started from _on_query_worker_stopped once DuckDB has unwound
+            self._pending_query_sql = sql
+            self.show_busy("Cancelling query...")
+            return
         
-        self.show_progress("Preparing query...", 10)
+        self._start_query(sql)
+    
+    def _start_query(self, sql: str):
+        """Run a query, from the result cache when it holds a current result."""
+        cached = self.result_cache.get(sql, self.db_manager.tables_version)
+        if cached is not None:
+            self._show_cached_result(sql, cached)
+            return
+        
+        self.show_busy("Executing query...")
         
         try:
-            # Check if this is a large result set that needs pagination
-            should_use_pagination = self._should_use_pagination(sql)
-            
-            if should_use_pagination:
-                self._execute_query_with_pagination_bg(sql)
-            else:
-                self._execute_query_standard_bg(sql)
+            # Execute once; the worker switches to pagination for large results
+            self._query_tables_version = self.db_manager.tables_version
+            self._execute_query_adaptive(sql)
                 
         except Exception as e:
             self.hide_progress()
@@ -1184,7 +1692,7 @@ class MainWindow(QMainWindow):
             )
             
             self.query_executed.emit(sql, False)
-            QMessageBox.critical(self, "Query Error", error_msg)
+            self._show_critical("Query Error", error_msg)
     
     def run_all_queries(self, queries: List[str], tab_index: int = 0):
         """
@@ -1199,8 +1707,7 @@ class MainWindow(QMainWindow):
         
         # Check if already running
         if self.multi_query_worker and self.multi_query_worker.isRunning():
-            QMessageBox.warning(
-                self,
+            self._show_warning(
                 "Queries Running",
                 "Multiple queries are already being executed. Please wait for them to complete."
             )
@@ -1245,6 +1752,11 @@ class MainWindow(QMainWindow):
     
     def _on_multi_query_progress(self, message: str, current: int, total: int):
         """Handle progress updates from multi-query worker."""
+        self._throttled_progress(self._apply_multi_query_progress, message, current,
+                                 final=current in (0, total))
+    
+    def _apply_multi_query_progress(self, message: str, current: int):
+        """Show multi-query progress in the progress dialog, if it is still open."""
         if hasattr(self, 'multi_query_progress') and self.multi_query_progress:
             self.multi_query_progress.setLabelText(message)
             self.multi_query_progress.setValue(current)
@@ -1342,19 +1854,20 @@ class MainWindow(QMainWindow):
         details_text = QTextEdit()
         details_text.setReadOnly(True)
         
-        details_html = "<h4>Query Details:</h4>"
+        # Collected in a list and joined once; repeated += copies the text for every query
+        details_parts = ["<h4>Query Details:</h4>"]
         for result in results:
             status_color = "green" if result['status'] == 'Success' else "red"
-            details_html += f"<p><b style='color:{status_color}'>Query {result['query_num']}: {result['status']}</b><br>"
+            details_parts.append(f"<p><b style='color:{status_color}'>Query {result['query_num']}: {result['status']}</b><br>")
             
             if result['status'] == 'Success':
-                details_html += f"Rows: {result['rows']:,} | Time: {result['time']:.3f}s<br>"
+                details_parts.append(f"Rows: {result['rows']:,} | Time: {result['time']:.3f}s<br>")
             else:
-                details_html += f"Error: {result.get('error', 'Unknown error')}<br>"
+                details_parts.append(f"Error: {result.get('error', 'Unknown error')}<br>")
             
-            details_html += f"<code>{result['query']}</code></p>"
+            details_parts.append(f"<code>{result['query']}</code></p>")
         
-        details_text.setHtml(details_html)
+        details_text.setHtml("".join(details_parts))
         layout.addWidget(details_text)
         
         # Buttons
@@ -1365,246 +1878,157 @@ class MainWindow(QMainWindow):
         dialog.setLayout(layout)
         dialog.exec()
     
-    def _show_all_queries_summary(self, results: List[dict], successful: int, failed: int, total_rows: int, total_time: float):
-        """Show summary dialog for all queries execution."""
-        from PyQt6.QtWidgets import QDialog, QTextEdit, QDialogButtonBox
+    def _dispatch_standard_result(self, sql: str, result, from_cache: bool = False):
+        """Show a complete result in the standard view and record the query."""
+        self._switch_to_standard_view()
+        if self.results_view:
+            self.results_view.set_dataframe(result.data)
         
-        dialog = QDialog(self)
-        dialog.setWindowTitle("All Queries Execution Summary")
-        dialog.resize(700, 500)
-        
-        layout = QVBoxLayout()
+        self._finalize_query_execution(sql, result, from_cache=from_cache)
+    
+    def _execute_query_adaptive(self, sql: str):
+        """
+        Execute query in background, choosing the results view from its size.
         
-        # Summary label
-        summary_text = (
-            f"<h3>Execution Summary</h3>"
-            f"<p><b>Total Queries:</b> {successful + failed}<br>"
-            f"<b>Successful:</b> {successful}<br>"
-            f"<b>Failed:</b> {failed}<br>"
-            f"<b>Total Rows:</b> {total_rows:,}<br>"
-            f"<b>Total Time:</b> {total_time:.3f}s</p>"
+        The query runs a single time. Results within the pagination threshold
+        go to the standard view; larger ones arrive as a paginator that already
+        holds the leading rows.
+        """
+        worker = QueryRunnable(
+            self.db_manager, sql, pagination_threshold=self.pagination_threshold
         )
+        self.query_worker = worker
         
-        summary_label = QLabel(summary_text)
-        layout.addWidget(summary_label)
-        
-        # Results details
-        details_text = QTextEdit()
-        details_text.setReadOnly(True)
-        
-        details_content = "Query Execution Details:\n" + "=" * 80 + "\n\n"
-        
-        for result in results:
-            query_num = result['query_num']
-            status = result['status']
-            query = result['query']
-            
-            details_content += f"Query {query_num}: {status}\n"
-            details_content += f"SQL: {query}\n"
-            
-            if status == 'Success':
-                details_content += f"Rows: {result['rows']:,}, Time: {result['time']:.3f}s\n"
-            else:
-                error = result.get('error', 'Unknown error')
-                details_content += f"Error: {error}\n"
-            
-            details_content += "-" * 80 + "\n\n"
-        
-        details_text.setPlainText(details_content)
-        layout.addWidget(details_text)
+        # Connect signals; the worker is bound so late results can be told apart
+        signals = worker.signals
+        signals.progress_update.connect(self._on_query_progress)
+        signals.query_finished.connect(
+            lambda result, worker=worker: self._on_query_finished(worker, result)
+        )
+        signals.paginator_ready.connect(
+            lambda paginator, worker=worker: self._on_paginator_ready(worker, paginator)
+        )
+        signals.query_error.connect(
+            lambda sql, error_message, worker=worker: self._on_query_error(worker, sql, error_message)
+        )
         
-        # Buttons
-        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok)
-        buttons.accepted.connect(dialog.accept)
-        layout.addWidget(buttons)
+        signals.finished.connect(
+            lambda worker=worker: self._on_query_worker_stopped(worker)
+        )
         
-        dialog.setLayout(layout)
-        dialog.exec()
-
-    
-    def _should_use_pagination(self, sql: str) -> bool:
-        """Determine if query should use pagination based on estimated result size."""
-        try:
-            # Get estimated row count
-            count_sql = f"SELECT COUNT(*) as estimated_count FROM ({sql}) AS count_query"
-            count_result = self.db_manager.execute_query(count_sql)
-            
-            if count_result.success and count_result.data is not None:
-                estimated_rows = count_result.data.iloc[0, 0]
-                return estimated_rows > self.pagination_threshold
-            
-        except Exception as e:
-            logger.debug(f"Could not estimate result size: {e}")
-            
-        # Default to standard view for unknown sizes
-        return False
+        # Start the worker
+        self.query_pool.start(self.query_worker)
+        self.cancel_query_action.setEnabled(True)
+        logger.info(f"Started background query execution: {sql[:100]}...")
     
-    def _execute_query_standard(self, sql: str):
-        """Execute query with standard results view (DEPRECATED - use _execute_query_standard_bg)."""
-        result = self.db_manager.execute_query(sql)
-        
-        if result.success and result.data is not None:
-            self.show_progress("Processing results...", 60)
-            
-            # Switch to standard view
-            self._switch_to_standard_view()
-            
-            # Display results
-            if self.results_view:
-                self.results_view.set_dataframe(result.data)
-            
-            self._finalize_query_execution(sql, result)
-            
-        else:
-            self._handle_query_error(sql, result.error or "Query failed")
+    def cancel_query(self):
+        """Interrupt the query that is currently running."""
+        if self.query_worker and self.query_worker.is_running():
+            self.query_worker.cancel()
+            self.status_bar.showMessage("Cancelling query...")
     
-    def _execute_query_standard_bg(self, sql: str):
-        """Execute query with standard results view in background thread."""
-        # Create and configure worker
-        self.query_worker = QueryWorker(self.db_manager, sql, self)
+    def _on_query_worker_stopped(self, worker: QueryRunnable):
+        """Update the UI once a query has ended on its pool thread."""
+        if worker is self.query_worker:
+            # Only a cancelled query is still set; the result handlers clear the others
+            self.query_worker = None
+            if worker.is_cancelled and self._pending_query_sql is None:
+                self.hide_progress()
+                self.status_bar.showMessage("Query cancelled")
         
-        # Connect signals
-        self.query_worker.progress_update.connect(self._on_query_progress)
-        self.query_worker.query_finished.connect(self._on_query_finished)
-        self.query_worker.query_error.connect(self._on_query_error)
+        if self.query_worker is not None:
+            # A newer query is still running
+            return
         
-        # Start the worker
-        self.query_worker.start()
-        logger.info(f"Started background query execution: {sql[:100]}...")
+        self.cancel_query_action.setEnabled(False)
+        if self._pending_query_sql is not None:
+            sql, self._pending_query_sql = self._pending_query_sql, None
+            self._start_query(sql)
     
     def _on_query_progress(self, message: str, percentage: int):
         """Handle progress updates from query worker."""
         self.show_progress(message, percentage)
     
-    def _on_query_finished(self, result):
+    def _on_query_finished(self, worker: QueryRunnable, result):
         """Handle successful query completion."""
+        if worker is not self.query_worker:
+            # A newer query has replaced this one
+            return
+        
         try:
-            sql = self.query_worker.sql if self.query_worker else ""
-            
-            self.show_progress("Processing results...", 80)
+            sql = worker.sql
             
             if result.success and result.data is not None:
-                # Switch to standard view
-                self._switch_to_standard_view()
-                
-                # Display results
-                if self.results_view:
-                    self.results_view.set_dataframe(result.data)
-                
-                self._finalize_query_execution(sql, result)
+                self.result_cache.put(sql, self._query_tables_version, result)
+                self._dispatch_standard_result(sql, result)
             else:
                 self._handle_query_error(sql, result.error or "Query failed")
                 
         except Exception as e:
             logger.error(f"Error processing query results: {e}", exc_info=True)
             self.hide_progress()
-            QMessageBox.critical(self, "Error", f"Failed to process results: {str(e)}")
+            self._show_critical("Error", f"Failed to process results: {str(e)}")
         finally:
-            # Clean up worker
-            if self.query_worker:
-                self.query_worker.deleteLater()
-                self.query_worker = None
+            self.query_worker = None
     
-    def _on_query_error(self, sql: str, error_message: str):
+    def _on_query_error(self, worker: QueryRunnable, sql: str, error_message: str):
         """Handle query execution error."""
-        self._handle_query_error(sql, error_message)
+        if worker is not self.query_worker:
+            # A newer query has replaced this one
+            return
         
-        # Clean up worker
-        if self.query_worker:
-            self.query_worker.deleteLater()
-            self.query_worker = None
+        self._handle_query_error(sql, error_message)
+        self.query_worker = None
     
-    def _execute_query_with_pagination(self, sql: str):
-        """Execute query with paginated results view (DEPRECATED - use _execute_query_with_pagination_bg)."""
-        try:
-            self.show_progress("Setting up pagination...", 40)
-            
-            # Create paginator
-            paginator = self.db_manager.create_query_paginator(sql)
-            
-            self.show_progress("Loading first page...", 60)
-            
-            # Switch to paginated view
-            self._switch_to_paginated_view()
-            
-            # Set up paginated results
-            if self.paginated_results:
-                self.paginated_results.set_paginator(paginator)
-            
-            # Create a lightweight result for history tracking
-            total_rows = paginator.get_total_rows()
-            sample_data = paginator.get_sample_data()
-            
-            # Create fake result for tracking
-            import time
-            execution_time = time.time() - time.time()  # Will be updated properly
-            
-            fake_result = type('Result', (), {
-                'success': True,
-                'data': sample_data,
-                'execution_time': execution_time,
-                'row_count': total_rows
-            })()
-            
-            self._finalize_query_execution(sql, fake_result, is_paginated=True)
-            
-        except Exception as e:
-            self._handle_query_error(sql, str(e))
+    def _show_cached_result(self, sql: str, cached):
+        """Display a result from the result cache without running the query."""
+        result = QueryResult(success=True, data=cached.data, execution_time=0.0, row_count=cached.row_count)
+        self._dispatch_standard_result(sql, result, from_cache=True)
     
-    def _execute_query_with_pagination_bg(self, sql: str):
-        """Execute query with paginated results view in background thread."""
-        # Create and configure worker
-        self.paginated_worker = PaginatedQueryWorker(self.db_manager, sql, self)
+    def _dispatch_paginated_result(self, sql: str, paginator):
+        """Show a paginated result and record the query."""
+        self._switch_to_paginated_view()
+        if self.paginated_results:
+            self.paginated_results.set_paginator(paginator)
         
-        # Connect signals
-        self.paginated_worker.progress_update.connect(self._on_query_progress)
-        self.paginated_worker.paginator_ready.connect(self._on_paginator_ready)
-        self.paginated_worker.query_error.connect(self._on_query_error)
+        self._finalize_paginated_query(sql, paginator)
+    
+    def _finalize_paginated_query(self, sql: str, paginator):
+        """
+        Record a paginated query in history and the status bar.
         
-        # Start the worker
-        self.paginated_worker.start()
-        logger.info(f"Started background paginated query setup: {sql[:100]}...")
+        Uses the paginator's cached sample rather than reading the result
+        again; the results widget has already fetched it to size its pages.
+        """
+        result = type('Result', (), {
+            'success': True,
+            'data': paginator.get_sample_data(),
+            'execution_time': paginator.execution_time,
+            'row_count': paginator.get_total_rows(),
+            'row_count_estimated': paginator.is_total_estimated
+        })()
+        
+        self._finalize_query_execution(sql, result, is_paginated=True)
     
-    def _on_paginator_ready(self, paginator):
+    def _on_paginator_ready(self, worker: QueryRunnable, paginator):
         """Handle paginator setup completion."""
+        if worker is not self.query_worker:
+            # A newer query has replaced this one; release the unused result stream
+            paginator.close()
+            return
+        
         try:
-            sql = self.paginated_worker.sql if self.paginated_worker else ""
+            sql = worker.sql
             
             self.show_progress("Setting up paginated view...", 85)
-            
-            # Switch to paginated view
-            self._switch_to_paginated_view()
-            
-            # Set up paginated results
-            if self.paginated_results:
-                self.paginated_results.set_paginator(paginator)
-            
-            # Create a lightweight result for history tracking
-            total_rows = paginator.get_total_rows()
-            sample_data = paginator.get_sample_data()
-            
-            # Create fake result for tracking
-            import time
-            execution_time = time.time() - time.time()  # Will be updated properly
-            
-            fake_result = type('Result', (), {
-                'success': True,
-                'data': sample_data,
-                'execution_time': execution_time,
-                'row_count': total_rows
-            })()
-            
-            self._finalize_query_execution(sql, fake_result, is_paginated=True)
+            self._dispatch_paginated_result(sql, paginator)
             
         except Exception as e:
             logger.error(f"Error setting up paginated view: {e}", exc_info=True)
             self.hide_progress()
-            QMessageBox.critical(self, "Error", f"Failed to set up paginated view: {str(e)}")
+            self._show_critical("Error", f"Failed to set up paginated view: {str(e)}")
         finally:
-            # Clean up worker
-            if self.paginated_worker:
-                self.paginated_worker.deleteLater()
-                self.paginated_worker = None
+            self.query_worker = None
     
     def _switch_to_standard_view(self):
         """Switch to standard results view."""
@@ -1618,14 +2042,14 @@ class MainWindow(QMainWindow):
             self.results_stack.setCurrentIndex(1)  # Paginated view is index 1
             self.current_results_mode = "paginated"
     
-    def _finalize_query_execution(self, sql: str, result, is_paginated: bool = False):
+    def _finalize_query_execution(self, sql: str, result, is_paginated: bool = False,
+                                  from_cache: bool = False):
         """Finalize query execution with common tasks."""
-        self.show_progress("Updating display...", 80)
-        
         # Enhanced status message with more details
         row_count = result.row_count
-        col_count = len(result.data.columns) if hasattr(result.data, 'columns') else 0
-        memory_mb = result.data.memory_usage(deep=True).sum() / (1024 * 1024) if hasattr(result.data, 'memory_usage') else 0
+        has_data = result.data is not None
+        col_count = result.data.shape[1] if has_data else 0
+        memory_mb = estimate_dataframe_bytes(result.data) / (1024 * 1024) if has_data else 0
         
         # Track last query for metrics
         self.last_query_sql = sql
@@ -1634,6 +2058,7 @@ class MainWindow(QMainWindow):
         
         # Add to query history
         tables_used = self._extract_tables_from_sql(sql)
+        self._last_tables_used = {name.lower() for name in tables_used}
         self.query_history.add_query(
             sql=sql,
             execution_time=result.execution_time,
@@ -1642,16 +2067,21 @@ class MainWindow(QMainWindow):
             tables_used=tables_used
         )
         
-        self.show_progress("Query completed", 100)
         self.hide_progress()
         
         # Enhanced status message
         pagination_info = " (paginated)" if is_paginated else ""
+        if from_cache:
+            pagination_info += " (cached)"
+        approx = "~" if getattr(result, 'row_count_estimated', False) else ""
         status_msg = (
             f"Query executed successfully in {result.execution_time:.3f}s - "
-            f"{row_count:,} rows, {col_count} columns ({memory_mb:.1f} MB){pagination_info}"
+            f"{approx}{row_count:,} rows, {col_count} columns ({memory_mb:.1f} MB){pagination_info}"
         )
         self.status_bar.showMessage(status_msg)
+        self.metrics_link_label.setVisible(
+            row_count > self.METRICS_LINK_ROWS or result.execution_time > self.METRICS_LINK_SECONDS
+        )
         
         self.query_executed.emit(sql, True)
         self.update_status_indicators()
@@ -1665,6 +2095,7 @@ class MainWindow(QMainWindow):
         
         # Show detailed error in status bar
         self.status_bar.showMessage(f"Query failed: {clean_error}")
+        self.metrics_link_label.setVisible(False)
         
         # Update SQL editor status if it supports it
         if hasattr(self.sql_editor, 'set_query_result_info'):
@@ -1697,8 +2128,7 @@ class MainWindow(QMainWindow):
         except Exception as e:
             # Fallback to simple message box if error dialog fails
             logger.error(f"Failed to show error dialog: {e}")
-            QMessageBox.critical(
-                self, 
+            self._show_critical(
                 "Query Error", 
                 f"Query failed with error:\n\n{error_message}\n\nSQL:\n{sql[:200]}{'...' if len(sql) > 200 else ''}"
             )
@@ -1708,13 +2138,28 @@ class MainWindow(QMainWindow):
         metrics_dialog = QueryMetricsDialog(self, sql, result_data, execution_time)
         metrics_dialog.exec()
     
+    @property
+    def last_query_result(self) -> Optional[pd.DataFrame]:
+        """Result of the last query, or a sample of it once the full frame is gone."""
+        data = self._last_query_ref() if self._last_query_ref is not None else None
+        return data if data is not None else self._last_query_sample
+    
+    @last_query_result.setter
+    def last_query_result(self, data: Optional[pd.DataFrame]):
+        # Holding only a weak reference lets a large result be freed once it is
+        # no longer displayed or cached
+        try:
+            self._last_query_ref = weakref.ref(data) if data is not None else None
+        except TypeError:
+            self._last_query_ref = None
+        self._last_query_sample = data.head(self.METRICS_SAMPLE_ROWS) if isinstance(data, pd.DataFrame) else data
+    
     def show_last_query_metrics(self):
         """Show metrics for the last executed query."""
         if (self.last_query_result is None or 
             (hasattr(self.last_query_result, 'empty') and self.last_query_result.empty) or 
             not self.last_query_sql):
-            QMessageBox.information(
-                self,
+            self._show_info(
                 "No Query",
                 "No query has been executed yet. Run a query first to see metrics."
             )
@@ -1794,22 +2239,19 @@ class MainWindow(QMainWindow):
                 if self.table_list:
                     metadata = self.db_manager.get_table_metadata(new_name)
                     if metadata:
-                        self.table_list.remove_table(old_name)
-                        self.table_list.add_table(metadata)
+                        self.table_list.rename_in_place(old_name, new_name, metadata)
                 
                 self.status_bar.showMessage(f"Table renamed to '{new_name}'")
                 self.update_status_indicators()
                 
                 # Show success message
-                QMessageBox.information(
-                    self,
+                self._show_info(
                     "Rename Successful",
                     f"Table '{old_name}' has been renamed to '{new_name}'"
                 )
             else:
                 self.status_bar.showMessage(f"Failed to rename table '{old_name}'")
-                QMessageBox.critical(
-                    self,
+                self._show_critical(
                     "Rename Error", 
                     f"Failed to rename table '{old_name}' to '{new_name}'"
                 )
@@ -1817,7 +2259,7 @@ class MainWindow(QMainWindow):
         except Exception as e:
             error_msg = f"Rename failed: {str(e)}"
             self.status_bar.showMessage(error_msg)
-            QMessageBox.critical(self, "Rename Error", error_msg)
+            self._show_critical("Rename Error", error_msg)
     
     def on_table_dropped(self, table_name: str):
         """Handle table drop operation."""
@@ -1835,24 +2277,20 @@ class MainWindow(QMainWindow):
                     self.table_list.remove_table(table_name)
                 
                 # Clear results if showing this table
-                if self.results_view:
-                    current_sql = self.sql_editor.get_sql() if self.sql_editor else ""
-                    if table_name in current_sql:
-                        self.results_view.clear()
+                if self.results_view and table_name.lower() in self._get_last_tables_used():
+                    self.results_view.clear()
                 
                 self.status_bar.showMessage(f"Table '{table_name}' dropped")
                 self.update_status_indicators()
                 
                 # Show success message
-                QMessageBox.information(
-                    self,
+                self._show_info(
                     "Drop Successful",
                     f"Table '{table_name}' has been dropped"
                 )
             else:
                 self.status_bar.showMessage(f"Failed to drop table '{table_name}'")
-                QMessageBox.critical(
-                    self,
+                self._show_critical(
                     "Drop Error",
                     f"Failed to drop table '{table_name}'"
                 )
@@ -1860,88 +2298,103 @@ class MainWindow(QMainWindow):
         except Exception as e:
             error_msg = f"Drop failed: {str(e)}"
             self.status_bar.showMessage(error_msg)
-            QMessageBox.critical(self, "Drop Error", error_msg)
+            self._show_critical("Drop Error", error_msg)
     
     def show_column_analysis(self, table_name: str):
         """Show detailed column analysis for a table."""
         if not self.db_manager:
             return
         
+        if self._analysis_worker and self._analysis_worker.isRunning():
+            self.status_bar.showMessage("Another table is still being analyzed")
+            return
+        
         self.status_bar.showMessage(f"Analyzing columns for table '{table_name}'...")
-        self.show_progress("Analyzing table columns...", 20)
+        self.show_progress("Analyzing table columns...", 0)
         
-        try:
-            # Perform column analysis
-            analysis = self.db_manager.analyze_table_columns(table_name)
-            
-            if analysis:
-                self.show_progress("Preparing analysis dialog...", 80)
-                
-                # Import dialog class
-                from .column_metadata_dialog import ColumnMetadataDialog
-                
-                # Show analysis dialog
-                dialog = ColumnMetadataDialog(analysis, self)
-                
-                self.hide_progress()
-                self.status_bar.showMessage(f"Column analysis completed for '{table_name}'")
-                
-                dialog.exec()
-            else:
-                self.hide_progress()
-                self.status_bar.showMessage(f"Failed to analyze table '{table_name}'")
-                QMessageBox.critical(
-                    self,
-                    "Analysis Error",
-                    f"Failed to analyze columns for table '{table_name}'"
-                )
-                
-        except Exception as e:
-            self.hide_progress()
-            error_msg = f"Column analysis failed: {str(e)}"
-            self.status_bar.showMessage(error_msg)
-            QMessageBox.critical(self, "Analysis Error", error_msg)
+        self._analysis_worker = ColumnAnalysisWorker(self.db_manager, table_name, self)
+        self._analysis_worker.column_analyzed.connect(self._on_column_analyzed)
+        self._analysis_worker.analysis_finished.connect(
+            lambda analysis: self._on_column_analysis_finished(table_name, analysis)
+        )
+        self._analysis_worker.analysis_error.connect(self._on_column_analysis_error)
+        self._analysis_worker.start()
+    
+    def _on_column_analyzed(self, column_name: str, done: int, total: int):
+        """Report each column as its analysis completes."""
+        self.show_progress(f"Analyzed column '{column_name}' ({done}/{total})", 100 * done // total)
+    
+    def _on_column_analysis_finished(self, table_name: str, analysis):
+        """Show the column analysis dialog once every column is done."""
+        self.hide_progress()
+        
+        if not analysis:
+            self.status_bar.showMessage(f"Failed to analyze table '{table_name}'")
+            self._show_critical(
+                "Analysis Error",
+                f"Failed to analyze columns for table '{table_name}'"
+            )
+            return
+        
+        from .column_metadata_dialog import ColumnMetadataDialog
+        
+        self.status_bar.showMessage(f"Column analysis completed for '{table_name}'")
+        dialog = ColumnMetadataDialog(analysis, self)
+        dialog.exec()
+    
+    def _on_column_analysis_error(self, error_message: str):
+        """Handle a failed column analysis."""
+        self.hide_progress()
+        error_msg = f"Column analysis failed: {error_message}"
+        self.status_bar.showMessage(error_msg)
+        self._show_critical("Analysis Error", error_msg)
     
     def show_table_profiling(self, table_name: str):
         """Show comprehensive table profiling for a table."""
         if not self.db_manager:
             return
         
+        if self._table_load_worker and self._table_load_worker.isRunning():
+            self.status_bar.showMessage("Another table is still being loaded for profiling")
+            return
+        
         self.status_bar.showMessage(f"Loading data for table profiling '{table_name}'...")
-        self.show_progress("Loading table data...", 10)
+        self.show_busy("Loading table data...")
         
-        try:
-            # Get table data for profiling
-            df = self.db_manager.get_table_dataframe(table_name)
-            
-            if df is not None and not df.empty:
-                self.show_progress("Preparing profiling dialog...", 50)
-                
-                # Import dialog class
-                from .table_profiling_dialog import TableProfilingDialog
-                
-                self.hide_progress()
-                self.status_bar.showMessage(f"Starting table profiling for '{table_name}'...")
-                
-                # Show profiling dialog
-                dialog = TableProfilingDialog(df, table_name, self)
-                dialog.exec()
-                
-                self.status_bar.showMessage(f"Table profiling completed for '{table_name}'")
-            else:
-                self.hide_progress()
-                self.status_bar.showMessage(f"No data found in table '{table_name}'")
-                QMessageBox.information(
-                    self,
-                    "Profiling Info",
-                    f"Table '{table_name}' appears to be empty or could not be loaded."
-                )
-                
-        except Exception as e:
-            self.hide_progress()
-            error_msg = f"Table profiling failed: {str(e)}"
-            self.status_bar.showMessage(error_msg)
-            QMessageBox.critical(self, "Profiling Error", error_msg)
+        # Profiling itself runs on the dialog's own worker once the data is loaded
+        self._table_load_worker = TableLoadWorker(self.db_manager, table_name, self)
+        self._table_load_worker.data_loaded.connect(
+            lambda df: self._on_profiling_data_loaded(table_name, df)
+        )
+        self._table_load_worker.load_error.connect(self._on_profiling_load_error)
+        self._table_load_worker.start()
+    
+    def _on_profiling_data_loaded(self, table_name: str, df):
+        """Open the profiling dialog for the loaded table data."""
+        self.hide_progress()
+        
+        if df is None or df.empty:
+            self.status_bar.showMessage(f"No data found in table '{table_name}'")
+            self._show_info(
+                "Profiling Info",
+                f"Table '{table_name}' appears to be empty or could not be loaded."
+            )
+            return
+        
+        from .table_profiling_dialog import TableProfilingDialog
+        
+        self.status_bar.showMessage(f"Starting table profiling for '{table_name}'...")
+        dialog = TableProfilingDialog(df, table_name, self)
+        dialog.exec()
+        
+        self.status_bar.showMessage(f"Table profiling completed for '{table_name}'")
+    
+    def _on_profiling_load_error(self, error_message: str):
+        """Handle a failure to load table data for profiling."""
+        self.hide_progress()
+        error_msg = f"Table profiling failed: {error_message}"
+        self.status_bar.showMessage(error_msg)
+        self._show_critical("Profiling Error", error_msg)
     
     def load_query_from_history(self, sql: str):
         """Load a query from history into the SQL editor."""
@@ -1979,6 +2432,11 @@ class MainWindow(QMainWindow):
             if splitter_state:
                 self.splitter.restoreState(splitter_state)
         
+        # Result size above which the paginated view is used
+        self.pagination_threshold = self.settings.value(
+            "pagination/threshold", self.pagination_threshold, type=int
+        )
+        
         # Restore tab state
         if self.sql_editor:
             self.sql_editor.restore_state()
@@ -1990,14 +2448,17 @@ class MainWindow(QMainWindow):
         
         if self.splitter:
             self.settings.setValue("splitterState", self.splitter.saveState())
+        
+        # Write everything to the backing store at once
+        self.settings.sync()
     
     def show_optimization_settings(self):
         """Show data optimization settings dialog."""
         from .data_optimization_settings import DataOptimizationSettingsDialog
-        from ..data_pagination import PaginationConfig
         
         # Create current config from main window settings
         current_config = PaginationConfig(
+            pagination_threshold=self.pagination_threshold,
             default_page_size=getattr(self, 'default_page_size', 1000),
             memory_threshold_mb=getattr(self, 'memory_threshold_mb', 100.0),
             max_memory_usage_mb=getattr(self, 'max_memory_usage_mb', 1000.0)
@@ -2010,7 +2471,7 @@ class MainWindow(QMainWindow):
             new_config = dialog.get_config()
             
             # Update main window settings
-            self.pagination_threshold = getattr(new_config, 'pagination_threshold', 10000)
+            self.pagination_threshold = new_config.pagination_threshold
             self.default_page_size = new_config.default_page_size
             self.memory_threshold_mb = new_config.memory_threshold_mb
             self.max_memory_usage_mb = new_config.max_memory_usage_mb
@@ -2022,28 +2483,48 @@ class MainWindow(QMainWindow):
             self.status_bar.showMessage("Data optimization settings updated")
             
             # Save settings
-            self.settings.setValue("pagination/threshold", self.pagination_threshold)
-            self.settings.setValue("pagination/page_size", self.default_page_size)
-            self.settings.setValue("memory/threshold_mb", self.memory_threshold_mb)
-            self.settings.setValue("memory/max_usage_mb", self.max_memory_usage_mb)
+            self.settings.beginGroup("pagination")
+            self.settings.setValue("threshold", self.pagination_threshold)
+            self.settings.setValue("page_size", self.default_page_size)
+            self.settings.endGroup()
+            
+            self.settings.beginGroup("memory")
+            self.settings.setValue("threshold_mb", self.memory_threshold_mb)
+            self.settings.setValue("max_usage_mb", self.max_memory_usage_mb)
+            self.settings.endGroup()
+            
+            self.settings.sync()
+    
+    def update_schema_info(self, force: bool = False):
+        """
+        Schedule an update of schema information for auto-completion.
+        
+        Args:
+            force: Refresh even if the set of tables has not changed
+        """
+        self._schema_force_pending = self._schema_force_pending or force
+        self._schema_timer.start()
     
-    def update_schema_info(self):
+    def _do_update_schema_info(self):
         """Update schema information for auto-completion."""
+        force = self._schema_force_pending
+        self._schema_force_pending = False
+        self._schema_timer.stop()
+        
         if not self.sql_editor or not self.db_manager:
             return
         
+        schema_key = self.db_manager.tables_version
+        if not force and schema_key == self._schema_cache_key:
+            return
+        
         try:
-            # Get tables and their columns
-            tables = {}
-            for table_metadata in self.db_manager.list_tables():
-                table_name = table_metadata.name
-                try:
-                    # Get column information
-                    columns = self.db_manager.get_table_columns(table_name)
-                    tables[table_name] = [col['name'] for col in columns]
-                except Exception as e:
-                    logger.warning(f"Could not get columns for table {table_name}: {e}")
-                    tables[table_name] = []
+            tables = self.db_manager.get_schema_columns()
+            self._schema_cache_key = schema_key
+            if not force and tables == self._schema_columns:
+                # Data changed but no table or column did
+                return
+            self._schema_columns = tables
             
             # Update SQL editor auto-completion
             self.sql_editor.update_schema_info(tables)
@@ -2052,6 +2533,12 @@ class MainWindow(QMainWindow):
         except Exception as e:
             logger.error(f"Failed to update schema info: {e}")
     
+    def refresh_schema(self):
+        """Reload auto-completion schema information from the database."""
+        self._schema_force_pending = True
+        self._do_update_schema_info()
+        self.status_bar.showMessage("Schema information refreshed")
+    
     def insert_cte_template(self):
         """Insert a CTE template into the SQL editor."""
         if self.sql_editor:
@@ -2069,6 +2556,12 @@ class MainWindow(QMainWindow):
     
     def closeEvent(self, event):
         """Handle application close event."""
+        if self._importing:
+            # The import flow resumes on the database once its worker finishes
+            self.status_bar.showMessage("Wait for the import to finish before closing")
+            event.ignore()
+            return
+        
         # Save window state
         self.save_window_state()
         
@@ -2076,22 +2569,39 @@ class MainWindow(QMainWindow):
         if self.sql_editor:
             self.sql_editor.save_state()
         
+        # Flush queued query history writes
+        self.query_history.close()
+        
+        # Background work on the connection has to end before it closes
+        if self.query_worker and self.query_worker.is_running():
+            self.query_worker.cancel()
+        self.query_pool.waitForDone()
+        if self._export_runnable is not None:
+            # Let the export finish writing rather than leave a truncated file
+            QThreadPool.globalInstance().waitForDone()
+        if self.multi_query_worker and self.multi_query_worker.isRunning():
+            self.multi_query_worker.cancel()
+        for worker in (self.multi_query_worker, self._analysis_worker, self._table_load_worker):
+            if worker is not None:
+                worker.wait()
+        if self.paginated_results:
+            self.paginated_results.shutdown()
+        
         # Close database connection
         if self.db_manager:
             self.db_manager.close()
         
         event.accept()
     
+    def _get_last_tables_used(self) -> set:
+        """Get the lower-cased table names referenced by the last successful query."""
+        if self._last_tables_used is None:
+            self._last_tables_used = {table.lower() for table in extract_tables_from_sql(self.last_query_sql)}
+        return self._last_tables_used
+    
     def _extract_tables_from_sql(self, sql: str) -> list[str]:
         """Extract table names from SQL query for history tracking."""
-        import re
-        
-        # Simple regex to find table names after FROM and JOIN keywords
-        # This is a basic implementation - could be enhanced with proper SQL parsing
-        pattern = r'(?:FROM|JOIN)\s+([a-zA-Z_][a-zA-Z0-9_]*)'
-        matches = re.findall(pattern, sql, re.IGNORECASE)
-        
-        return list(set(matches))  # Remove duplicates
+        return list(extract_tables_from_sql(sql))
 
 
 def main():
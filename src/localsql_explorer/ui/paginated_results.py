@@ -10,16 +10,18 @@ This module provides:
 """
 
 import logging
-import math
+import threading
 from decimal import Decimal
-from typing import Optional, Callable, Dict, Any
+from typing import Optional, Callable, Dict, List
 
 import numpy as np
 
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer, QEvent
+from PyQt6.QtCore import (
+    Qt, QObject, QRunnable, QThread, QThreadPool, pyqtSignal, QTimer, QEvent, QModelIndex, QVariant
+)
 from PyQt6.QtGui import QFont, QAction
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
+    QWidget, QVBoxLayout, QHBoxLayout, QTableView,
     QLabel, QPushButton, QSpinBox, QProgressBar, QGroupBox, QFrame,
     QComboBox, QLineEdit, QCheckBox, QMessageBox, QSplitter,
     QHeaderView, QAbstractItemView, QMenu, QApplication
@@ -27,42 +29,188 @@ from PyQt6.QtWidgets import (
 
 import pandas as pd
 
-from ..data_pagination import QueryPaginator, PaginationConfig, PageInfo, format_memory_size, get_memory_usage_mb
+from ..data_pagination import (
+    QueryPaginator, PaginationConfig, PageInfo, PageLoadCancelled, format_memory_size, get_memory_usage_mb
+)
+from .results_view import PandasTableModel
 
 logger = logging.getLogger(__name__)
 
 
-class PaginationWorker(QThread):
-    """Worker thread for loading data pages."""
+class PageLoadSignals(QObject):
+    """Signals emitted by a PageLoadRunnable."""
     
     page_loaded = pyqtSignal(object, object)  # DataFrame, PageInfo
     progress_updated = pyqtSignal(str, int)
     error_occurred = pyqtSignal(str)
+
+
+class PageLoadRunnable(QRunnable):
+    """
+    Runnable that loads one data page on a thread pool.
+    
+    Pages load on a pooled thread rather than a new QThread each, so paging
+    through results does not create and tear down a thread per click.
+    """
     
     def __init__(self, paginator: QueryPaginator, page_number: int, page_size: int):
         super().__init__()
         self.paginator = paginator
         self.page_number = page_number
         self.page_size = page_size
+        self.signals = PageLoadSignals()
+        self._is_cancelled = False
+        self._done = threading.Event()
     
     def run(self):
-        """Load the data page in background thread."""
+        """Load the data page on a pool thread."""
+        try:
+            # Requests superseded while waiting in the queue never touch the database
+            if not self._is_cancelled:
+                self._load()
+        finally:
+            self._done.set()
+    
+    def _load(self):
+        """Load the page and emit it."""
         try:
             def progress_callback(message: str, progress: int):
-                self.progress_updated.emit(message, progress)
+                if self._is_cancelled:
+                    raise PageLoadCancelled()
+                self.signals.progress_updated.emit(message, progress)
             
             data, page_info = self.paginator.get_page(
                 self.page_number, 
                 self.page_size, 
                 progress_callback
             )
-            self.page_loaded.emit(data, page_info)
+            self.signals.page_loaded.emit(data, page_info)
             
+        except PageLoadCancelled:
+            logger.debug(f"Loading page {self.page_number} was cancelled")
         except Exception as e:
             logger.error(f"Failed to load page {self.page_number}: {e}")
+            self.signals.error_occurred.emit(str(e))
+    
+    @property
+    def is_cancelled(self) -> bool:
+        """Whether cancellation of the page load was requested."""
+        return self._is_cancelled
+    
+    def is_running(self) -> bool:
+        """Whether the page load has been queued and not yet ended."""
+        return not self._done.is_set()
+    
+    def cancel(self):
+        """Request that the page load stop at its next progress step."""
+        self._is_cancelled = True
+
+
+class RowCountWorker(QThread):
+    """Worker thread for counting the rows of a paginated result."""
+    
+    count_ready = pyqtSignal(object, int)  # QueryPaginator, total rows
+    error_occurred = pyqtSignal(str)
+    
+    def __init__(self, paginator: QueryPaginator, parent=None):
+        super().__init__(parent)
+        self.paginator = paginator
+    
+    def run(self):
+        """Count the rows in background thread."""
+        try:
+            self.count_ready.emit(self.paginator, self.paginator.get_exact_total_rows())
+        except Exception as e:
+            logger.error(f"Failed to count rows: {e}")
             self.error_occurred.emit(str(e))
 
 
+class PageTableModel(PandasTableModel):
+    """
+    Table model for one page of results.
+    
+    Cells are read from the page DataFrame only when the view asks for them.
+    Missing values show blank in gray italics and numbers are right-aligned.
+    Long text is shortened for display; cell_text and row_texts give it in full.
+    """
+    
+    NUMERIC_ALIGNMENT = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+    MAX_DISPLAY_CHARS = 256  # Columns are capped at 300 px, so longer text is never seen
+    
+    def __init__(self, dataframe: Optional[pd.DataFrame] = None, parent=None):
+        self._null_font = QFont("", -1, QFont.Weight.Normal, True)  # Italic
+        super().__init__(dataframe, parent)
+    
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> QVariant:
+        """Return data for the given index and role."""
+        if not index.isValid():
+            return QVariant()
+        
+        row, column = index.row(), index.column()
+        if self._missing[row, column]:
+            if role == Qt.ItemDataRole.DisplayRole:
+                return ""
+            if role == Qt.ItemDataRole.ForegroundRole:
+                return Qt.GlobalColor.gray
+            if role == Qt.ItemDataRole.FontRole:
+                return self._null_font
+            return QVariant()
+        
+        if role == Qt.ItemDataRole.DisplayRole:
+            text = self._formatters[column](self._dataframe.iat[row, column])
+            if len(text) > self.MAX_DISPLAY_CHARS:
+                text = text[:self.MAX_DISPLAY_CHARS - 1] + "…"
+            return text
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            numeric = self._numeric[column]
+            if numeric is None:
+                numeric = self._is_number(self._dataframe.iat[row, column])
+            if numeric:
+                return self.NUMERIC_ALIGNMENT
+        
+        return QVariant()
+    
+    @property
+    def columns(self) -> pd.Index:
+        """Columns of the page being shown."""
+        return self._dataframe.columns
+    
+    def cell_text(self, row: int, column: int) -> str:
+        """Return the full text of a cell."""
+        if self._missing[row, column]:
+            return ""
+        return self._formatters[column](self._dataframe.iat[row, column])
+    
+    def row_texts(self, row: int) -> List[str]:
+        """Return the full text of every cell in a row."""
+        frame = self._dataframe
+        missing = self._missing[row]
+        return [
+            "" if missing[column] else formatter(frame.iat[row, column])
+            for column, formatter in enumerate(self._formatters)
+        ]
+    
+    def _load(self, dataframe: pd.DataFrame):
+        """Hold a page and the missing-value mask and number columns derived from it."""
+        super()._load(dataframe)
+        self._missing = dataframe.isna().to_numpy()
+        self._numeric = [self._column_is_numeric(dtype) for dtype in dataframe.dtypes]
+    
+    @staticmethod
+    def _column_is_numeric(dtype) -> Optional[bool]:
+        """Return whether a column holds numbers, or None when only its values can tell."""
+        if pd.api.types.is_bool_dtype(dtype):
+            return False
+        if pd.api.types.is_numeric_dtype(dtype):
+            return True
+        return None
+    
+    @staticmethod
+    def _is_number(value) -> bool:
+        """Return whether a value from an untyped column is a number."""
+        return isinstance(value, (int, float, Decimal, np.number)) and not isinstance(value, (bool, np.bool_))
+
+
 class PaginatedTableWidget(QWidget):
     """
     Table widget with pagination support for large datasets.
@@ -83,6 +231,8 @@ class PaginatedTableWidget(QWidget):
     metrics_requested = pyqtSignal(str, object, str)  # SQL query, DataFrame, metrics_type ("original" or "filtered")
     status_updated = pyqtSignal(str)  # Status message for main window
     
+    RESIZE_SAMPLE_ROWS = 100  # Rows measured when auto-sizing columns
+    
     def __init__(self, paginator: Optional[QueryPaginator] = None, 
                  config: Optional[PaginationConfig] = None, parent=None):
         super().__init__(parent)
@@ -93,17 +243,24 @@ class PaginatedTableWidget(QWidget):
         self.current_page_size = self.config.default_page_size
         self.current_data: Optional[pd.DataFrame] = None
         self.current_page_info: Optional[PageInfo] = None
-        self.worker: Optional[PaginationWorker] = None
+        self.worker: Optional[PageLoadRunnable] = None
+        self._prefetch: Optional[PageLoadRunnable] = None  # Next page read ahead into the paginator cache
+        # Page loads share the connection, so they run one at a time on a reused thread
+        self.page_pool = QThreadPool(self)
+        self.page_pool.setMaxThreadCount(1)
+        self.count_worker: Optional[RowCountWorker] = None
         
         # Filter state
         self.original_paginator: Optional[QueryPaginator] = None
         self.is_filtered = False
         self.filter_sql_condition = ""
         
-        # Memory monitoring
+        # Memory monitoring: refreshed as pages load, with a slow poll for other
+        # changes while the widget is shown
         self.memory_timer = QTimer()
+        self.memory_timer.setInterval(10000)  # Update every 10 seconds
         self.memory_timer.timeout.connect(self.update_memory_usage)
-        self.memory_timer.start(2000)  # Update every 2 seconds
+        self._memory_color: Optional[str] = None
         
         self.setup_ui()
         
@@ -121,20 +278,24 @@ class PaginatedTableWidget(QWidget):
         # Main content area
         content_splitter = QSplitter(Qt.Orientation.Vertical)
         
-        # Table widget
-        self.table_widget = QTableWidget()
-        self.table_widget.setAlternatingRowColors(True)
-        self.table_widget.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectItems)  # Allow cell selection
-        self.table_widget.setSortingEnabled(True)
+        # Table view over the current page
+        self.model = PageTableModel(parent=self)  # Lives as long as the view using it
+        self.table_view = QTableView()
+        self.table_view.setModel(self.model)
+        self.table_view.setAlternatingRowColors(True)
+        self.table_view.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectItems)  # Allow cell selection
+        self.table_view.setSortingEnabled(True)
+        # Size columns from the leading rows instead of measuring every cell
+        self.table_view.horizontalHeader().setResizeContentsPrecision(self.RESIZE_SAMPLE_ROWS)
         
         # Context menu for table
-        self.table_widget.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-        self.table_widget.customContextMenuRequested.connect(self.show_table_context_menu)
+        self.table_view.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.table_view.customContextMenuRequested.connect(self.show_table_context_menu)
         
         # Install event filter for keyboard shortcuts
-        self.table_widget.installEventFilter(self)
+        self.table_view.installEventFilter(self)
         
-        content_splitter.addWidget(self.table_widget)
+        content_splitter.addWidget(self.table_view)
         
         # Status and navigation
         nav_frame = self.create_navigation_section()
@@ -336,6 +497,12 @@ class PaginatedTableWidget(QWidget):
         self.page_info_label = QLabel("of --")
         nav_layout.addWidget(self.page_info_label)
         
+        self.exact_total_btn = QPushButton("Show exact total")
+        self.exact_total_btn.setToolTip("Row count is estimated; count all rows exactly")
+        self.exact_total_btn.clicked.connect(self.show_exact_total)
+        self.exact_total_btn.setVisible(False)
+        nav_layout.addWidget(self.exact_total_btn)
+        
         self.next_btn = QPushButton("Next ▶")
         self.next_btn.clicked.connect(self.go_to_next_page)
         self.next_btn.setEnabled(False)
@@ -352,9 +519,19 @@ class PaginatedTableWidget(QWidget):
     
     def set_paginator(self, paginator: QueryPaginator):
         """Set the data paginator."""
+        # Release result streams held by the previous query
+        for previous in (self.paginator, self.original_paginator):
+            if previous is not None and previous is not paginator:
+                previous.close()
+        if self.count_worker and self.count_worker.paginator is not paginator:
+            self._stop_count()
         self.paginator = paginator
         self.current_page = 0
         self.load_initial_page()
+        
+        if paginator is not None and paginator.plan_estimate:
+            # Guessed totals can be far off, so replace them as soon as possible
+            self.show_exact_total()
     
     def load_initial_page(self):
         """Load the first page of data."""
@@ -377,7 +554,7 @@ class PaginatedTableWidget(QWidget):
                 # Update page controls
                 total_pages = (total_rows + self.current_page_size - 1) // self.current_page_size
                 self.page_spinbox.setMaximum(max(1, total_pages))
-                self.page_info_label.setText(f"of {total_pages:,}")
+                self.page_info_label.setText(f"of {self._total_prefix()}{total_pages:,}")
         except Exception as e:
             logger.error(f"Failed to initialize pagination: {e}")
         
@@ -388,13 +565,14 @@ class PaginatedTableWidget(QWidget):
         if not self.paginator:
             return
         
-        if self.worker and self.worker.isRunning():
-            self.worker.terminate()
-            self.worker.wait(1000)
-        
         self.current_page = page_number
         self.page_spinbox.setValue(page_number + 1)
         
+        prefetch = self._prefetch
+        if prefetch and (prefetch.page_number, prefetch.page_size) != (page_number, self.current_page_size):
+            # A read-ahead of the requested page is left to finish and serve it
+            prefetch.cancel()
+        
         # Show progress
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(0)
@@ -403,12 +581,17 @@ class PaginatedTableWidget(QWidget):
         # Disable controls during loading
         self.set_navigation_enabled(False)
         
-        # Start worker thread
-        self.worker = PaginationWorker(self.paginator, page_number, self.current_page_size)
-        self.worker.page_loaded.connect(self.on_page_loaded)
-        self.worker.progress_updated.connect(self.on_progress_updated)
-        self.worker.error_occurred.connect(self.on_error_occurred)
-        self.worker.start()
+        # The newest request supersedes one still loading or queued;
+        # the pool starts it once the superseded load has unwound
+        if self.worker and self.worker.is_running() and not self.worker.is_cancelled:
+            self._cancel_worker()
+        
+        self.worker = PageLoadRunnable(self.paginator, page_number, self.current_page_size)
+        signals = self.worker.signals
+        signals.page_loaded.connect(self.on_page_loaded)
+        signals.progress_updated.connect(self.on_progress_updated)
+        signals.error_occurred.connect(self.on_error_occurred)
+        self.page_pool.start(self.worker)
     
     def on_page_loaded(self, data: pd.DataFrame, page_info: PageInfo):
         """Handle successful page loading."""
@@ -425,13 +608,11 @@ class PaginatedTableWidget(QWidget):
         self.update_navigation_state()
         
         # Update status
-        self.status_label.setText(
-            f"Page {page_info.page_number + 1} of {page_info.total_pages:,} "
-            f"({page_info.start_row + 1:,}-{page_info.end_row:,} of {page_info.total_rows:,} rows)"
-        )
+        self.update_page_status(page_info)
         
         # Hide progress
         self.progress_bar.setVisible(False)
+        self.update_memory_usage()
         
         # Enable export buttons
         self.export_page_btn.setEnabled(True)
@@ -443,6 +624,96 @@ class PaginatedTableWidget(QWidget):
         self.show_filtered_metrics_btn.setEnabled(self.is_filtered)
         
         logger.info(f"Page {page_info.page_number + 1} loaded successfully")
+        
+        self._prefetch_next_page(page_info)
+    
+    def _prefetch_next_page(self, page_info: PageInfo):
+        """Read the following page into the paginator cache while the user looks at this one."""
+        next_page = page_info.page_number + 1
+        if not page_info.has_next or not self.paginator or next_page in self.paginator.page_cache:
+            return
+        
+        # Queued behind any page load; nothing is connected, the page just lands in the cache
+        self._prefetch = PageLoadRunnable(self.paginator, next_page, self.current_page_size)
+        self.page_pool.start(self._prefetch)
+    
+    def update_page_status(self, page_info: PageInfo):
+        """Show the position of the given page and the result size."""
+        prefix = self._total_prefix()
+        status = (
+            f"Page {page_info.page_number + 1} of {prefix}{page_info.total_pages:,} "
+            f"({page_info.start_row + 1:,}-{page_info.end_row:,} of {prefix}{page_info.total_rows:,} rows)"
+        )
+        if page_info.offset_scan:
+            status += " - jumped via OFFSET scan; paging forward is faster"
+        self.status_label.setText(status)
+        
+        self.page_spinbox.setMaximum(max(1, page_info.total_pages))
+        self.page_info_label.setText(f"of {prefix}{page_info.total_pages:,}")
+        self.exact_total_btn.setVisible(bool(prefix))
+    
+    def _total_prefix(self) -> str:
+        """Marker shown in front of row and page totals that are estimates."""
+        return "~" if self.paginator and self.paginator.is_total_estimated else ""
+    
+    def show_exact_total(self):
+        """Count the rows in the background and replace the estimated total."""
+        if not self.paginator:
+            return
+        if self.count_worker and self.count_worker.paginator is self.paginator:
+            # Already counting this result
+            return
+        
+        self._stop_count()
+        self.exact_total_btn.setEnabled(False)
+        self.exact_total_btn.setText("Counting rows...")
+        worker = RowCountWorker(self.paginator, self)
+        worker.count_ready.connect(self.on_total_counted)
+        worker.error_occurred.connect(self.on_error_occurred)
+        worker.finished.connect(lambda worker=worker: self._on_count_finished(worker))
+        worker.finished.connect(worker.deleteLater)
+        self.count_worker = worker
+        worker.start()
+    
+    def on_total_counted(self, paginator: QueryPaginator, total_rows: int):
+        """Show the exact row count once the background count finishes."""
+        if paginator is not self.paginator:
+            return
+        
+        self.status_updated.emit(f"Query result has {total_rows:,} rows")
+        if not self.current_page_info:
+            # The first page is still loading and will pick up the count
+            return
+        
+        page_info = self.paginator.get_page_info(self.current_page, self.current_page_size, total_rows)
+        page_info.memory_usage_mb = self.current_page_info.memory_usage_mb
+        self.current_page_info = page_info
+        
+        self.update_navigation_state()
+        self.update_page_status(page_info)
+    
+    def _on_count_finished(self, worker: RowCountWorker):
+        """Restore the exact total button after a count ends."""
+        if worker is not self.count_worker:
+            # Stopped already; a newer count may be running
+            return
+        
+        self.count_worker = None
+        self.exact_total_btn.setEnabled(True)
+        self.exact_total_btn.setText("Show exact total")
+    
+    def _stop_count(self):
+        """Interrupt the row count in progress, if any, and drop its result."""
+        worker = self.count_worker
+        if worker is None:
+            return
+        
+        self.count_worker = None
+        worker.count_ready.disconnect()
+        worker.error_occurred.disconnect()
+        worker.paginator.interrupt_count()
+        self.exact_total_btn.setEnabled(True)
+        self.exact_total_btn.setText("Show exact total")
     
     def on_progress_updated(self, message: str, progress: int):
         """Handle progress updates."""
@@ -458,61 +729,29 @@ class PaginatedTableWidget(QWidget):
         QMessageBox.critical(self, "Loading Error", f"Failed to load page: {error_message}")
     
     def populate_table(self, data: pd.DataFrame):
-        """Populate the table widget with data."""
+        """Show data in the table view."""
+        header = self.table_view.horizontalHeader()
+        same_columns = data.columns.equals(self.model.columns)
+        widths = [header.sectionSize(col) for col in range(header.count())]
+        
+        self.model.set_dataframe(data)
         if data.empty:
-            self.table_widget.setRowCount(0)
-            self.table_widget.setColumnCount(0)
             return
         
-        # Set up table structure
-        self.table_widget.setRowCount(len(data))
-        self.table_widget.setColumnCount(len(data.columns))
-        self.table_widget.setHorizontalHeaderLabels(data.columns.tolist())
-        
-        # Populate data
-        for row in range(len(data)):
-            for col in range(len(data.columns)):
-                value = data.iloc[row, col]
-                
-                # Handle different data types
-                if pd.isna(value):
-                    item_text = ""
-                    item = QTableWidgetItem(item_text)
-                    item.setForeground(Qt.GlobalColor.gray)
-                    item.setFont(QFont("", -1, QFont.Weight.Normal, True))  # Italic
-                else:
-                    item_text = self._format_value(value)
-                    item = QTableWidgetItem(item_text)
-                    if isinstance(value, (int, float, Decimal)):
-                        item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-                
-                # Make items read-only
-                item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                
-                self.table_widget.setItem(row, col, item)
+        if same_columns and widths:
+            # Another page of the same result keeps the widths it was shown with
+            for col, width in enumerate(widths):
+                header.resizeSection(col, width)
+            return
         
         # Auto-resize columns to content
-        self.table_widget.resizeColumnsToContents()
+        self.table_view.resizeColumnsToContents()
         
         # Limit column width to reasonable size
-        header = self.table_widget.horizontalHeader()
         for col in range(len(data.columns)):
             width = header.sectionSize(col)
             if width > 300:
                 header.resizeSection(col, 300)
-
-    @staticmethod
-    def _format_value(value: Any) -> str:
-        """Format cell values for display without losing precision."""
-        if isinstance(value, float):
-            if not math.isfinite(value):
-                return str(value)
-            formatted = np.format_float_positional(value, trim='-')
-            return formatted if formatted else "0"
-        if isinstance(value, Decimal):
-            text = format(value, 'f')
-            return text if text else "0"
-        return str(value)
     
     def update_column_dropdown(self):
         """Update the column dropdown with current data columns."""
@@ -615,18 +854,32 @@ class PaginatedTableWidget(QWidget):
                 color = "green"
             
             self.memory_label.setText(f"Memory: {memory_text}")
-            self.memory_label.setStyleSheet(f"font-weight: bold; color: {color};")
+            if color != self._memory_color:
+                # Restyling re-parses the style sheet, so only do it when the level changes
+                self.memory_label.setStyleSheet(f"font-weight: bold; color: {color};")
+                self._memory_color = color
             
         except Exception:
             self.memory_label.setText("Memory: --")
     
+    def showEvent(self, event):
+        """Resume memory monitoring when the widget becomes visible."""
+        super().showEvent(event)
+        self.update_memory_usage()
+        self.memory_timer.start()
+    
+    def hideEvent(self, event):
+        """Pause memory monitoring while the widget is hidden."""
+        super().hideEvent(event)
+        self.memory_timer.stop()
+    
     def show_table_context_menu(self, position):
         """Show context menu for table."""
         if self.current_data is None or self.current_data.empty:
             return
         
         menu = QMenu(self)
-        selected_items = self.table_widget.selectedItems()
+        selected_items = self._selected_indexes()
         
         # Cell-level copy actions
         if len(selected_items) == 1:
@@ -641,7 +894,7 @@ class PaginatedTableWidget(QWidget):
             menu.addAction(copy_cells_action)
         
         # Row-level copy action
-        current_row = self.table_widget.currentRow()
+        current_row = self.table_view.currentIndex().row()
         if current_row >= 0:
             copy_row_action = QAction("Copy Row", self)
             copy_row_action.triggered.connect(self.copy_selected_row)
@@ -665,35 +918,40 @@ class PaginatedTableWidget(QWidget):
         if len(selected_items) > 0:
             info_action = QAction(f"Selected: {len(selected_items)} cells", self)
         else:
-            total_cells = self.table_widget.rowCount() * self.table_widget.columnCount()
+            total_cells = self.model.rowCount() * self.model.columnCount()
             info_action = QAction(f"Total: {total_cells} cells", self)
         info_action.setEnabled(False)
         menu.addAction(info_action)
         
-        menu.exec(self.table_widget.mapToGlobal(position))
+        menu.exec(self.table_view.mapToGlobal(position))
+    
+    def _selected_indexes(self) -> list:
+        """Get the indexes of the selected cells."""
+        selection_model = self.table_view.selectionModel()
+        return selection_model.selectedIndexes() if selection_model else []
     
     def copy_selected_cell(self):
         """Copy selected cell to clipboard."""
-        current_item = self.table_widget.currentItem()
-        if current_item:
-            cell_value = current_item.text()
+        current_index = self.table_view.currentIndex()
+        if current_index.isValid():
+            cell_value = self.model.cell_text(current_index.row(), current_index.column())
             QApplication.clipboard().setText(cell_value)
             logger.info(f"Copied cell value to clipboard: '{cell_value}'")
     
     def copy_selected_cells(self):
         """Copy multiple selected cells to clipboard as tab-delimited text."""
-        selected_items = self.table_widget.selectedItems()
+        selected_items = self._selected_indexes()
         if not selected_items:
             return
         
         # Group by row to maintain table structure
         rows_dict = {}
-        for item in selected_items:
-            row = item.row()
-            col = item.column()
+        for index in selected_items:
+            row = index.row()
+            col = index.column()
             if row not in rows_dict:
                 rows_dict[row] = {}
-            rows_dict[row][col] = item.text()
+            rows_dict[row][col] = self.model.cell_text(row, col)
         
         # Build tab-delimited string
         lines = []
@@ -712,23 +970,21 @@ class PaginatedTableWidget(QWidget):
     
     def copy_selected_row(self):
         """Copy selected row to clipboard."""
-        current_row = self.table_widget.currentRow()
+        current_row = self.table_view.currentIndex().row()
         if current_row >= 0 and self.current_data is not None:
-            row_data = []
-            for col in range(self.table_widget.columnCount()):
-                item = self.table_widget.item(current_row, col)
-                row_data.append(item.text() if item else "")
-            
-            clipboard_text = "\t".join(row_data)
+            # Read from the model, which holds the page in its displayed sort order
+            clipboard_text = "\t".join(self.model.row_texts(current_row))
             QApplication.clipboard().setText(clipboard_text)
             logger.info(f"Copied row to clipboard")
     
     def eventFilter(self, obj, event):
         """Handle keyboard events for copy functionality."""
-        if obj == self.table_widget and event.type() == QEvent.Type.KeyPress:
+        # Events can arrive while the widget is being torn down, after its attributes are gone
+        table_view = getattr(self, 'table_view', None)
+        if table_view is not None and obj == table_view and event.type() == QEvent.Type.KeyPress:
             if event.key() == Qt.Key.Key_C and event.modifiers() == Qt.KeyboardModifier.ControlModifier:
                 # Ctrl+C pressed
-                selected_items = self.table_widget.selectedItems()
+                selected_items = self._selected_indexes()
                 if len(selected_items) == 1:
                     self.copy_selected_cell()
                 elif len(selected_items) > 1:
@@ -815,7 +1071,7 @@ class PaginatedTableWidget(QWidget):
         try:
             # Execute the full filtered query to get all matching data
             filtered_sql = self.paginator.sql
-            result = self.paginator.connection.execute(filtered_sql).df()
+            result = self.paginator.query_dataframe(filtered_sql)
             logger.info(f"Retrieved {len(result)} filtered rows for export")
             return result
         except Exception as e:
@@ -825,14 +1081,14 @@ class PaginatedTableWidget(QWidget):
     
     def clear_data(self):
         """Clear all data and reset the widget."""
-        self.table_widget.setRowCount(0)
-        self.table_widget.setColumnCount(0)
+        self.model.set_dataframe(pd.DataFrame())
         self.current_data = None
         self.current_page_info = None
         self.current_page = 0
         
         self.status_label.setText("Ready")
         self.page_info_label.setText("of --")
+        self.exact_total_btn.setVisible(False)
         self.page_spinbox.setValue(1)
         self.page_spinbox.setMaximum(1)
         
@@ -841,9 +1097,39 @@ class PaginatedTableWidget(QWidget):
         self.export_all_btn.setEnabled(False)
         self.export_filtered_btn.setEnabled(False)
         
-        if self.worker and self.worker.isRunning():
-            self.worker.terminate()
-            self.worker.wait(1000)
+        self._stop_count()
+        self._stop_worker()
+    
+    def _cancel_worker(self):
+        """Ask the running page load to stop and drop anything it still reports."""
+        # Terminating a thread inside DuckDB can leave the connection locked,
+        # so the load stops at its next progress step instead
+        self.worker.cancel()
+        signals = self.worker.signals
+        signals.page_loaded.disconnect()
+        signals.progress_updated.disconnect()
+        signals.error_occurred.disconnect()
+    
+    def _stop_worker(self):
+        """Discard the page load in progress, if any, without waiting for it."""
+        if self._prefetch:
+            self._prefetch.cancel()
+        if self.worker and self.worker.is_running() and not self.worker.is_cancelled:
+            self._cancel_worker()
+    
+    def shutdown(self):
+        """
+        Stop background page loads and row counts and wait for them to end.
+        
+        Called before the database connection closes, which must not happen
+        while a worker thread is still using it.
+        """
+        worker = self.count_worker
+        self._stop_count()
+        if worker is not None:
+            worker.wait()
+        self._stop_worker()
+        self.page_pool.waitForDone()
     
     def update_status_with_filter_info(self, total_rows: int, filtered_rows: int):
         """Update the status bar with filter information."""
@@ -884,10 +1170,13 @@ class PaginatedTableWidget(QWidget):
                 filtered_paginator = QueryPaginator(
                     self.original_paginator.connection, 
                     filtered_sql, 
-                    self.config
+                    self.config,
+                    db_manager=self.original_paginator.db_manager
                 )
                 
                 # Replace current paginator
+                if self.is_filtered:
+                    self.paginator.close()
                 self.paginator = filtered_paginator
                 self.is_filtered = True
                 self.filter_sql_condition = where_condition
@@ -915,6 +1204,7 @@ class PaginatedTableWidget(QWidget):
             
         try:
             # Restore original paginator
+            self.paginator.close()
             self.paginator = self.original_paginator
             self.is_filtered = False
             self.filter_sql_condition = ""
@@ -979,7 +1269,7 @@ class PaginatedTableWidget(QWidget):
         try:
             # Get the original SQL and execute it to get the full result for metrics
             original_sql = self.original_paginator.sql
-            full_result = self.original_paginator.connection.execute(original_sql).df()
+            full_result = self.original_paginator.query_dataframe(original_sql)
             
             # Emit signal to main window to show metrics
             self.metrics_requested.emit(original_sql, full_result, "original")
@@ -1000,7 +1290,7 @@ class PaginatedTableWidget(QWidget):
         try:
             # Get the filtered SQL and execute it to get the full filtered result
             filtered_sql = self.paginator.sql
-            filtered_result = self.paginator.connection.execute(filtered_sql).df()
+            filtered_result = self.paginator.query_dataframe(filtered_sql)
             
             # Emit signal to main window to show metrics
             self.metrics_requested.emit(filtered_sql, filtered_result, "filtered")
@@ -23,6 +23,7 @@ from PyQt6.QtGui import QFont
 import pandas as pd
 
 from .styling import setup_text_selection_colors
+from ..data_pagination import estimate_dataframe_bytes
 from ..themes import theme_manager, ThemeType
 
 logger = logging.getLogger(__name__)
@@ -252,11 +253,12 @@ class QueryMetricsDialog(QDialog):
     """Dialog for displaying detailed query execution metrics."""
     
     def __init__(self, parent=None, sql: str = "", result_data: pd.DataFrame = None, 
-                 execution_time: float = 0.0):
+                 execution_time: float = 0.0, header_text: str = ""):
         super().__init__(parent)
         self.sql = sql
         self.result_data = result_data
         self.execution_time = execution_time
+        self.header_text = header_text  # Optional rich-text line shown above the summary
         
         self.setWindowTitle("Query Execution Metrics")
         self.setModal(True)
@@ -269,6 +271,11 @@ class QueryMetricsDialog(QDialog):
         """Initialize the user interface."""
         layout = QVBoxLayout(self)
         
+        if self.header_text:
+            header_label = QLabel(self.header_text)
+            header_label.setStyleSheet("color: #0066cc; font-size: 12px; margin: 5px;")
+            layout.addWidget(header_label)
+        
         # Summary section
         summary_group = QGroupBox("Execution Summary")
         summary_layout = QFormLayout(summary_group)
@@ -351,7 +358,7 @@ class QueryMetricsDialog(QDialog):
         self.columns_label.setText(str(len(self.result_data.columns)))
         
         # Estimate memory usage
-        memory_bytes = self.result_data.memory_usage(deep=True).sum()
+        memory_bytes = estimate_dataframe_bytes(self.result_data)
         memory_mb = memory_bytes / (1024 * 1024)
         self.memory_label.setText(f"{memory_mb:.2f} MB")
         
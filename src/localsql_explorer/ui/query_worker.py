@@ -6,147 +6,151 @@ during long-running queries.
 """
 
 import logging
+import threading
 from typing import Optional, List, Dict, Any
 
-from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtCore import QObject, QRunnable, QThread, pyqtSignal
 
 from ..database import DatabaseManager, QueryResult
 
 logger = logging.getLogger(__name__)
 
 
-class QueryWorker(QThread):
+class QuerySignals(QObject):
     """
-    Background worker thread for executing SQL queries.
+    Signals emitted by a QueryRunnable.
     
     Signals:
         progress_update: Emitted with (message: str, percentage: int) during execution
         query_finished: Emitted with QueryResult when query completes
+        paginator_ready: Emitted with paginator when the result needs pagination
         query_error: Emitted with (sql: str, error_message: str) on error
+        finished: Emitted when the runnable has ended, including after cancellation
     """
     
-    # Signals
     progress_update = pyqtSignal(str, int)  # message, percentage
     query_finished = pyqtSignal(object)  # QueryResult
+    paginator_ready = pyqtSignal(object)  # paginator
     query_error = pyqtSignal(str, str)  # sql, error_message
+    finished = pyqtSignal()
+
+
+class QueryRunnable(QRunnable):
+    """
+    Runnable that executes a SQL query on a thread pool.
+    
+    Queries run on pooled threads rather than a new QThread each, so running
+    queries in quick succession does not create and tear down a thread per
+    query.
+    
+    When a pagination threshold is given the query is executed once and
+    streamed: results larger than the threshold are handed over as a paginator
+    seeded with the rows already read instead of being fully materialized.
+    """
     
-    def __init__(self, db_manager: DatabaseManager, sql: str, parent=None):
+    def __init__(self, db_manager: DatabaseManager, sql: str,
+                 pagination_threshold: Optional[int] = None):
         """
-        Initialize the query worker.
+        Initialize the query runnable.
         
         Args:
             db_manager: Database manager instance
             sql: SQL query to execute
-            parent: Optional parent QObject
+            pagination_threshold: Row count above which results are paginated
         """
-        super().__init__(parent)
+        super().__init__()
         self.db_manager = db_manager
         self.sql = sql
+        self.pagination_threshold = pagination_threshold
+        self.signals = QuerySignals()
         self._is_cancelled = False
+        self._done = threading.Event()
     
     def run(self):
-        """Execute the query in a background thread."""
+        """Execute the query on a pool thread."""
+        try:
+            self._execute()
+        finally:
+            self._done.set()
+            self.signals.finished.emit()
+    
+    def _execute(self):
+        """Run the query and emit its outcome."""
         try:
             logger.info(f"Starting background query execution: {self.sql[:100]}...")
             
             # Update progress
-            self.progress_update.emit("Executing query...", 30)
+            self.signals.progress_update.emit("Executing query...", 30)
             
             # Execute the query
-            result = self.db_manager.execute_query(self.sql)
+            paginator = None
+            if self.pagination_threshold is None:
+                result = self.db_manager.execute_query(self.sql)
+            else:
+                result, paginator = self.db_manager.execute_query_adaptive(
+                    self.sql, self.pagination_threshold
+                )
             
             # Check if cancelled
             if self._is_cancelled:
                 logger.info("Query execution was cancelled")
+                if paginator is not None:
+                    # Nobody will receive it, so release its result stream here
+                    paginator.close()
                 return
             
             # Update progress
-            self.progress_update.emit("Processing results...", 70)
+            self.signals.progress_update.emit("Processing results...", 70)
             
             # Check for errors
             if not result.success:
-                self.query_error.emit(self.sql, result.error or "Query failed")
+                self.signals.query_error.emit(self.sql, result.error or "Query failed")
+                return
+            
+            if paginator is not None:
+                self.signals.progress_update.emit("Loading first page...", 80)
+                self.signals.paginator_ready.emit(paginator)
+                logger.info("Background query switched to paginated results")
                 return
             
             # Update progress
-            self.progress_update.emit("Finalizing...", 90)
+            self.signals.progress_update.emit("Finalizing...", 90)
             
             # Emit success signal
-            self.query_finished.emit(result)
+            self.signals.query_finished.emit(result)
             
             logger.info(f"Background query completed successfully: {result.row_count} rows")
             
         except Exception as e:
             logger.error(f"Background query execution failed: {e}", exc_info=True)
-            self.query_error.emit(self.sql, str(e))
+            self.signals.query_error.emit(self.sql, str(e))
     
-    def cancel(self):
-        """Request cancellation of the query."""
-        self._is_cancelled = True
-        logger.info("Query cancellation requested")
-
-
-class PaginatedQueryWorker(QThread):
-    """
-    Background worker thread for setting up paginated query execution.
+    @property
+    def is_cancelled(self) -> bool:
+        """Whether cancellation of the query was requested."""
+        return self._is_cancelled
     
-    Signals:
-        progress_update: Emitted with (message: str, percentage: int) during execution
-        paginator_ready: Emitted with paginator when setup completes
-        query_error: Emitted with (sql: str, error_message: str) on error
-    """
+    def is_running(self) -> bool:
+        """Whether the query has been started and not yet ended."""
+        return not self._done.is_set()
     
-    # Signals
-    progress_update = pyqtSignal(str, int)  # message, percentage
-    paginator_ready = pyqtSignal(object)  # paginator
-    query_error = pyqtSignal(str, str)  # sql, error_message
-    
-    def __init__(self, db_manager: DatabaseManager, sql: str, parent=None):
+    def wait(self, timeout: Optional[float] = None) -> bool:
         """
-        Initialize the paginated query worker.
+        Block until the query has ended.
         
         Args:
-            db_manager: Database manager instance
-            sql: SQL query to execute
-            parent: Optional parent QObject
-        """
-        super().__init__(parent)
-        self.db_manager = db_manager
-        self.sql = sql
-        self._is_cancelled = False
-    
-    def run(self):
-        """Set up paginated query execution in a background thread."""
-        try:
-            logger.info(f"Setting up paginated query: {self.sql[:100]}...")
-            
-            # Update progress
-            self.progress_update.emit("Setting up pagination...", 30)
+            timeout: Optional maximum number of seconds to wait
             
-            # Create paginator
-            paginator = self.db_manager.create_query_paginator(self.sql)
-            
-            # Check if cancelled
-            if self._is_cancelled:
-                logger.info("Paginator setup was cancelled")
-                return
-            
-            # Update progress
-            self.progress_update.emit("Loading first page...", 70)
-            
-            # Emit success signal
-            self.paginator_ready.emit(paginator)
-            
-            logger.info("Paginated query setup completed successfully")
-            
-        except Exception as e:
-            logger.error(f"Paginated query setup failed: {e}", exc_info=True)
-            self.query_error.emit(self.sql, str(e))
+        Returns:
+            bool: True if the query ended, False on timeout
+        """
+        return self._done.wait(timeout)
     
     def cancel(self):
-        """Request cancellation of the paginator setup."""
+        """Request cancellation of the query and interrupt it in DuckDB."""
         self._is_cancelled = True
-        logger.info("Paginator setup cancellation requested")
+        self.db_manager.interrupt()
+        logger.info("Query cancellation requested")
 
 
 class MultiQueryWorker(QThread):
@@ -15,7 +15,7 @@ from typing import Optional
 
 import numpy as np
 import pandas as pd
-from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QVariant, pyqtSignal, QEvent
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QVariant, pyqtSignal, QEvent, QTimer
 from PyQt6.QtWidgets import (
     QTableView,
     QWidget,
@@ -35,15 +35,17 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtGui import QAction
 
+from ..data_pagination import estimate_dataframe_bytes
+
 logger = logging.getLogger(__name__)
 
 
 class PandasTableModel(QAbstractTableModel):
     """Table model for displaying pandas DataFrames in QTableView."""
     
-    def __init__(self, dataframe: Optional[pd.DataFrame] = None):
-        super().__init__()
-        self._dataframe = dataframe if dataframe is not None else pd.DataFrame()
+    def __init__(self, dataframe: Optional[pd.DataFrame] = None, parent=None):
+        super().__init__(parent)
+        self._load(dataframe if dataframe is not None else pd.DataFrame())
     
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
         """Return number of rows."""
@@ -59,16 +61,8 @@ class PandasTableModel(QAbstractTableModel):
             return QVariant()
         
         if role == Qt.ItemDataRole.DisplayRole:
-            value = self._dataframe.iloc[index.row(), index.column()]
-            
-            # Handle different data types
-            if pd.isna(value):
-                return "NULL"
-            if isinstance(value, float):
-                return self._format_float(value)
-            if isinstance(value, Decimal):
-                return self._format_decimal(value)
-            return str(value)
+            column = index.column()
+            return self._formatters[column](self._dataframe.iat[index.row(), column])
         
         return QVariant()
     
@@ -85,8 +79,47 @@ class PandasTableModel(QAbstractTableModel):
     def set_dataframe(self, dataframe: pd.DataFrame):
         """Set a new dataframe."""
         self.beginResetModel()
-        self._dataframe = dataframe
+        self._load(dataframe)
         self.endResetModel()
+    
+    def _load(self, dataframe: pd.DataFrame):
+        """Hold a dataframe and the per-column state derived from it."""
+        self._dataframe = dataframe
+        self._formatters = self._column_formatters(dataframe)
+
+    @classmethod
+    def _column_formatters(cls, dataframe: pd.DataFrame) -> list:
+        """Pick a display formatter for each column from its dtype."""
+        return [cls._formatter_for(dtype) for dtype in dataframe.dtypes]
+
+    @classmethod
+    def _formatter_for(cls, dtype):
+        """Return the display formatter for values of a column dtype."""
+        if isinstance(dtype, np.dtype):
+            if dtype.kind in 'iub':
+                # Plain integer and boolean columns cannot hold missing values
+                return str
+            if dtype.kind == 'f':
+                return cls._format_float_cell
+        return cls._format_value
+
+    @classmethod
+    def _format_value(cls, value) -> str:
+        """Format a value of any type for display."""
+        if pd.isna(value):
+            return "NULL"
+        if isinstance(value, float):
+            return cls._format_float(value)
+        if isinstance(value, Decimal):
+            return cls._format_decimal(value)
+        return str(value)
+
+    @classmethod
+    def _format_float_cell(cls, value: float) -> str:
+        """Format a value from a float column, where NaN marks a missing value."""
+        if value != value:
+            return "NULL"
+        return cls._format_float(value)
 
     @staticmethod
     def _format_float(value: float) -> str:
@@ -116,11 +149,11 @@ class PandasTableModel(QAbstractTableModel):
         column_name = self._dataframe.columns[column]
         ascending = order == Qt.SortOrder.AscendingOrder
         
-        self._dataframe = self._dataframe.sort_values(
+        self._load(self._dataframe.sort_values(
             by=column_name,
             ascending=ascending,
             na_position='last'
-        ).reset_index(drop=True)
+        ).reset_index(drop=True))
         
         self.layoutChanged.emit()
 
@@ -142,13 +175,22 @@ class ResultsTableView(QWidget):
     export_all_requested = pyqtSignal()  # Emitted when export all is requested
     export_filtered_requested = pyqtSignal(object)  # Emitted when filtered export is requested (with DataFrame)
     
+    RESIZE_SAMPLE_ROWS = 100  # Rows measured when auto-sizing columns
+    
     def __init__(self):
         """Initialize the results table view."""
         super().__init__()
         
-        self.model = PandasTableModel()
+        self.model = PandasTableModel(parent=self)  # Lives as long as the view using it
         self.original_data = None  # Store original data for filtering
         self.filtered_data = None  # Store filtered data
+        self._search_text: dict = {}  # Column name -> original_data column as text
+        
+        # Keystrokes typed in quick succession filter the results once
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(200)
+        self._filter_timer.timeout.connect(self.filter_results)
         
         self.init_ui()
     
@@ -208,6 +250,8 @@ class ResultsTableView(QWidget):
         horizontal_header = self.table_view.horizontalHeader()
         horizontal_header.setStretchLastSection(True)
         horizontal_header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        # Size columns from the leading rows instead of measuring every cell
+        horizontal_header.setResizeContentsPrecision(self.RESIZE_SAMPLE_ROWS)
         
         vertical_header = self.table_view.verticalHeader()
         vertical_header.setVisible(True)
@@ -238,19 +282,19 @@ class ResultsTableView(QWidget):
         self.column_combo = QComboBox()
         self.column_combo.addItem("All Columns", "")  # Empty string means search all columns
         self.column_combo.setMinimumWidth(150)
-        self.column_combo.currentTextChanged.connect(self.filter_results)
+        self.column_combo.currentTextChanged.connect(self._schedule_filter)
         search_layout.addWidget(self.column_combo)
         
         # Search input
         search_layout.addWidget(QLabel("Search:"))
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Enter search term...")
-        self.search_input.textChanged.connect(self.filter_results)
+        self.search_input.textChanged.connect(self._schedule_filter)
         search_layout.addWidget(self.search_input)
         
         # Case sensitivity checkbox
         self.case_sensitive_checkbox = QCheckBox("Case sensitive")
-        self.case_sensitive_checkbox.stateChanged.connect(self.filter_results)
+        self.case_sensitive_checkbox.stateChanged.connect(self._schedule_filter)
         search_layout.addWidget(self.case_sensitive_checkbox)
         
         # Filter status label
@@ -271,8 +315,10 @@ class ResultsTableView(QWidget):
             dataframe: Pandas DataFrame to display
         """
         # Store original data for filtering
-        self.original_data = dataframe.copy() if not dataframe.empty else pd.DataFrame()
-        self.filtered_data = self.original_data.copy()
+        # Never modified in place, so neither needs a copy of its own
+        self.original_data = dataframe if not dataframe.empty else pd.DataFrame()
+        self.filtered_data = self.original_data
+        self._search_text = {}
         
         # Update column dropdown
         self.update_column_dropdown()
@@ -301,6 +347,7 @@ class ResultsTableView(QWidget):
         # Reset search
         self.search_input.clear()
         self.filter_status_label.setText("")
+        self._filter_timer.stop()  # New data is already shown unfiltered
         
         logger.info(f"Displayed DataFrame with {len(dataframe)} rows, {len(dataframe.columns)} columns")
     
@@ -329,7 +376,7 @@ class ResultsTableView(QWidget):
             
             # Memory usage
             try:
-                memory_usage = dataframe.memory_usage(deep=True).sum()
+                memory_usage = estimate_dataframe_bytes(dataframe)
                 if memory_usage < 1024:
                     memory_text = f"{memory_usage} bytes"
                 elif memory_usage < 1024 * 1024:
@@ -517,7 +564,9 @@ class ResultsTableView(QWidget):
     
     def eventFilter(self, obj, event):
         """Handle keyboard events for copy functionality."""
-        if obj == self.table_view and event.type() == QEvent.Type.KeyPress:
+        # Events can arrive while the widget is being torn down, after its attributes are gone
+        table_view = getattr(self, 'table_view', None)
+        if table_view is not None and obj == table_view and event.type() == QEvent.Type.KeyPress:
             if event.key() == Qt.Key.Key_C and event.modifiers() == Qt.KeyboardModifier.ControlModifier:
                 # Ctrl+C pressed
                 selection_model = self.table_view.selectionModel()
@@ -583,6 +632,19 @@ class ResultsTableView(QWidget):
             for col in self.original_data.columns:
                 self.column_combo.addItem(str(col), str(col))
     
+    def _schedule_filter(self, *_):
+        """Filter the results once the search controls stop changing."""
+        self._filter_timer.start()
+    
+    def _column_matches(self, column, search_text: str, case_sensitive: bool) -> np.ndarray:
+        """Return which rows of a column contain the search text."""
+        # Columns are converted to text once per result, not on every keystroke
+        text = self._search_text.get(column)
+        if text is None:
+            text = self.original_data[column].astype(str)
+            self._search_text[column] = text
+        return text.str.contains(search_text, case=case_sensitive, na=False, regex=False).to_numpy(dtype=bool)
+    
     def filter_results(self):
         """Filter results based on search criteria."""
         if self.original_data is None or self.original_data.empty:
@@ -594,38 +656,20 @@ class ResultsTableView(QWidget):
         
         if not search_text:
             # No search text, show all data
-            self.filtered_data = self.original_data.copy()
+            self.filtered_data = self.original_data
         else:
             # Apply filter
             if selected_column:  # Search specific column
                 if selected_column in self.original_data.columns:
-                    if case_sensitive:
-                        mask = self.original_data[selected_column].astype(str).str.contains(
-                            search_text, case=True, na=False, regex=False
-                        )
-                    else:
-                        mask = self.original_data[selected_column].astype(str).str.contains(
-                            search_text, case=False, na=False, regex=False
-                        )
-                    self.filtered_data = self.original_data[mask].copy()
+                    mask = self._column_matches(selected_column, search_text, case_sensitive)
+                    self.filtered_data = self.original_data[mask]
                 else:
                     self.filtered_data = pd.DataFrame()
             else:  # Search all columns
-                mask = pd.Series([False] * len(self.original_data))
+                mask = np.zeros(len(self.original_data), dtype=bool)
                 for col in self.original_data.columns:
-                    try:
-                        if case_sensitive:
-                            col_mask = self.original_data[col].astype(str).str.contains(
-                                search_text, case=True, na=False, regex=False
-                            )
-                        else:
-                            col_mask = self.original_data[col].astype(str).str.contains(
-                                search_text, case=False, na=False, regex=False
-                            )
-                        mask = mask | col_mask
-                    except:
-                        continue
-                self.filtered_data = self.original_data[mask].copy()
+                    mask |= self._column_matches(col, search_text, case_sensitive)
+                self.filtered_data = self.original_data[mask]
         
         # Update display
         self.model.set_dataframe(self.filtered_data)
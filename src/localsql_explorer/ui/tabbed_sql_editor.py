@@ -566,6 +566,7 @@ class TabbedSQLEditor(QWidget):
                 settings.endGroup()
         
         settings.endGroup()
+        settings.sync()
         logger.info(f"Saved state of {self.tab_widget.count()} tabs")
     
     def restore_state(self):
@@ -196,6 +196,68 @@ class TableListWidget(QWidget):
         
         logger.info(f"Added table '{metadata.name}' to list")
     
+    def add_tables(self, metadata_list: List[TableMetadata]):
+        """
+        Add several tables to the list with a single repaint.
+        
+        Args:
+            metadata_list: Metadata for each table
+        """
+        self.list_widget.setUpdatesEnabled(False)
+        try:
+            for metadata in metadata_list:
+                if metadata.name in self.tables:
+                    self.remove_table(metadata.name)
+                
+                self.tables[metadata.name] = metadata
+                self.list_widget.addItem(TableListItem(metadata))
+        finally:
+            self.list_widget.setUpdatesEnabled(True)
+        
+        self.update_status()
+        self.update_drop_zone_visibility()
+        
+        logger.info(f"Added {len(metadata_list)} tables to list")
+    
+    def set_tables(self, metadata_list: List[TableMetadata]):
+        """
+        Replace the listed tables with a single repaint.
+        
+        Items for tables that are still present are updated in place, so their
+        position and selection are kept; only missing tables are removed and
+        new ones appended.
+        
+        Args:
+            metadata_list: Metadata for every table that should be listed
+        """
+        new_tables = {metadata.name: metadata for metadata in metadata_list}
+        
+        self.list_widget.setUpdatesEnabled(False)
+        try:
+            # Walk backwards so removing an item does not shift the ones still to visit
+            for i in range(self.list_widget.count() - 1, -1, -1):
+                item = self.list_widget.item(i)
+                if not isinstance(item, TableListItem):
+                    continue
+                metadata = new_tables.get(item.metadata.name)
+                if metadata is None:
+                    self.list_widget.takeItem(i)
+                elif metadata is not item.metadata:
+                    item.metadata = metadata
+                    item.update_display()
+            
+            for name, metadata in new_tables.items():
+                if name not in self.tables:
+                    self.list_widget.addItem(TableListItem(metadata))
+        finally:
+            self.list_widget.setUpdatesEnabled(True)
+        
+        self.tables = new_tables
+        self.update_status()
+        self.update_drop_zone_visibility()
+        
+        logger.info(f"Set table list to {len(new_tables)} tables")
+    
     def remove_table(self, table_name: str):
         """
         Remove a table from the list.
@@ -248,6 +310,34 @@ class TableListWidget(QWidget):
         
         logger.info(f"Updated table '{metadata.name}' metadata")
     
+    def rename_in_place(self, old_name: str, new_name: str, metadata: TableMetadata):
+        """
+        Rename a table's existing list item without removing and re-adding it.
+        
+        The item keeps its position and selection; only its metadata and
+        display text change.
+        
+        Args:
+            old_name: Current table name
+            new_name: New table name
+            metadata: Metadata for the renamed table
+        """
+        if old_name not in self.tables:
+            self.add_table(metadata)
+            return
+        
+        del self.tables[old_name]
+        self.tables[new_name] = metadata
+        
+        for i in range(self.list_widget.count()):
+            item = self.list_widget.item(i)
+            if isinstance(item, TableListItem) and item.metadata.name == old_name:
+                item.metadata = metadata
+                item.update_display()
+                break
+        
+        logger.info(f"Renamed table '{old_name}' to '{new_name}' in list")
+    
     def clear(self):
         """Clear all tables from the list."""
         self.list_widget.clear()
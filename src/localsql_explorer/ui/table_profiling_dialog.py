@@ -43,20 +43,9 @@ class ProfilingWorker(QThread):
     def run(self):
         """Run profiling in background thread."""
         try:
-            self.progress.emit("Starting table profiling...", 10)
+            self.progress.emit("Starting table profiling...", 5)
             
-            self.progress.emit("Analyzing column statistics...", 25)
-            # The profiler will handle all the analysis
-            
-            self.progress.emit("Generating distribution analysis...", 50)
-            
-            self.progress.emit("Calculating correlations...", 70)
-            
-            self.progress.emit("Detecting patterns...", 85)
-            
-            self.progress.emit("Compiling report...", 95)
-            
-            report = self.profiler.profile_table(self.df, self.table_name)
+            report = self.profiler.profile_table(self.df, self.table_name, self.progress.emit)
             
             self.progress.emit("Profiling completed", 100)
             self.finished.emit(report)
@@ -12,9 +12,9 @@ src_path = Path(__file__).parent / "src"
 sys.path.insert(0, str(src_path))
 
 from PyQt6.QtWidgets import QApplication, QPushButton, QVBoxLayout, QWidget, QLabel, QTextEdit
-from PyQt6.QtCore import QTimer
+from PyQt6.QtCore import QThreadPool, QTimer
 from localsql_explorer.database import DatabaseManager
-from localsql_explorer.ui.query_worker import QueryWorker, MultiQueryWorker
+from localsql_explorer.ui.query_worker import QueryRunnable, MultiQueryWorker
 import pandas as pd
 
 
@@ -125,11 +125,11 @@ class TestWindow(QWidget):
         self.log("↻ Watch the counter - it should keep updating!")
         
         # Create worker
-        self.worker = QueryWorker(self.db_manager, sql, self)
-        self.worker.progress_update.connect(self._on_progress)
-        self.worker.query_finished.connect(self._on_finished)
-        self.worker.query_error.connect(self._on_error)
-        self.worker.start()
+        self.worker = QueryRunnable(self.db_manager, sql)
+        self.worker.signals.progress_update.connect(self._on_progress)
+        self.worker.signals.query_finished.connect(self._on_finished)
+        self.worker.signals.query_error.connect(self._on_error)
+        QThreadPool.globalInstance().start(self.worker)
     
     def run_multi_queries(self):
         """Run multiple queries in background."""
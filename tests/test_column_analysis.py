@@ -153,8 +153,29 @@ def test_database_integration():
         print("❌ Database integration test failed!")
 
 
+def test_column_analysis_progress():
+    """Test each column is reported as its analysis completes."""
+    print("\nTesting column analysis progress reporting...")
+    
+    from localsql_explorer.column_analysis import column_analyzer
+    
+    df = pd.DataFrame({'a': [1, 2, 3], 'b': ['x', 'y', None], 'c': [1.5, None, 2.5]})
+    reported = []
+    
+    analysis = column_analyzer.analyze_table(
+        df, 'progress_test',
+        lambda column, done, total: reported.append((column.name, done, total))
+    )
+    
+    assert reported == [('a', 1, 3), ('b', 2, 3), ('c', 3, 3)]
+    assert [column.name for column in analysis.columns] == ['a', 'b', 'c']
+    
+    print("✅ Column analysis progress test passed!")
+
+
 if __name__ == "__main__":
     test_column_analyzer_basic()
     test_column_analysis_edge_cases()
     test_database_integration()
+    test_column_analysis_progress()
     print("\n🎉 All column analysis tests passed!")
\ No newline at end of file
@@ -6,10 +6,12 @@ import sys
 import tempfile
 from pathlib import Path
 
+import pytest
+
 # Add src to Python path for testing
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from localsql_explorer.query_history import QueryHistory, QueryEntry
+from localsql_explorer.query_history import QueryHistory, QueryEntry, extract_tables_from_sql
 
 
 def test_query_history_basic():
@@ -130,7 +132,67 @@ def test_query_history_advanced():
             temp_path.unlink()
 
 
+def test_extract_tables_from_sql():
+    """Test table extraction from SQL text."""
+    print("\nTesting table extraction...")
+    
+    sql = "SELECT * FROM users u JOIN orders o ON u.id = o.user_id JOIN users x ON 1=1"
+    
+    assert extract_tables_from_sql(sql) == ("users", "orders")
+    assert extract_tables_from_sql("SELECT 1") == ()
+    assert extract_tables_from_sql(
+        "WITH recent AS (SELECT * FROM orders), totals(n) AS (SELECT COUNT(*) FROM recent) "
+        "SELECT * FROM totals JOIN users ON 1=1"
+    ) == ("orders", "users")
+    
+    hits = extract_tables_from_sql.cache_info().hits
+    extract_tables_from_sql(sql)
+    assert extract_tables_from_sql.cache_info().hits == hits + 1
+    
+    print("✅ Table extraction test passed!")
+
+
+def test_extract_tables_with_sqlglot():
+    """Test quoted and schema-qualified names are found when sqlglot is installed."""
+    pytest.importorskip("sqlglot", minversion="25.0.0")
+    
+    sql = 'SELECT * FROM main."Sales Data" s JOIN (SELECT * FROM regions) r ON 1=1'
+    
+    assert extract_tables_from_sql(sql) == ("Sales Data", "regions")
+    assert extract_tables_from_sql("DROP TABLE archived") == ("archived",)
+    assert extract_tables_from_sql(
+        "SELECT * FROM 'data.parquet' d JOIN read_csv('extra.csv') e ON 1=1 JOIN users u ON 1=1"
+    ) == ("users",)
+
+
+def test_query_history_background_save():
+    """Test changes are written by the background writer and flushed on close."""
+    print("\nTesting background history saves...")
+    
+    with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as temp_file:
+        temp_path = Path(temp_file.name)
+    
+    try:
+        history = QueryHistory(temp_path)
+        
+        query_ids = [history.add_query(f"SELECT {i} FROM numbers") for i in range(20)]
+        history.mark_favorite(query_ids[0])
+        history.close()
+        
+        reloaded = QueryHistory(temp_path)
+        assert len(reloaded.queries) == len(history.queries)
+        assert reloaded.queries[query_ids[0]].is_favorite
+        
+        print("✅ Background history save test passed!")
+        
+    finally:
+        if temp_path.exists():
+            temp_path.unlink()
+
+
 if __name__ == "__main__":
     test_query_history_basic()
     test_query_history_advanced()
+    test_extract_tables_from_sql()
+    test_query_history_background_save()
     print("\n🎉 All query history tests passed!")
\ No newline at end of file
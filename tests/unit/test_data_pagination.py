@@ -0,0 +1,147 @@
+"""
+Unit tests for the data pagination module.
+
+Tests for QueryPaginator including:
+- Page retrieval
+- Sequential reads from the result stream
+- OFFSET fallback for page jumps
+"""
+
+import pandas as pd
+import pytest
+
+from localsql_explorer.data_pagination import PageLoadCancelled, QueryPaginator, estimate_dataframe_bytes
+from localsql_explorer.database import DatabaseManager
+
+
+@pytest.fixture
+def paginator(db_manager: DatabaseManager):
+    """Provide a paginator over a 2,500 row query."""
+    paginator = QueryPaginator(db_manager.connection, "SELECT range AS n FROM range(2500)")
+    try:
+        yield paginator
+    finally:
+        paginator.close()
+
+
+class TestQueryPaginator:
+    """Test suite for QueryPaginator class."""
+
+    def test_sequential_pages(self, paginator: QueryPaginator):
+        """Test paging forward reads consecutive rows without OFFSET scans."""
+        for page_number in range(3):
+            data, page_info = paginator.get_page(page_number, 1000)
+
+            assert data['n'].iloc[0] == page_number * 1000
+            assert page_info.offset_scan is False
+
+        assert len(data) == 500
+        assert paginator.total_rows == 2500
+
+    def test_page_jump_uses_offset(self, paginator: QueryPaginator):
+        """Test jumping to a non-adjacent page falls back to OFFSET."""
+        paginator.get_page(0, 1000)
+
+        data, page_info = paginator.get_page(2, 1000)
+
+        assert data['n'].tolist() == list(range(2000, 2500))
+        assert page_info.offset_scan is True
+
+    def test_page_size_change_bypasses_cache(self, paginator: QueryPaginator):
+        """Test pages cached at one page size are not served for another."""
+        paginator.get_page(0, 1000)
+
+        data, page_info = paginator.get_page(0, 500)
+
+        assert len(data) == 500
+        assert page_info.total_pages == 5
+
+    def test_cancelled_page_load(self, paginator: QueryPaginator):
+        """Test a progress callback can abandon a page load without caching it."""
+        def cancel(message, progress):
+            raise PageLoadCancelled()
+
+        with pytest.raises(PageLoadCancelled):
+            paginator.get_page(2, 1000, cancel)
+        assert 2 not in paginator.page_cache
+
+        data, page_info = paginator.get_page(2, 1000)
+        assert data['n'].tolist() == list(range(2000, 2500))
+
+    def test_pages_arrow_strings(self, db_manager: DatabaseManager):
+        """Test text columns of streamed and OFFSET pages come back Arrow-backed."""
+        paginator = QueryPaginator(db_manager.connection, "SELECT 'a' || range AS s FROM range(2500)")
+        try:
+            for page_number in (0, 2):
+                data, _ = paginator.get_page(page_number, 1000)
+                assert isinstance(data['s'].dtype, pd.StringDtype)
+                assert data['s'].iloc[0] == f"a{page_number * 1000}"
+        finally:
+            paginator.close()
+
+    def test_connection_local_view(self, db_manager: DatabaseManager):
+        """Test pages of a DataFrame registered on the main connection load via OFFSET."""
+        db_manager.connection.register("local_view", pd.DataFrame({'n': range(2500)}))
+        paginator = QueryPaginator(db_manager.connection, "SELECT * FROM local_view")
+
+        for page_number in range(3):
+            data, page_info = paginator.get_page(page_number, 1000)
+            assert data['n'].iloc[0] == page_number * 1000
+
+    def test_prefetched_rows_and_stream(self, db_manager: DatabaseManager):
+        """Test pages spanning prefetched rows continue from the open stream."""
+        result, paginator = db_manager.execute_query_adaptive("SELECT range AS n FROM range(30000)", 10000)
+        prefetched_rows = len(paginator.prefetched)
+        assert paginator.execution_time == result.execution_time
+
+        try:
+            data, page_info = paginator.get_page(1, prefetched_rows - 100)
+
+            assert data['n'].iloc[0] == prefetched_rows - 100
+            assert data['n'].is_monotonic_increasing
+            assert page_info.offset_scan is False
+        finally:
+            paginator.close()
+
+    def test_count_uses_session_state(self, db_manager: DatabaseManager):
+        """Test a result that depends on a session variable is counted in that session."""
+        db_manager.execute_query("SET VARIABLE lim = 3000")
+        result, paginator = db_manager.execute_query_adaptive(
+            "SELECT range AS n FROM range(5000) WHERE n < getvariable('lim')", 100
+        )
+
+        try:
+            assert paginator.get_exact_total_rows() == 3000
+            data, page_info = paginator.get_page(1, 100)
+            assert page_info.has_next is True
+        finally:
+            paginator.close()
+
+    def test_stream_keeps_session_state(self, db_manager: DatabaseManager):
+        """Test paging a session-dependent result reads on from the main connection."""
+        db_manager.execute_query("SET VARIABLE lim = 30000")
+        sql = "SELECT range AS n FROM range(50000) WHERE n < getvariable('lim')"
+        result, paginator = db_manager.execute_query_adaptive(sql, 100)
+        page_size = len(paginator.prefetched)
+
+        try:
+            data, page_info = paginator.get_page(1, page_size)
+            assert data['n'].iloc[0] == page_size
+            assert page_info.offset_scan is False
+
+            # Another statement ends the result, so later pages use OFFSET in the same session
+            db_manager.execute_query("SELECT 1")
+            data, page_info = paginator.get_page(2, page_size)
+            assert data['n'].iloc[0] == 2 * page_size
+            assert page_info.offset_scan is True
+        finally:
+            paginator.close()
+
+
+def test_estimate_dataframe_bytes():
+    """Test sampled memory estimates stay close to the exact deep size."""
+    df = pd.DataFrame({'n': range(50000), 'label': [f"row-{i}" for i in range(50000)]})
+    exact = df.memory_usage(deep=True).sum()
+
+    assert estimate_dataframe_bytes(df.head(10)) == df.head(10).memory_usage(deep=True).sum()
+    assert abs(estimate_dataframe_bytes(df) - exact) / exact < 0.05
@@ -9,6 +9,9 @@ Tests for DatabaseManager class including:
 - Persistence operations
 """
 
+import threading
+from datetime import date
+
 import pytest
 import pandas as pd
 from pathlib import Path
@@ -67,6 +70,102 @@ class TestDatabaseManager:
         with pytest.raises(ValueError, match="already exists"):
             db_manager.register_table(table_name, sample_dataframe)
     
+    def test_register_table_object_columns(self, db_manager: DatabaseManager):
+        """Test object columns, including ones Arrow cannot type, become typed tables."""
+        dataframe = pd.DataFrame({
+            'day': pd.Series([date(2024, 1, 1), date(2024, 1, 2)], dtype=object),
+            'label': pd.Series(['a', None], dtype=object),
+        })
+        db_manager.register_table("typed", dataframe)
+        db_manager.register_table("mixed", pd.DataFrame({'value': [1, 'two']}))
+
+        types = dict(db_manager.connection.execute("SELECT column_name, column_type FROM (DESCRIBE typed)").fetchall())
+        assert types == {'day': 'DATE', 'label': 'VARCHAR'}
+        assert db_manager.execute_query("SELECT COUNT(*) AS n FROM mixed").data['n'].iloc[0] == 2
+
+    def test_register_tables(self, db_manager: DatabaseManager, sample_dataframe: pd.DataFrame):
+        """Test registering several tables in one call."""
+        registered = db_manager.register_tables([
+            ("first", sample_dataframe, "book.xlsx", "xlsx"),
+            ("second", sample_dataframe.head(1), "book.xlsx", "xlsx"),
+        ])
+        
+        assert [metadata.name for metadata in registered] == ["first", "second"]
+        assert registered[1].row_count == 1
+        assert db_manager.execute_query("SELECT COUNT(*) AS n FROM second").data['n'].iloc[0] == 1
+    
+    def test_unique_table_name(self, db_manager: DatabaseManager, sample_dataframe: pd.DataFrame):
+        """Test clashing names get one more than the highest numeric suffix."""
+        assert db_manager.unique_table_name("sales") == "sales"
+        
+        db_manager.register_table("sales", sample_dataframe)
+        db_manager.register_table("sales_3", sample_dataframe)
+        db_manager.register_table("sales_archive", sample_dataframe)
+        
+        assert db_manager.unique_table_name("sales") == "sales_4"
+        assert db_manager.unique_table_name("sales", {"sales_9"}) == "sales_10"
+        assert db_manager.unique_table_name("orders", {"orders"}) == "orders_1"
+    
+    @pytest.mark.parametrize("fixture_name,file_type,column_count", [
+        ("sample_csv_file", "csv", 5),
+        ("sample_parquet_file", "parquet", 4),
+    ])
+    def test_create_table_from_file(self, db_manager: DatabaseManager, request, fixture_name, file_type,
+                                    column_count):
+        """Test loading a file with DuckDB's reader and recording it afterwards."""
+        file_path = request.getfixturevalue(fixture_name)
+        
+        metadata = db_manager.create_table_from_file("loaded", file_path, file_type)
+        
+        assert metadata.row_count == 5
+        assert metadata.column_count == column_count
+        assert "loaded" not in db_manager.tables
+        
+        version = db_manager.tables_version
+        db_manager.add_tables([metadata])
+        assert db_manager.tables["loaded"] is metadata
+        assert db_manager.tables_version > version
+        assert db_manager.execute_query("SELECT COUNT(*) AS n FROM loaded").data['n'].iloc[0] == 5
+    
+    def test_create_table_from_files(self, db_manager: DatabaseManager, temp_dir):
+        """Test several files with differing columns are combined into one table."""
+        first = temp_dir / "day1.csv"
+        second = temp_dir / "day2.csv"
+        pd.DataFrame({'id': [1, 2], 'name': ['a', 'b']}).to_csv(first, index=False)
+        pd.DataFrame({'id': [3], 'amount': [1.5]}).to_csv(second, index=False)
+        
+        metadata = db_manager.create_table_from_files("combined", [first, second], "csv")
+        
+        assert metadata.row_count == 3
+        assert [column['name'] for column in metadata.columns] == ['id', 'name', 'amount', 'filename']
+        rows = db_manager.connection.execute("SELECT id, filename FROM combined ORDER BY id").fetchall()
+        assert [Path(filename).name for _, filename in rows] == ["day1.csv", "day1.csv", "day2.csv"]
+    
+    def test_create_table_from_file_unreadable(self, db_manager: DatabaseManager, temp_dir):
+        """Test a file DuckDB cannot read raises and leaves no table."""
+        bad_file = temp_dir / "bad.parquet"
+        bad_file.write_text("not parquet")
+        
+        with pytest.raises(Exception):
+            db_manager.create_table_from_file("bad", bad_file, "parquet")
+        with pytest.raises(ValueError):
+            db_manager.create_table_from_file("sheet", bad_file, "excel")
+        
+        assert db_manager.execute_query("SELECT * FROM bad").success is False
+    
+    def test_register_tables_rolls_back(self, db_manager: DatabaseManager, sample_dataframe: pd.DataFrame):
+        """Test a failing table leaves none of the batch behind."""
+        db_manager.connection.execute("CREATE TABLE blocker (x INTEGER)")
+        
+        with pytest.raises(Exception):
+            db_manager.register_tables([
+                ("first", sample_dataframe, None, None),
+                ("blocker", sample_dataframe, None, None),
+            ])
+        
+        assert "first" not in db_manager.tables
+        assert db_manager.execute_query("SELECT * FROM first").success is False
+    
     def test_execute_query_select_success(self, db_manager: DatabaseManager, sample_dataframe: pd.DataFrame):
         """Test successful SELECT query execution."""
         table_name = "test_table"
@@ -80,6 +179,20 @@ class TestDatabaseManager:
         assert result.row_count == len(sample_dataframe)
         assert result.execution_time > 0
     
+    def test_execute_query_arrow_strings(self, db_manager: DatabaseManager):
+        """Test text columns come back Arrow-backed rather than as Python objects."""
+        sql = "SELECT 'a' || range AS s, NULL::VARCHAR AS empty, range AS n FROM range(5)"
+
+        result = db_manager.execute_query(sql)
+        adaptive, _ = db_manager.execute_query_adaptive(sql, 100)
+
+        for data in (result.data, adaptive.data):
+            assert isinstance(data['s'].dtype, pd.StringDtype)
+            assert isinstance(data['empty'].dtype, pd.StringDtype)
+            assert data['s'].tolist() == [f"a{i}" for i in range(5)]
+            assert data['empty'].isna().all()
+            assert data['n'].dtype.kind == 'i'
+    
     def test_execute_query_with_filter(self, db_manager: DatabaseManager, sample_dataframe: pd.DataFrame):
         """Test SELECT query with WHERE clause."""
         table_name = "test_table"
@@ -92,6 +205,17 @@ class TestDatabaseManager:
         assert len(result.data) == 1
         assert result.data.iloc[0]['id'] == 1
     
+    def test_execute_query_return_arrow(self, db_manager: DatabaseManager, sample_dataframe: pd.DataFrame):
+        """Test SELECT results can be returned as an Arrow table."""
+        db_manager.register_table("test_table", sample_dataframe)
+
+        result = db_manager.execute_query("SELECT * FROM test_table", return_arrow=True)
+
+        assert result.success is True
+        assert result.data is None
+        assert result.row_count == len(sample_dataframe)
+        assert result.arrow_table.column_names == ['id', 'name', 'value']
+
     def test_execute_query_invalid_sql(self, db_manager: DatabaseManager):
         """Test query execution with invalid SQL."""
         result = db_manager.execute_query("INVALID SQL STATEMENT")
@@ -103,9 +227,181 @@ class TestDatabaseManager:
     def test_execute_query_nonexistent_table(self, db_manager: DatabaseManager):
         """Test query on non-existent table."""
         result = db_manager.execute_query("SELECT * FROM nonexistent_table")
-        
+
+        assert result.success is False
+        assert result.error is not None
+
+    def test_execute_query_adaptive_small_result(self, db_manager: DatabaseManager, sample_dataframe: pd.DataFrame):
+        """Test adaptive execution returns small results complete."""
+        db_manager.register_table("test_table", sample_dataframe)
+
+        result, paginator = db_manager.execute_query_adaptive("SELECT * FROM test_table", 10)
+
+        assert result.success is True
+        assert paginator is None
+        assert result.row_count == 3
+        assert list(result.data.columns) == ['id', 'name', 'value']
+
+    def test_execute_query_adaptive_large_result(self, db_manager: DatabaseManager):
+        """Test adaptive execution paginates results above the threshold."""
+        result, paginator = db_manager.execute_query_adaptive("SELECT range AS n FROM range(5000)", 100)
+
+        assert result.success is True
+        assert paginator is not None
+        assert len(paginator.prefetched) > 100
+
+        page, page_info = paginator.get_page(1, 50)
+        assert page['n'].tolist() == list(range(50, 100))
+        assert page_info.total_rows == 5000
+
+    @pytest.mark.parametrize("sql,paginated", [
+        ("SELECT range AS n FROM range(5000) LIMIT 50", False),
+        ("select range as n from range(5000) limit 50 offset 10;", False),
+        ("SELECT range AS n FROM range(5000) LIMIT 500", True),
+        ("SELECT * FROM (SELECT range AS n FROM range(5000) LIMIT 50) AS s, range(10)", True),
+    ])
+    def test_execute_query_adaptive_trailing_limit(self, db_manager: DatabaseManager, sql, paginated):
+        """Test a closing LIMIT within the threshold skips streaming."""
+        result, paginator = db_manager.execute_query_adaptive(sql, 100)
+
+        assert result.success is True
+        assert (paginator is not None) is paginated
+
+    def test_execute_query_adaptive_invalid_sql(self, db_manager: DatabaseManager):
+        """Test adaptive execution reports query errors."""
+        result, paginator = db_manager.execute_query_adaptive("SELECT * FROM nonexistent_table", 10)
+
         assert result.success is False
         assert result.error is not None
+        assert paginator is None
+
+    def test_execute_query_adaptive_connection_local_view(self, db_manager: DatabaseManager):
+        """Test adaptive execution sees DataFrames registered on the main connection."""
+        db_manager.connection.register("local_view", pd.DataFrame({'n': range(5000)}))
+
+        result, paginator = db_manager.execute_query_adaptive("SELECT * FROM local_view", 100)
+
+        assert result.success is True
+        page, page_info = paginator.get_page(2, 1000)
+        assert page['n'].tolist() == list(range(2000, 3000))
+
+    def test_execute_query_adaptive_keeps_session_state(self, db_manager: DatabaseManager):
+        """Test adaptive execution sees variables set by an earlier query."""
+        db_manager.execute_query_adaptive("SET VARIABLE v = 42", 100)
+
+        result, paginator = db_manager.execute_query_adaptive("SELECT getvariable('v') AS v", 100)
+
+        assert result.success is True
+        assert result.data['v'].tolist() == [42]
+
+    def test_session_is_shared(self, db_manager: DatabaseManager):
+        """Test session variables and schemas make queries use the main connection."""
+        assert db_manager.session_is_shared() is True
+        with db_manager.query_connection() as connection:
+            assert connection is not db_manager.connection
+
+        db_manager.execute_query("SET VARIABLE v = 1")
+        assert db_manager.session_is_shared() is False
+        with db_manager.query_connection() as connection:
+            assert connection is db_manager.connection
+
+        db_manager.execute_query("RESET VARIABLE v")
+        assert db_manager.session_is_shared() is True
+
+    def test_interrupt_running_query(self, db_manager: DatabaseManager):
+        """Test interrupt() stops a query running on another thread."""
+        results = []
+        thread = threading.Thread(target=lambda: results.append(
+            db_manager.execute_query_adaptive("SELECT COUNT(*) FROM range(100000000000)", 10)
+        ))
+        thread.start()
+        while thread.is_alive():
+            db_manager.interrupt()
+            thread.join(0.1)
+
+        result, paginator = results[0]
+        assert result.success is False
+        assert paginator is None
+
+    def test_estimate_rows(self, db_manager: DatabaseManager, sample_dataframe: pd.DataFrame):
+        """Test row estimates for plain single-table scans only."""
+        db_manager.register_table("test_table", sample_dataframe)
+
+        assert db_manager.estimate_rows("SELECT * FROM test_table") == 3
+        assert db_manager.estimate_rows("select id, name from test_table order by id;") == 3
+        assert db_manager.estimate_rows("SELECT * FROM test_table WHERE id > 1") is None
+        assert db_manager.estimate_rows("SELECT * FROM test_table LIMIT 2") is None
+        assert db_manager.estimate_rows("SELECT DISTINCT name FROM test_table") is None
+        assert db_manager.estimate_rows("SELECT * FROM test_table t JOIN other o ON t.id = o.id") is None
+
+    def test_query_paginator_plan_estimate(self, db_manager: DatabaseManager, sample_dataframe: pd.DataFrame):
+        """Test filtered queries start from a plan estimate until they are counted."""
+        db_manager.register_table("test_table", sample_dataframe)
+
+        assert db_manager.estimate_plan_rows("SELECT * FROM test_table WHERE id > 1;") is not None
+        assert db_manager.estimate_plan_rows("SELECT * FROM missing_table") is None
+
+        paginator = db_manager.create_query_paginator("SELECT * FROM test_table WHERE id > 1")
+        assert paginator.plan_estimate is True
+        assert paginator.is_total_estimated is True
+        assert paginator.get_exact_total_rows() == 2
+        assert paginator.is_total_estimated is False
+        assert paginator.get_total_rows() == 2
+
+    def test_query_paginator_without_estimate(self, db_manager: DatabaseManager, monkeypatch):
+        """Test a paginated result with no estimate shows the rows read so far instead of counting."""
+        monkeypatch.setattr(db_manager, "estimate_plan_rows", lambda sql: None)
+        result, paginator = db_manager.execute_query_adaptive("SELECT range AS n FROM range(30000)", 100)
+
+        try:
+            assert paginator.total_rows is None
+            assert paginator.get_total_rows() == len(paginator.prefetched)
+            assert paginator.plan_estimate is True
+            assert paginator.get_exact_total_rows() == 30000
+        finally:
+            paginator.close()
+
+    def test_get_schema_columns(self, db_manager: DatabaseManager, sample_dataframe: pd.DataFrame):
+        """Test column names for all tables come back in ordinal order."""
+        db_manager.register_table("table1", sample_dataframe)
+        db_manager.register_table("table2", sample_dataframe[['value', 'id']])
+
+        assert db_manager.get_schema_columns() == {
+            "table1": ['id', 'name', 'value'],
+            "table2": ['value', 'id'],
+        }
+
+    def test_tables_version_tracks_changes(self, db_manager: DatabaseManager, sample_dataframe: pd.DataFrame):
+        """Test the tables version moves on changes but not on reads."""
+        db_manager.register_table("test_table", sample_dataframe)
+        version = db_manager.tables_version
+        
+        db_manager.execute_query("SELECT * FROM test_table")
+        db_manager.execute_query_adaptive("SELECT * FROM test_table", 10)
+        assert db_manager.tables_version == version
+        
+        db_manager.execute_query("UPDATE test_table SET value = 0")
+        assert db_manager.tables_version > version
+        
+        version = db_manager.tables_version
+        db_manager.execute_query("SELECT 1; DELETE FROM test_table")
+        assert db_manager.tables_version > version
+    
+    def test_get_table_dataframe_leaves_open_result(self, db_manager: DatabaseManager,
+                                                     sample_dataframe: pd.DataFrame):
+        """Test reading a whole table does not end a result being paged on the main connection."""
+        db_manager.register_table("test_table", sample_dataframe)
+        result, paginator = db_manager.execute_query_adaptive("SELECT range AS n FROM range(30000)", 100)
+        page_size = len(paginator.prefetched)
+        
+        try:
+            pd.testing.assert_frame_equal(db_manager.get_table_dataframe("test_table"), sample_dataframe,
+                                          check_dtype=False)
+            data, page_info = paginator.get_page(1, page_size)
+            assert data['n'].iloc[0] == page_size
+            assert page_info.offset_scan is False
+        finally:
+            paginator.close()
     
     def test_get_table_metadata(self, db_manager: DatabaseManager, sample_dataframe: pd.DataFrame):
         """Test getting table metadata."""
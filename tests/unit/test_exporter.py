@@ -30,7 +30,31 @@ class TestResultExporter:
         assert output_file.exists()
         exported_df = pd.read_csv(output_file)
         pd.testing.assert_frame_equal(sample_dataframe, exported_df)
-    
+
+    def test_export_to_csv_value_format(self, result_exporter: ResultExporter, db_manager, temp_dir: Path):
+        """Test the in-memory CSV export writes the same text as a whole-result export."""
+        output_file = temp_dir / "formats.csv"
+        df = pd.DataFrame({
+            'ts': [pd.Timestamp('2024-01-01 00:00:00'), pd.Timestamp('2024-01-02 03:04:05.120000')],
+            'flag': [True, False],
+            'amount': [3.0, 2.5],
+            'text': ['a,b', 'c'],
+        })
+
+        result = result_exporter.export_to_csv(df, output_file)
+
+        assert result.success is True
+        assert output_file.read_text().splitlines() == [
+            'ts,flag,amount,text',
+            '2024-01-01 00:00:00,true,3.0,"a,b"',
+            '2024-01-02 03:04:05.12,false,2.5,c',
+        ]
+
+        db_manager.register_table("formats", df)
+        query_file = temp_dir / "formats_query.csv"
+        assert result_exporter.export_query(db_manager.connection, "SELECT * FROM formats", query_file).success
+        assert query_file.read_text() == output_file.read_text()
+
     def test_export_to_excel_success(self, result_exporter: ResultExporter, sample_dataframe: pd.DataFrame, temp_dir: Path):
         """Test successful Excel export."""
         output_file = temp_dir / "test_export.xlsx"
@@ -59,6 +83,104 @@ class TestResultExporter:
         exported_df = pd.read_parquet(output_file)
         pd.testing.assert_frame_equal(sample_dataframe, exported_df)
 
+    @pytest.mark.parametrize("file_name", ["mixed.csv", "mixed.xlsx"])
+    def test_export_mixed_type_column(self, result_exporter: ResultExporter, temp_dir: Path, file_name):
+        """Test columns Arrow cannot type still export through pandas."""
+        dataframe = pd.DataFrame({'mixed': [1, 'two', 3.5]})
+
+        result = result_exporter.export_result(dataframe, temp_dir / file_name)
+
+        assert result.success is True
+        assert result.row_count == 3
+
+    def test_export_reuses_arrow_conversion(self, result_exporter: ResultExporter, sample_dataframe: pd.DataFrame,
+                                            temp_dir: Path):
+        """Test exporting one DataFrame to several files converts it to Arrow once."""
+        assert result_exporter.export_result(sample_dataframe, temp_dir / "first.csv").success is True
+        table = result_exporter._to_arrow(sample_dataframe)
+
+        assert result_exporter.export_result(sample_dataframe, temp_dir / "second.parquet").success is True
+        assert result_exporter._to_arrow(sample_dataframe) is table
+        assert result_exporter._to_arrow(sample_dataframe.copy()) is not table
+        pd.testing.assert_frame_equal(sample_dataframe, pd.read_parquet(temp_dir / "second.parquet"))
+
+    def test_arrow_conversion_released_with_dataframe(self, result_exporter: ResultExporter, temp_dir: Path):
+        """Test the cached Arrow conversion does not outlive its DataFrame."""
+        dataframe = pd.DataFrame({'n': range(10)})
+        assert result_exporter.export_result(dataframe, temp_dir / "released.csv").success is True
+        assert result_exporter._arrow_cache is not None
+
+        del dataframe
+        assert result_exporter._arrow_cache is None
+
+    @pytest.mark.parametrize("file_name,reader", [
+        ("query_export.csv", pd.read_csv),
+        ("query_export.xlsx", pd.read_excel),
+        ("query_export.parquet", pd.read_parquet),
+    ])
+    def test_export_query_streams_all_rows(self, result_exporter: ResultExporter, db_manager,
+                                           sample_dataframe: pd.DataFrame, temp_dir: Path,
+                                           file_name, reader):
+        """Test streaming a query result to each supported format."""
+        db_manager.register_table("test_table", sample_dataframe)
+        output_file = temp_dir / file_name
+        progress = []
+
+        result = result_exporter.export_query(
+            db_manager.connection,
+            "SELECT * FROM test_table ORDER BY id",
+            output_file,
+            progress_callback=progress.append
+        )
+
+        assert result.success is True
+        assert result.row_count == len(sample_dataframe)
+        assert progress[-1] == len(sample_dataframe)
+        pd.testing.assert_frame_equal(sample_dataframe, reader(output_file))
+
+    def test_export_query_connection_local_view(self, result_exporter: ResultExporter, db_manager, temp_dir: Path):
+        """Test streaming export of a DataFrame registered on the main connection."""
+        db_manager.connection.register("local_view", pd.DataFrame({'n': range(10)}))
+        output_file = temp_dir / "local_view.csv"
+
+        result = result_exporter.export_query(db_manager.connection, "SELECT * FROM local_view", output_file)
+
+        assert result.success is True
+        assert result.row_count == 10
+
+    @pytest.mark.parametrize("sql", ["SELECT 1 AS x; ", "SELECT 1 AS x -- trailing comment", "SHOW TABLES"])
+    def test_export_query_statement_forms(self, result_exporter: ResultExporter, db_manager, temp_dir: Path, sql):
+        """Test statements with trailing text, or that COPY cannot wrap, still export."""
+        output_file = temp_dir / "statement.csv"
+
+        result = result_exporter.export_query(db_manager.connection, sql, output_file)
+
+        assert result.success is True
+        assert output_file.exists()
+
+    def test_export_query_session_state(self, result_exporter: ResultExporter, db_manager, temp_dir: Path):
+        """Test a query that depends on a session variable exports every row."""
+        db_manager.execute_query("SET VARIABLE lim = 50")
+        output_file = temp_dir / "session.xlsx"
+
+        with db_manager.query_connection() as connection:
+            result = result_exporter.export_query(
+                connection, "SELECT range AS n FROM range(100) WHERE n < getvariable('lim')", output_file
+            )
+
+        assert result.success is True
+        assert result.row_count == 50
+
+    def test_export_query_respects_overwrite(self, result_exporter: ResultExporter, db_manager, temp_dir: Path):
+        """Test streaming export refuses to replace an existing file by default."""
+        output_file = temp_dir / "existing.csv"
+        output_file.write_text("keep me")
+
+        result = result_exporter.export_query(db_manager.connection, "SELECT 1 AS x", output_file)
+
+        assert result.success is False
+        assert output_file.read_text() == "keep me"
+
 
 class TestExportOptions:
     """Test suite for ExportOptions model."""
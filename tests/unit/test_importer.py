@@ -146,6 +146,18 @@ class TestFileImporter:
         assert result.success is True
         assert result.file_type == "excel"
     
+    def test_detect_excel_sheets(self, file_importer: FileImporter, sample_excel_file: Path):
+        """Test sheet detection reads sizes, headers and a preview."""
+        sheet_infos = file_importer.detect_excel_sheets(sample_excel_file)
+        
+        assert len(sheet_infos) == 1
+        sheet_info = sheet_infos[0]
+        assert sheet_info.row_count == 3
+        assert sheet_info.column_count == 4
+        assert sheet_info.columns == ['product', 'price', 'quantity', 'category']
+        assert sheet_info.sample_data['product'].tolist() == ['Widget A', 'Widget B', 'Widget C']
+        assert sheet_info.is_empty is False
+    
     def test_import_file_auto_detect_parquet(self, file_importer: FileImporter, sample_parquet_file: Path):
         """Test automatic file type detection for Parquet."""
         result = file_importer.import_file(sample_parquet_file)
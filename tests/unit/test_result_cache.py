@@ -0,0 +1,71 @@
+"""Unit tests for the query result cache."""
+
+import pandas as pd
+import pytest
+
+from localsql_explorer.database import QueryResult
+from localsql_explorer.result_cache import QueryResultCache
+
+
+def make_result(rows: int = 3) -> QueryResult:
+    """Build a successful query result with the given number of rows."""
+    data = pd.DataFrame({'n': range(rows)})
+    return QueryResult(success=True, data=data, row_count=rows)
+
+
+class TestQueryResultCache:
+    """Test suite for QueryResultCache class."""
+
+    def test_hit_ignores_formatting(self):
+        """Test whitespace, comments and keyword case share an entry."""
+        cache = QueryResultCache()
+        result = make_result()
+
+        cache.put("SELECT * FROM t WHERE name = 'A'", 1, result)
+
+        assert cache.get("select *\n  from t -- rows\n where name = 'A';", 1) is result
+        assert cache.get("SELECT * FROM t WHERE name = 'a'", 1) is None
+
+    def test_tables_version_invalidates(self):
+        """Test results are only served for the tables version they ran against."""
+        cache = QueryResultCache()
+        cache.put("SELECT * FROM t", 1, make_result())
+
+        assert cache.get("SELECT * FROM t", 2) is None
+
+        cache.put("SELECT * FROM u", 2, make_result())
+        assert len(cache) == 1
+
+    @pytest.mark.parametrize("sql", [
+        "INSERT INTO t VALUES (1)",
+        "SELECT random()",
+        "SELECT now()",
+        "SELECT * FROM read_csv('data.csv')",
+        "SELECT * FROM 'data.parquet'",
+        "SELECT 1; DROP TABLE t",
+    ])
+    def test_uncacheable_queries(self, sql):
+        """Test writes, volatile functions and direct file reads are not cached."""
+        cache = QueryResultCache()
+        cache.put(sql, 1, make_result())
+
+        assert cache.get(sql, 1) is None
+
+    def test_evicts_least_recently_used(self):
+        """Test the oldest unused entry is evicted when the cache is full."""
+        cache = QueryResultCache(max_entries=2)
+        cache.put("SELECT 1", 1, make_result())
+        cache.put("SELECT 2", 1, make_result())
+        cache.get("SELECT 1", 1)
+
+        cache.put("SELECT 3", 1, make_result())
+
+        assert cache.get("SELECT 1", 1) is not None
+        assert cache.get("SELECT 2", 1) is None
+
+    def test_memory_limit(self):
+        """Test results larger than the memory budget are not kept."""
+        cache = QueryResultCache(max_memory_mb=0.01)
+        cache.put("SELECT 1", 1, make_result(100000))
+
+        assert len(cache) == 0
@@ -33,4 +33,97 @@ def test_decimal_preserves_scale():
     values = [get_display_value(model, i, 0) for i in range(len(df))]
 
     assert values[0] == "123.450"
-    assert values[1] == "0.3000"
\ No newline at end of file
+    assert values[1] == "0.3000"
+
+def test_formatting_follows_column_dtype():
+    df = pd.DataFrame({
+        "count": [1, 2],
+        "flag": [True, False],
+        "ratio": [0.5, float("nan")],
+        "label": ["a", None],
+        "nullable": pd.array([3, None], dtype="Int64"),
+    })
+    model = PandasTableModel(df)
+
+    rows = [[get_display_value(model, i, j) for j in range(len(df.columns))] for i in range(len(df))]
+
+    assert rows[0] == ["1", "True", "0.5", "a", "3"]
+    assert rows[1] == ["2", "False", "NULL", "NULL", "NULL"]
+
+
+def test_paginated_table_cells():
+    from PyQt6.QtCore import Qt
+    from localsql_explorer.ui.paginated_results import PaginatedTableWidget
+
+    df = pd.DataFrame({
+        "count": [2, 1],
+        "flag": [True, False],
+        "ratio": [0.000123456, float("nan")],
+        "amount": [Decimal("1.50"), None],
+        "label": ["b", "a"],
+    })
+    widget = PaginatedTableWidget()
+    widget.populate_table(df)
+    model = widget.table_view.model()
+
+    rows = [[get_display_value(model, i, j) for j in range(len(df.columns))] for i in range(len(df))]
+    assert rows[0] == ["2", "True", "0.000123456", "1.50", "b"]
+    assert rows[1] == ["1", "False", "", "", "a"]
+
+    right = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+    alignment = Qt.ItemDataRole.TextAlignmentRole
+    assert model.data(model.index(0, 0), alignment) == right
+    assert model.data(model.index(0, 3), alignment) == right
+    assert model.data(model.index(0, 1), alignment) != right
+    assert model.data(model.index(1, 2), Qt.ItemDataRole.FontRole).italic()
+    assert not model.flags(model.index(0, 0)) & Qt.ItemFlag.ItemIsEditable
+
+    model.sort(0, Qt.SortOrder.AscendingOrder)
+    assert [get_display_value(model, i, 4) for i in range(len(df))] == ["a", "b"]
+    assert get_display_value(model, 0, 2) == ""
+    assert model.row_texts(0) == ["1", "False", "", "", "a"]
+
+    model.set_dataframe(pd.DataFrame({"text": ["x" * 1000]}))
+    assert len(get_display_value(model)) == model.MAX_DISPLAY_CHARS
+    assert model.cell_text(0, 0) == "x" * 1000
+    widget.memory_timer.stop()
+
+
+def test_results_search_filters_rows():
+    from localsql_explorer.ui.results_view import ResultsTableView
+
+    view = ResultsTableView()
+    view.set_dataframe(pd.DataFrame({"name": ["Alpha", "beta", None], "code": [10, 20, 30]}))
+
+    view.search_input.setText("A")
+    assert view._filter_timer.isActive()
+    view.filter_results()
+    assert view.filtered_data["code"].tolist() == [10, 20]
+
+    view.case_sensitive_checkbox.setChecked(True)
+    view.filter_results()
+    assert view.filtered_data["code"].tolist() == [10]
+
+    view.search_input.setText("30")
+    view.filter_results()
+    assert view.filtered_data["code"].tolist() == [30]
+
+    view.column_combo.setCurrentIndex(view.column_combo.findData("name"))
+    view.filter_results()
+    assert view.filtered_data.empty
+
+
+def test_paginated_pages_keep_column_widths():
+    from localsql_explorer.ui.paginated_results import PaginatedTableWidget
+
+    widget = PaginatedTableWidget()
+    header = widget.table_view.horizontalHeader()
+    widget.populate_table(pd.DataFrame({"a": ["x"], "b": [1]}))
+    header.resizeSection(0, 250)
+
+    widget.populate_table(pd.DataFrame({"a": ["y" * 50], "b": [2]}))
+    assert header.sectionSize(0) == 250
+
+    widget.populate_table(pd.DataFrame({"c": ["y" * 500]}))
+    assert header.sectionSize(0) == 300
+    widget.memory_timer.stop()